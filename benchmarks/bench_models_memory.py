@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+Memory benchmark of the ArXiv metadata models, measuring the bytes retained per paper
+when parsing synthetic Kaggle snapshot entries. The "legacy" layout reproduces the
+former dict-backed models, rebuilt for every paper revision, as the baseline.
+
+Usage: python -m benchmarks.bench_models_memory [--papers N] [--authors N] [--versions N]
+"""
+
+import gc
+import tracemalloc
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+from typing import List
+
+import click
+
+from src.job.parsers import JSONMetadataParser
+
+from .corpus import build_json_entry
+
+
+@dataclass
+class LegacyAuthor:
+    name: str
+
+
+@dataclass
+class LegacyCategory:
+    name: str
+
+
+@dataclass
+class LegacyMetadata:
+    paper_id: str
+    paper_rev: int
+    paper_doi: str
+    paper_title: str
+    paper_description: str
+    paper_categories: List[LegacyCategory]
+    paper_authors: List[LegacyAuthor]
+    paper_links: list
+    paper_created_at: datetime
+    paper_updated_at: datetime
+
+
+def parse_legacy(parser: JSONMetadataParser, entry: dict) -> List[LegacyMetadata]:
+    """
+    Parses a Kaggle snapshot entry into the legacy models layout
+    :param parser: JSON metadata parser
+    :param entry: Kaggle snapshot entry
+    :return: legacy metadata objects
+    """
+
+    papers = []
+
+    for paper in parser.parse_body(entry):
+        papers.append(
+            LegacyMetadata(
+                paper_id=paper.paper_id,
+                paper_rev=paper.paper_rev,
+                paper_doi=paper.paper_doi,
+                paper_title=paper.paper_title,
+                paper_description=paper.paper_description,
+                paper_categories=[LegacyCategory(c.name) for c in paper.paper_categories],
+                paper_authors=[LegacyAuthor(a.name) for a in paper.paper_authors],
+                paper_links=[],
+                paper_created_at=paper.paper_created_at,
+                paper_updated_at=paper.paper_updated_at,
+            )
+        )
+
+    return papers
+
+
+def measure(parse: Callable, entries: List[dict]) -> float:
+    """
+    Measures the memory retained by the parsed metadata objects
+    :param parse: function parsing an entry into a list of objects
+    :param entries: Kaggle snapshot entries
+    :return: retained bytes per paper
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    papers = [parse(entry) for entry in entries]
+
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del papers
+    return (after - before) / len(entries)
+
+
+@click.command()
+@click.option("--papers", default=2000, type=click.IntRange(min=1), help="Number of papers")
+@click.option("--authors", default=30, type=click.IntRange(min=1), help="Authors per paper")
+@click.option("--versions", default=3, type=click.IntRange(min=1), help="Revisions per paper")
+def main(papers: int, authors: int, versions: int):
+    """Compares the bytes per paper of the legacy and current metadata models"""
+
+    parser = JSONMetadataParser()
+    entries = [build_json_entry(index, authors, versions) for index in range(papers)]
+
+    legacy = measure(lambda entry: parse_legacy(parser, entry), entries)
+    current = measure(parser.parse_body, entries)
+
+    click.echo(f"Papers: {papers}, authors: {authors}, versions: {versions}")
+    click.echo(f"Legacy models:  {legacy:>12,.0f} bytes/paper")
+    click.echo(f"Current models: {current:>12,.0f} bytes/paper ({current / legacy:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark of the date normalization functions, on ArXiv Atom (ISO-8601) and
+Kaggle snapshot (RFC-2822) dates. Each function runs over a sample where every date
+appears a given number of times, so both the memoized and the cold paths are measured.
+
+Usage: python -m benchmarks.bench_parsers_dates [--dates N] [--repeats N]
+"""
+
+import random
+import timeit
+
+from datetime import datetime
+from datetime import timedelta
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import click
+
+from src.job.parsers.dates import parse_iso_date
+from src.job.parsers.dates import parse_rfc2822_date
+
+from .corpus import format_kaggle_date
+from .legacy import legacy_parse_iso_date
+from .legacy import legacy_parse_rfc2822_date
+
+
+def build_dates(count: int, duplicates: int) -> List[datetime]:
+    """
+    Builds a shuffled sample of random dates
+    :param count: number of distinct dates
+    :param duplicates: number of times each date appears
+    :return: list of dates
+    """
+
+    rand = random.Random(0)
+    start = datetime(2007, 4, 1)
+
+    dates = [start + timedelta(seconds=rand.randrange(15 * 365 * 86400)) for _ in range(count)]
+    dates = dates * duplicates
+    rand.shuffle(dates)
+
+    return dates
+
+
+def measure(func: Callable, values: List[str], clear: Callable | None) -> float:
+    """
+    Measures the throughput of a date parsing function
+    :param func: date parsing function
+    :param values: date strings to parse
+    :param clear: function clearing the memoized dates before each run (optional)
+    :return: parsed dates per second
+    """
+
+    def run():
+        if clear is not None:
+            clear()
+        for value in values:
+            func(value)
+
+    return len(values) / min(timeit.repeat(run, number=1, repeat=3))
+
+
+@click.command()
+@click.option("--dates", default=20000, type=click.IntRange(min=1), help="Distinct dates")
+@click.option("--duplicates", default=2, type=click.IntRange(min=1), help="Times per date")
+def main(dates: int, duplicates: int):
+    """Compares the former and current date normalization functions"""
+
+    sample = build_dates(dates, duplicates)
+    formats = {
+        "atom": [date.strftime("%Y-%m-%dT%H:%M:%SZ") for date in sample],
+        "kaggle": [format_kaggle_date(date) for date in sample],
+    }
+
+    cases: List[Tuple[str, str, Callable, Callable | None]] = [
+        ("atom", "legacy", legacy_parse_iso_date, None),
+        ("atom", "direct", parse_iso_date.__wrapped__, None),
+        ("atom", "memoized", parse_iso_date, parse_iso_date.cache_clear),
+        ("kaggle", "legacy", legacy_parse_rfc2822_date, None),
+        ("kaggle", "direct", parse_rfc2822_date.__wrapped__, None),
+        ("kaggle", "memoized", parse_rfc2822_date, parse_rfc2822_date.cache_clear),
+    ]
+
+    baselines: Dict[str, float] = {}
+
+    for fmt, name, func, clear in cases:
+        rate = measure(func, formats[fmt], clear)
+        baseline = baselines.setdefault(fmt, rate)
+        click.echo(f"{fmt:<8} {name:<10} {rate:>12,.0f} dates/s ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
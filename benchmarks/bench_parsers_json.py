@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""
+Throughput benchmark of the Kaggle snapshot entries parsing, comparing the former
+per-entry path, the current per-entry path and the bulk parse_many path.
+
+Usage: python -m benchmarks.bench_parsers_json [--papers N] [--batch-size N]
+"""
+
+import logging
+import time
+
+from datetime import datetime
+from typing import Callable
+from typing import List
+
+import click
+
+from src.job.parsers import JSONMetadataParser
+from src.job.parsers.dates import parse_rfc2822_date
+
+from .corpus import build_json_entry
+from .legacy import legacy_parse_rfc2822_date
+
+
+class LegacyJSONMetadataParser(JSONMetadataParser):
+    """JSON metadata parser going through the former strptime and pytz dates path"""
+
+    @staticmethod
+    def _extract_date(date: str) -> datetime:
+        return legacy_parse_rfc2822_date(date)
+
+
+def measure(parse: Callable, entries: List[dict], repeats: int) -> float:
+    """
+    Measures the best parsing throughput out of several repetitions
+    :param parse: function parsing all the entries
+    :param entries: Kaggle snapshot entries
+    :param repeats: number of repetitions
+    :return: parsed entries per second
+    """
+
+    best = float("inf")
+
+    for _ in range(repeats):
+        parse_rfc2822_date.cache_clear()
+        start = time.perf_counter()
+        parse(entries)
+        best = min(best, time.perf_counter() - start)
+
+    return len(entries) / best
+
+
+@click.command()
+@click.option("--papers", default=20000, type=click.IntRange(min=1), help="Number of papers")
+@click.option("--batch-size", default=100, type=click.IntRange(min=1), help="Bulk batch size")
+@click.option("--repeats", default=3, type=click.IntRange(min=1), help="Repetitions")
+def main(papers: int, batch_size: int, repeats: int):
+    """Compares the per-entry and bulk parsing paths of the JSON metadata parser"""
+
+    # Silence the missing DOI messages
+    logging.disable(logging.INFO)
+
+    entries = [build_json_entry(index, authors=5, versions=2) for index in range(papers)]
+
+    def parse_single(parser: JSONMetadataParser) -> Callable:
+        return lambda items: [parser.parse_body(item) for item in items]
+
+    def parse_bulk(parser: JSONMetadataParser) -> Callable:
+        return lambda items: [
+            parser.parse_many(items[i : i + batch_size]) for i in range(0, len(items), batch_size)
+        ]
+
+    results = {
+        "per-entry (legacy)": measure(parse_single(LegacyJSONMetadataParser()), entries, repeats),
+        "per-entry": measure(parse_single(JSONMetadataParser()), entries, repeats),
+        "parse_many": measure(parse_bulk(JSONMetadataParser()), entries, repeats),
+    }
+
+    baseline = results["per-entry (legacy)"]
+
+    for name, rate in results.items():
+        click.echo(f"{name:<20} {rate:>10,.0f} entries/s ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
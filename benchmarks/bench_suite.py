@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark suite measuring the job building blocks and routines over a synthetic corpus:
+a nested tree of small PDF files, a Kaggle-style JSON-lines snapshot and multi-entry Atom
+feeds, generated on a temporary folder. The remote services are replaced by in-process stubs.
+Results are stored as JSON, and can be compared against those of a previous run.
+
+Usage: python -m benchmarks.bench_suite [--papers N] [--output FILE] [--baseline FILE]
+"""
+
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import click
+
+# The routines module imports the job package as a top-level package
+sys.path.insert(0, str(Path(__file__).parents[1].joinpath("src")))
+
+from job.files import FileSystemIterator  # noqa: E402
+from job.handlers import StreamingPDFFileHandler  # noqa: E402
+from job.input import ArxivMetadataSource  # noqa: E402
+from job.input import PDFCorpusSource  # noqa: E402
+from job.output import DialectMapOperator  # noqa: E402
+from job.parsers import AtomMetadataParser  # noqa: E402
+from job.parsers import FeedMetadataParser  # noqa: E402
+from job.parsers import JSONMetadataParser  # noqa: E402
+from routines import LocalTextRoutine  # noqa: E402
+from routines import MetadataRoutine  # noqa: E402
+from routines import SnapshotBackfillRoutine  # noqa: E402
+
+from .corpus import build_atom_feed  # noqa: E402
+from .corpus import build_json_entry  # noqa: E402
+from .corpus import write_json_snapshot  # noqa: E402
+from .corpus import write_pdf_tree  # noqa: E402
+from .stubs import StubArxivAPIHandler  # noqa: E402
+from .stubs import StubDialectMapAPIHandler  # noqa: E402
+
+
+class Corpus:
+    """Object containing the synthetic corpus the benchmarks run on"""
+
+    def __init__(self, root_path: Path, papers: int, batch_size: int):
+        """
+        Generates the synthetic corpus
+        :param root_path: folder to generate the corpus files in
+        :param papers: number of synthetic papers
+        :param batch_size: papers per Atom feed
+        """
+
+        self.root_path = root_path
+        self.batch_size = batch_size
+        self.entries = [build_json_entry(index, authors=5, versions=2) for index in range(papers)]
+        self.feeds = [
+            build_atom_feed(self.entries[i : i + batch_size]) for i in range(0, papers, batch_size)
+        ]
+
+        self.pdf_path = root_path.joinpath("corpus")
+        self.pdf_bytes = write_pdf_tree(self.pdf_path, self.entries)
+        self.snapshot_path = root_path.joinpath("snapshot.json")
+        self.snapshot_bytes = write_json_snapshot(self.snapshot_path, self.entries)
+        self.feed_bytes = sum(len(feed.encode()) for feed in self.feeds)
+
+
+def measure(run: Callable[[], int], size: int, repeats: int) -> Dict[str, float]:
+    """
+    Measures the best throughput of a benchmark function out of several repetitions
+    :param run: function running the benchmark, returning the number of processed items
+    :param size: bytes processed by each run
+    :param repeats: number of repetitions
+    :return: dictionary of benchmark results
+    """
+
+    best = float("inf")
+    items = 0
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        items = run()
+        best = min(best, time.perf_counter() - start)
+
+    return {
+        "items": items,
+        "bytes": size,
+        "seconds": best,
+        "items_per_sec": items / best,
+        "bytes_per_sec": size / best,
+    }
+
+
+def bench_walk(corpus: Corpus, options: dict) -> Dict[str, float]:
+    """Measures the PDF tree traversal throughput"""
+
+    def run() -> int:
+        iterator = FileSystemIterator(corpus.pdf_path, ".pdf", workers=options["walk_workers"])
+        return sum(1 for _ in iterator.iter_entries())
+
+    return measure(run, corpus.pdf_bytes, options["repeats"])
+
+
+def bench_parse_feed(corpus: Corpus, options: dict) -> Dict[str, float]:
+    """Measures the feedparser based Atom feed parsing throughput"""
+
+    parser = FeedMetadataParser()
+
+    def run() -> int:
+        return sum(len(parser.parse_body(feed)) for feed in corpus.feeds)
+
+    return measure(run, corpus.feed_bytes, options["repeats"])
+
+
+def bench_parse_atom(corpus: Corpus, options: dict) -> Dict[str, float]:
+    """Measures the iterparse based Atom feed parsing throughput"""
+
+    parser = AtomMetadataParser()
+
+    def run() -> int:
+        return sum(len(parser.parse_body(feed)) for feed in corpus.feeds)
+
+    return measure(run, corpus.feed_bytes, options["repeats"])
+
+
+def bench_parse_json(corpus: Corpus, options: dict) -> Dict[str, float]:
+    """Measures the Kaggle snapshot entries parsing throughput"""
+
+    parser = JSONMetadataParser()
+    size = corpus.batch_size
+
+    def run() -> int:
+        return sum(
+            len(parser.parse_many(corpus.entries[i : i + size]))
+            for i in range(0, len(corpus.entries), size)
+        )
+
+    return measure(run, corpus.snapshot_bytes, options["repeats"])
+
+
+def bench_serialize(corpus: Corpus, options: dict) -> Dict[str, float]:
+    """Measures the paper metadata records serialization throughput"""
+
+    papers = JSONMetadataParser().parse_many(corpus.entries)
+
+    def run() -> int:
+        return sum(1 for paper in papers if paper.paper_metadata)
+
+    return measure(run, 0, options["repeats"])
+
+
+def bench_text_routine(corpus: Corpus, options: dict) -> Dict[str, float]:
+    """Measures the end-to-end text extraction routine throughput"""
+
+    def run() -> int:
+        with tempfile.TemporaryDirectory() as output_path:
+            routine = LocalTextRoutine(
+                FileSystemIterator(corpus.pdf_path, ".pdf", workers=options["walk_workers"]),
+                PDFCorpusSource(StreamingPDFFileHandler()),
+                workers=options["workers"],
+            )
+            routine.run(output_path)
+            return sum(1 for path in Path(output_path).rglob("*") if path.is_file())
+
+    return measure(run, corpus.pdf_bytes, options["repeats"])
+
+
+def bench_metadata_routine(corpus: Corpus, options: dict) -> Dict[str, float]:
+    """Measures the end-to-end metadata routine throughput, against stub APIs"""
+
+    def run() -> int:
+        api_handler = StubDialectMapAPIHandler(options["api_latency"])
+        api_ctl = DialectMapOperator(api_handler, max_workers=options["api_concurrency"])
+        arxiv_handler = StubArxivAPIHandler(corpus.entries, options["api_latency"])
+
+        routine = MetadataRoutine(
+            FileSystemIterator(corpus.pdf_path, ".pdf", workers=options["walk_workers"]),
+            api_ctl,
+            batch_size=corpus.batch_size,
+            fetch_workers=options["workers"],
+        )
+        routine.sources.append(ArxivMetadataSource(arxiv_handler, AtomMetadataParser()))
+        routine.run()
+        api_ctl.close()
+
+        return api_handler.records
+
+    return measure(run, corpus.feed_bytes, options["repeats"])
+
+
+def bench_backfill_routine(corpus: Corpus, options: dict) -> Dict[str, float]:
+    """Measures the end-to-end snapshot backfill routine throughput, against a stub API"""
+
+    def run() -> int:
+        api_handler = StubDialectMapAPIHandler(options["api_latency"])
+        api_ctl = DialectMapOperator(api_handler, max_workers=options["api_concurrency"])
+
+        routine = SnapshotBackfillRoutine(
+            str(corpus.snapshot_path),
+            api_ctl,
+            workers=options["workers"],
+            chunk_size=max(corpus.snapshot_bytes // (options["workers"] * 4), 1),
+        )
+        routine.run()
+        api_ctl.close()
+
+        return api_handler.records
+
+    return measure(run, corpus.snapshot_bytes, options["repeats"])
+
+
+BENCHMARKS = {
+    "walk": bench_walk,
+    "parse_feed": bench_parse_feed,
+    "parse_atom": bench_parse_atom,
+    "parse_json": bench_parse_json,
+    "serialize": bench_serialize,
+    "text_routine": bench_text_routine,
+    "metadata_routine": bench_metadata_routine,
+    "backfill_routine": bench_backfill_routine,
+}
+
+
+def compare(results: Dict[str, dict], baseline_path: str, tolerance: float) -> List[str]:
+    """
+    Compares the benchmark throughputs against those of a previous run
+    :param results: dictionary of benchmark name - results
+    :param baseline_path: path to the previous run results file
+    :param tolerance: relative throughput drop considered a regression
+    :return: names of the regressed benchmarks
+    """
+
+    with open(baseline_path) as file:
+        baseline = json.load(file)["results"]
+
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        ratio = result["items_per_sec"] / baseline[name]["items_per_sec"]
+        regressed = ratio < 1 - tolerance
+        click.echo(f"{name:<20} {ratio:>6.2f}x baseline{'  REGRESSION' if regressed else ''}")
+
+        if regressed:
+            regressions.append(name)
+
+    return regressions
+
+
+@click.command()
+@click.option("--papers", default=2000, type=click.IntRange(min=1), help="Number of papers")
+@click.option("--batch-size", default=100, type=click.IntRange(min=1), help="Papers per feed")
+@click.option("--workers", default=2, type=click.IntRange(min=1), help="Routine workers")
+@click.option("--walk-workers", default=1, type=click.IntRange(min=1), help="Walk threads")
+@click.option("--api-latency", default=0.0, type=click.FloatRange(min=0), help="Stub API secs")
+@click.option("--api-concurrency", default=8, type=click.IntRange(min=1), help="API requests")
+@click.option("--repeats", default=3, type=click.IntRange(min=1), help="Repetitions")
+@click.option(
+    "--only",
+    default=[],
+    multiple=True,
+    type=click.Choice(list(BENCHMARKS)),
+    help="Benchmarks to run. All by default",
+)
+@click.option("--output", default="bench-results.json", type=click.Path(), help="Results file")
+@click.option("--baseline", default=None, type=click.Path(exists=True), help="Previous results")
+@click.option("--tolerance", default=0.1, type=click.FloatRange(0, 1), help="Regression drop")
+def main(
+    papers: int,
+    batch_size: int,
+    repeats: int,
+    only: List[str],
+    output: str,
+    baseline: str | None,
+    tolerance: float,
+    **options,
+):
+    """Runs the benchmark suite over a synthetic corpus, storing the results as JSON"""
+
+    # Silence the missing DOI and routine progress messages
+    logging.disable(logging.INFO)
+
+    options["repeats"] = repeats
+    results = {}
+
+    with tempfile.TemporaryDirectory() as root_path:
+        click.echo(f"Generating a synthetic corpus of {papers} papers")
+        corpus = Corpus(Path(root_path), papers, batch_size)
+
+        for name, bench in BENCHMARKS.items():
+            if len(only) > 0 and name not in only:
+                continue
+
+            results[name] = bench(corpus, options)
+            click.echo(
+                f"{name:<20} {results[name]['items_per_sec']:>10,.0f} items/s "
+                f"{results[name]['bytes_per_sec'] / (1 << 20):>8,.2f} MB/s"
+            )
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {"papers": papers, "batch_size": batch_size, **options},
+        "results": results,
+    }
+
+    with open(output, "w") as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+
+    if baseline is not None and len(compare(results, baseline, tolerance)) > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
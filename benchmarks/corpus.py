@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+import json
+import random
+
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from typing import List
+
+# Weekday and month names of the Kaggle snapshot dates (RFC-2822 format)
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# Entries per ArXiv export API response page, when no 'max_results' is given
+ARXIV_PAGE_SIZE = 10
+
+
+def format_kaggle_date(date: datetime) -> str:
+    """
+    Formats a date as found on the Kaggle snapshot versions field
+    :param date: date to format
+    :return: RFC-2822 date string
+    """
+
+    return (
+        f"{DAY_NAMES[date.weekday()]}, {date.day} {MONTH_NAMES[date.month - 1]} {date.year} "
+        f"{date:%H:%M:%S} GMT"
+    )
+
+
+def parse_kaggle_date(date_string: str) -> datetime:
+    """
+    Parses a date as found on the Kaggle snapshot versions field
+    :param date_string: RFC-2822 date string
+    :return: naive UTC date
+    """
+
+    return datetime.strptime(date_string, "%a, %d %b %Y %H:%M:%S GMT")
+
+
+def build_json_entry(index: int, authors: int, versions: int, seed: int = 0) -> dict:
+    """
+    Builds a synthetic Kaggle snapshot entry
+    :param index: paper index, used to build its ID
+    :param authors: number of paper authors
+    :param versions: number of paper revisions
+    :param seed: random seed of the revision dates (optional)
+    :return: Kaggle snapshot entry
+    """
+
+    rand = random.Random(seed * 1_000_003 + index)
+    date = datetime(2007, 4, 1) + timedelta(seconds=rand.randrange(15 * 365 * 86400))
+    dates = []
+
+    for _ in range(versions):
+        dates.append(format_kaggle_date(date))
+        date += timedelta(seconds=rand.randrange(90 * 86400))
+
+    return {
+        "id": f"{date:%y%m}.{index:05d}",
+        "doi": None if index % 2 else f"10.1000/{index}",
+        "title": f"Synthetic paper number {index}",
+        "abstract": "A synthetic abstract.  " * 20,
+        "categories": rand.choice(["hep-ph", "hep-th astro-ph.CO", "math.CO cs.CG"]),
+        "authors_parsed": [[f"Last{index}_{a}", f"First{a}", ""] for a in range(authors)],
+        "versions": [{"version": f"v{v + 1}", "created": d} for v, d in enumerate(dates)],
+    }
+
+
+def build_atom_entry(entry: dict) -> str:
+    """
+    Builds the ArXiv Atom feed <entry> element of the last revision of a synthetic paper
+    :param entry: Kaggle snapshot entry
+    :return: Atom <entry> element
+    """
+
+    revision = entry["versions"][-1]["version"]
+    created = parse_kaggle_date(entry["versions"][0]["created"])
+    updated = parse_kaggle_date(entry["versions"][-1]["created"])
+    entry_url = f"http://arxiv.org/abs/{entry['id']}{revision}"
+
+    authors = "".join(
+        f"<author><name>{first} {last}</name></author>"
+        for last, first, _ in entry["authors_parsed"]
+    )
+    categories = "".join(
+        f'<category term="{category}" scheme="http://arxiv.org/schemas/atom"/>'
+        for category in entry["categories"].split()
+    )
+    doi = ""
+    if entry["doi"] is not None:
+        doi = f'<arxiv:doi xmlns:arxiv="http://arxiv.org/schemas/atom">{entry["doi"]}</arxiv:doi>'
+
+    return (
+        f"<entry>"
+        f"<id>{entry_url}</id>"
+        f"<updated>{updated:%Y-%m-%dT%H:%M:%SZ}</updated>"
+        f"<published>{created:%Y-%m-%dT%H:%M:%SZ}</published>"
+        f"<title>{entry['title']}</title>"
+        f"<summary>{entry['abstract']}</summary>"
+        f"{authors}{doi}"
+        f'<link href="{entry_url}" rel="alternate" type="text/html"/>'
+        f'<link title="pdf" href="{entry_url}" rel="related" type="application/pdf"/>'
+        f"{categories}"
+        f"</entry>"
+    )
+
+
+def build_atom_document(elements: List[str]) -> str:
+    """
+    Wraps several Atom <entry> elements into a feed, as returned by the ArXiv export API
+    :param elements: Atom <entry> elements
+    :return: Atom feed
+    """
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>ArXiv Query: {len(elements)} synthetic papers</title>"
+        "<updated>2021-03-25T00:00:00-04:00</updated>"
+        f"{''.join(elements)}"
+        "</feed>"
+    )
+
+
+def build_atom_feed(entries: List[dict]) -> str:
+    """
+    Builds a multi-entry ArXiv Atom feed out of synthetic papers
+    :param entries: Kaggle snapshot entries
+    :return: Atom feed
+    """
+
+    return build_atom_document([build_atom_entry(entry) for entry in entries])
+
+
+def build_pdf(lines: List[str]) -> bytes:
+    """
+    Builds a single page PDF document with the given text lines
+    :param lines: text lines, without parentheses nor backslashes
+    :return: PDF document
+    """
+
+    text = "".join(f"({line}) Tj T* " for line in lines)
+    stream = f"BT /F1 10 Tf 14 TL 50 750 Td {text}ET".encode("latin-1")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+    ]
+
+    document = bytearray(b"%PDF-1.4\n")
+    offsets = []
+
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(document))
+        document += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref_offset = len(document)
+    document += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    document += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    document += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    document += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+
+    return bytes(document)
+
+
+def write_json_snapshot(file_path: Path, entries: List[dict]) -> int:
+    """
+    Writes a Kaggle-style JSON-lines snapshot
+    :param file_path: path to the snapshot file
+    :param entries: Kaggle snapshot entries
+    :return: snapshot size in bytes
+    """
+
+    with open(file_path, "w") as file:
+        for entry in entries:
+            file.write(json.dumps(entry) + "\n")
+
+    return file_path.stat().st_size
+
+
+def write_pdf_tree(root_path: Path, entries: List[dict], lines: int = 40) -> int:
+    """
+    Writes a nested ArXiv-style tree of small PDF files (pdf/<YYMM>/<ID>.pdf)
+    :param root_path: tree root path
+    :param entries: Kaggle snapshot entries of the papers
+    :param lines: text lines per PDF file (optional)
+    :return: tree size in bytes
+    """
+
+    total_size = 0
+
+    for entry in entries:
+        folder = root_path.joinpath("pdf", entry["id"].split(".")[0])
+        folder.mkdir(parents=True, exist_ok=True)
+
+        abstract = entry["abstract"].strip()
+        document = build_pdf([f"{entry['title']} - line {n}: {abstract}" for n in range(lines)])
+        folder.joinpath(f"{entry['id']}.pdf").write_bytes(document)
+        total_size += len(document)
+
+    return total_size
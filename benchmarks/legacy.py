@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+"""Former implementations kept as baselines of the benchmarks"""
+
+from datetime import datetime
+from datetime import timezone
+
+import pytz
+
+
+def legacy_parse_iso_date(date_string: str) -> datetime:
+    """
+    Former ISO-8601 date parsing, going through a timestamp
+    :param date_string: date in ISO-8601 format
+    :return: UTC datetime object
+    """
+
+    off_date = datetime.fromisoformat(date_string)
+    return datetime.fromtimestamp(off_date.timestamp(), timezone.utc)
+
+
+def legacy_parse_rfc2822_date(date_string: str) -> datetime:
+    """
+    Former RFC-2822 date parsing, going through strptime, pytz and an ISO-8601 string
+    :param date_string: date in RFC-2822 format
+    :return: UTC datetime object
+    """
+
+    dt = date_string[:-3].strip()
+    tz = date_string[-3:].strip()
+
+    off_date = datetime.strptime(dt, "%a, %d %b %Y %H:%M:%S")
+    off_date = off_date.replace(tzinfo=pytz.timezone(tz))
+
+    return legacy_parse_iso_date(off_date.isoformat())
@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+
+"""
+Local stand-in servers of the ArXiv export API and the Dialect Map private API, to load-test
+the metadata jobs offline. Both servers can delay, fail or rate-limit their responses.
+
+Usage:
+    python -m benchmarks.servers arxiv-api --snapshot-path FILE [--port N] [--latency S]
+    python -m benchmarks.servers dialect-map-api [--port N] [--error-rate R] [--rate-limit N]
+
+The metadata job can then be pointed to them, without GCP credentials:
+    python3 src/main.py metadata-job --input-metadata-urls http://localhost:8001/api
+        --output-api-url http://localhost:8002 --no-auth ...
+"""
+
+import json
+import logging
+import random
+import re
+import threading
+import time
+
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+from xml.etree import ElementTree
+
+import click
+
+from .corpus import ARXIV_PAGE_SIZE
+from .corpus import build_atom_document
+from .corpus import build_atom_entry
+
+logger = logging.getLogger()
+
+# XML namespaces of the ArXiv feed elements
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+ARXIV_NAMESPACE = "http://arxiv.org/schemas/atom"
+
+# Regex extracting the paper ID out of a feed entry ID
+ENTRY_ID_REGEX = re.compile(r"^https?://arxiv\.org/abs/(?P<id>.+?)(v\d+)?$")
+
+
+class ServerBehavior:
+    """Object deciding the latency and the failures of the stand-in server responses"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: float | None = None,
+        seed: int = 0,
+    ):
+        """
+        Initializes the server behavior
+        :param latency: seconds each response is delayed (optional)
+        :param error_rate: ratio of requests failing with a 503 response (optional)
+        :param rate_limit: requests per second served before 429 responses (optional)
+        :param seed: random seed of the failures (optional)
+        """
+
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.random = random.Random(seed)
+
+        # The bucket holds at least one token, so that rate limits below 1 still serve requests
+        self.capacity = max(1.0, rate_limit) if rate_limit is not None else 0.0
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+        self.statuses: Dict[int, int] = {}
+
+    def _take_token(self) -> bool:
+        """
+        Takes a token of the rate limit bucket, refilled at the rate limit per second
+        :return: whether the request is within the rate limit
+        """
+
+        if self.rate_limit is None:
+            return True
+
+        now = time.monotonic()
+        refill = (now - self.last_refill) * self.rate_limit
+
+        self.tokens = min(self.capacity, self.tokens + refill)
+        self.last_refill = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+    def decide(self) -> HTTPStatus | None:
+        """
+        Waits for the configured latency and decides whether the request fails
+        :return: failure status, or None if the request succeeds
+        """
+
+        with self.lock:
+            if not self._take_token():
+                status = HTTPStatus.TOO_MANY_REQUESTS
+            elif self.random.random() < self.error_rate:
+                status = HTTPStatus.SERVICE_UNAVAILABLE
+            else:
+                status = None
+
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        return status
+
+    def record(self, status: int) -> None:
+        """
+        Counts a response status
+        :param status: response status
+        """
+
+        with self.lock:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Base request handler of the stand-in servers"""
+
+    server: "StandInServer"
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _reply(self, status: int, body: bytes, content_type: str) -> None:
+        """
+        Sends a response, counting its status
+        :param status: response status
+        :param body: response body
+        :param content_type: response body type
+        """
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            self.send_header("Retry-After", "1")
+
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.behavior.record(status)
+
+    def _reply_json(self, status: int, data: dict) -> None:
+        """
+        Sends a JSON response
+        :param status: response status
+        :param data: response data
+        """
+
+        self._reply(status, json.dumps(data).encode(), "application/json")
+
+    def _reply_failure(self) -> bool:
+        """
+        Sends a failure response, if the server behavior decides so
+        :return: whether the request failed
+        """
+
+        status = self.server.behavior.decide()
+
+        if status is None:
+            return False
+
+        self._reply_json(status, {"error": status.phrase})
+        return True
+
+
+class ArxivAPIRequestHandler(StandInHandler):
+    """Request handler serving ArXiv export API queries out of the indexed feed entries"""
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+
+        if not url.path.endswith("/query"):
+            self._reply_json(HTTPStatus.NOT_FOUND, {"error": "Unknown path"})
+            return
+        if self._reply_failure():
+            return
+
+        query = parse_qs(url.query)
+        paper_ids = ",".join(query.get("id_list", [])).split(",")
+        page_size = int(query.get("max_results", [ARXIV_PAGE_SIZE])[0])
+        elements = [self.server.entries[p] for p in paper_ids if p in self.server.entries]
+        elements = elements[:page_size]
+
+        feed = build_atom_document(elements).encode()
+        self._reply(HTTPStatus.OK, feed, "application/atom+xml; charset=utf-8")
+
+
+class DialectMapAPIRequestHandler(StandInHandler):
+    """Request handler accepting the Dialect Map API records, counting them"""
+
+    def _accept(self) -> None:
+        """Reads a JSON record, or a list of them, replying with the number of accepted ones"""
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+
+        if self._reply_failure():
+            return
+
+        try:
+            data = json.loads(body) if length > 0 else {}
+        except ValueError:
+            self._reply_json(HTTPStatus.BAD_REQUEST, {"error": "Malformed JSON body"})
+            return
+
+        count = len(data) if isinstance(data, list) else 1
+        self.server.count_records(self.command, count)
+        self._reply_json(HTTPStatus.CREATED, {"accepted": count})
+
+    def do_GET(self) -> None:
+        if urlparse(self.path).path == "/stats":
+            self._reply_json(HTTPStatus.OK, self.server.stats())
+        else:
+            self._reply_json(HTTPStatus.NOT_FOUND, {"error": "Unknown path"})
+
+    def do_POST(self) -> None:
+        self._accept()
+
+    def do_PATCH(self) -> None:
+        self._accept()
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the stand-in state and behavior"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        handler_cls: type,
+        behavior: ServerBehavior,
+        entries: Dict[str, str] | None = None,
+    ):
+        """
+        Initializes the stand-in server
+        :param address: tuple of host and port to listen on
+        :param handler_cls: request handler class
+        :param behavior: latency and failures of the responses
+        :param entries: dictionary of paper ID - Atom <entry> element (optional)
+        """
+
+        super().__init__(address, handler_cls)
+
+        self.behavior = behavior
+        self.entries = entries or {}
+        self.records: Dict[str, int] = {}
+        self.records_lock = threading.Lock()
+
+    def count_records(self, method: str, count: int) -> None:
+        """
+        Counts the records accepted by a request method
+        :param method: HTTP request method
+        :param count: number of records
+        """
+
+        with self.records_lock:
+            self.records[method] = self.records.get(method, 0) + count
+
+    def stats(self) -> dict:
+        """
+        Gets the counters of the served requests
+        :return: dictionary of counters
+        """
+
+        with self.records_lock:
+            records = dict(self.records)
+
+        return {"records": records, "statuses": dict(self.behavior.statuses)}
+
+
+def load_snapshot_entries(file_path: Path) -> Dict[str, str]:
+    """
+    Builds the Atom <entry> elements of the papers within a Kaggle JSON-lines snapshot
+    :param file_path: path to the snapshot file
+    :return: dictionary of paper ID - Atom <entry> element
+    """
+
+    entries = {}
+
+    with open(file_path) as file:
+        for line in file:
+            if line.strip():
+                entry = json.loads(line)
+                entries[entry["id"]] = build_atom_entry(entry)
+
+    return entries
+
+
+def load_feed_entries(folder_path: Path) -> Dict[str, str]:
+    """
+    Indexes the <entry> elements of the Atom feed files within a folder (i.e. test fixtures)
+    :param folder_path: path to the folder of XML feed files
+    :return: dictionary of paper ID - Atom <entry> element
+    """
+
+    ElementTree.register_namespace("", ATOM_NAMESPACE)
+    ElementTree.register_namespace("arxiv", ARXIV_NAMESPACE)
+
+    entries = {}
+
+    for file_path in sorted(folder_path.glob("*.xml")):
+        root = ElementTree.parse(file_path).getroot()
+
+        for element in root.iterfind(f"{{{ATOM_NAMESPACE}}}entry"):
+            entry_id = element.findtext(f"{{{ATOM_NAMESPACE}}}id", "").strip()
+            match = ENTRY_ID_REGEX.match(entry_id)
+
+            if match is not None:
+                entries[match.group("id")] = ElementTree.tostring(element, encoding="unicode")
+
+    return entries
+
+
+def serve(server: StandInServer, name: str) -> None:
+    """
+    Serves requests until interrupted, logging the served requests counters
+    :param server: stand-in server
+    :param name: server name, for the logs
+    """
+
+    host, port = server.socket.getsockname()[:2]
+    logger.info(f"Serving the {name} stand-in on http://{host}:{port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"Served {json.dumps(server.stats(), sort_keys=True)}")
+
+
+BEHAVIOR_OPTIONS = [
+    click.option("--host", default="127.0.0.1", type=str, help="Host to listen on"),
+    click.option("--latency", default=0.0, type=click.FloatRange(min=0), help="Response secs"),
+    click.option(
+        "--error-rate",
+        default=0.0,
+        type=click.FloatRange(0, 1),
+        help="Ratio of 503 responses",
+    ),
+    click.option(
+        "--rate-limit",
+        default=None,
+        type=click.FloatRange(min=0, min_open=True),
+        help="Requests per second before 429 responses",
+    ),
+    click.option("--seed", default=0, type=int, help="Random seed of the failures"),
+]
+
+
+def add_behavior_options(func: Callable) -> Callable:
+    """
+    Adds the server behavior options to a Click command
+    :param func: command function
+    :return: decorated command function
+    """
+
+    for option in reversed(BEHAVIOR_OPTIONS):
+        func = option(func)
+
+    return func
+
+
+@click.group()
+def main():
+    """Local stand-in servers of the job remote APIs"""
+
+    logging.basicConfig(
+        format="{asctime} - {levelname} - {message}",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        style="{",
+        level=logging.INFO,
+    )
+
+
+@main.command()
+@click.option("--port", default=8001, type=click.IntRange(0, 65535), help="Port to listen on")
+@click.option(
+    "--snapshot-path",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Kaggle JSON-lines snapshot to serve the papers of",
+)
+@click.option(
+    "--feeds-path",
+    default=None,
+    type=click.Path(exists=True, file_okay=False),
+    help="Folder of Atom feed files to serve the entries of (i.e. tests/.data/feed)",
+)
+@add_behavior_options
+def arxiv_api(
+    port: int,
+    snapshot_path: str | None,
+    feeds_path: str | None,
+    host: str,
+    **behavior,
+):
+    """Serves ArXiv export API queries (<URL>/query?id_list=...) out of fixtures"""
+
+    if snapshot_path is None and feeds_path is None:
+        raise click.UsageError("Provide a --snapshot-path or a --feeds-path to serve papers from")
+
+    entries = {}
+    if feeds_path is not None:
+        entries.update(load_feed_entries(Path(feeds_path)))
+    if snapshot_path is not None:
+        entries.update(load_snapshot_entries(Path(snapshot_path)))
+
+    logger.info(f"Loaded {len(entries)} paper entries")
+
+    server = StandInServer(
+        (host, port),
+        ArxivAPIRequestHandler,
+        ServerBehavior(**behavior),
+        entries,
+    )
+    serve(server, "ArXiv export API")
+
+
+@main.command()
+@click.option("--port", default=8002, type=click.IntRange(0, 65535), help="Port to listen on")
+@add_behavior_options
+def dialect_map_api(port: int, host: str, **behavior):
+    """Accepts Dialect Map API records on any path, counting them (GET /stats)"""
+
+    server = StandInServer(
+        (host, port),
+        DialectMapAPIRequestHandler,
+        ServerBehavior(**behavior),
+    )
+    serve(server, "Dialect Map API")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+
+from typing import Dict
+from typing import List
+
+from dialect_map_io import ArxivAPIHandler
+from job.handlers import BulkDialectMapAPIHandler
+
+from .corpus import ARXIV_PAGE_SIZE
+from .corpus import build_atom_document
+from .corpus import build_atom_entry
+
+
+class StubArxivAPIHandler(ArxivAPIHandler):
+    """ArXiv export API handler serving the Atom feeds of synthetic papers, in-process"""
+
+    def __init__(self, entries: List[dict], latency: float = 0.0):
+        """
+        Initializes the stub handler, pre-building the Atom element of every paper
+        :param entries: Kaggle snapshot entries of the served papers
+        :param latency: seconds each request takes (optional)
+        """
+
+        self.elements = {entry["id"]: build_atom_entry(entry) for entry in entries}
+        self.latency = latency
+
+    def request_metadata(self, query: str) -> str:
+        """
+        Builds the Atom feed of a comma-separated list of paper IDs,
+        truncated to the export API default page size
+        :param query: comma-separated paper IDs
+        :return: Atom feed
+        """
+
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        paper_ids = query.split(",")
+        elements = [self.elements[p] for p in paper_ids if p in self.elements]
+
+        return build_atom_document(elements[:ARXIV_PAGE_SIZE])
+
+
+class StubDialectMapAPIHandler(BulkDialectMapAPIHandler):
+    """Dialect map API handler counting the received records, in-process"""
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Initializes the stub handler
+        :param latency: seconds each request takes (optional)
+        """
+
+        self.latency = latency
+        self.records = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def _accept(self, count: int) -> Dict:
+        """
+        Accepts a request creating a number of records
+        :param count: number of records
+        :return: empty response
+        """
+
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        with self.lock:
+            self.requests += 1
+            self.records += count
+
+        return {}
+
+    def create_record(self, api_path: str, record: dict) -> Dict:
+        """
+        Accepts a record
+        :param api_path: API path the record is sent to
+        :param record: record
+        :return: empty response
+        """
+
+        return self._accept(1)
+
+    def create_records(self, api_path: str, records: List[dict]) -> Dict:
+        """
+        Accepts a list of records sent to a bulk endpoint
+        :param api_path: API path the records are sent to
+        :param records: list of records
+        :return: empty response
+        """
+
+        return self._accept(len(records))
+
+    def archive_record(self, api_path: str) -> Dict:
+        """
+        Accepts a record archival
+        :param api_path: API path of the record
+        :return: empty response
+        """
+
+        return {}
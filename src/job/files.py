@@ -1,30 +1,81 @@
 # -*- coding: utf-8 -*-
 
-import glob
 import os
+import queue
+import threading
+import zlib
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Generator
 from typing import List
+from typing import NamedTuple
+from typing import Set
+from typing import Tuple
 
 StrPath = str | Path
 
+SHARD_MODE_DIR = "dir"
+SHARD_MODE_HASH = "hash"
+SHARD_MODES = [SHARD_MODE_DIR, SHARD_MODE_HASH]
+
+
+class FileEntry(NamedTuple):
+    """
+    Object containing the information of a file found while traversing a tree
+
+    :attr path: absolute file path
+    :attr name: file name
+    :attr rel_dir: file directory, relative to the tree root ("." for the root itself)
+    :attr size: file size in bytes
+    :attr mtime_ns: file modification time in nanoseconds
+    """
+
+    path: str
+    name: str
+    rel_dir: str
+    size: int
+    mtime_ns: int
+
 
 class FileSystemIterator:
     """File system iterator for file system trees"""
 
-    def __init__(self, root_path: StrPath, extension: str):
+    def __init__(
+        self,
+        root_path: StrPath,
+        extension: str,
+        workers: int = 1,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        shard_mode: str = SHARD_MODE_HASH,
+    ):
         """
         Initializes a File System iterator to traverse the tree
         :param root_path: root file path to iterate from
         :param extension: file extension to accept
+        :param workers: number of threads traversing top-level folders (optional)
+        :param shard_index: index of the shard to iterate on (optional)
+        :param shard_count: number of shards the tree is split into (optional)
+        :param shard_mode: split the tree by file path hash or top-level folder (optional)
         """
 
         if not Path(root_path).is_dir():
             raise ValueError("Iterator root path must be a directory")
+        if workers < 1:
+            raise ValueError("The number of workers must be a positive integer")
+        if not 0 <= shard_index < shard_count:
+            raise ValueError("The shard index must be between 0 and the number of shards")
+        if shard_mode not in SHARD_MODES:
+            raise ValueError(f"The shard mode must be one of: {SHARD_MODES}")
 
         self.root_path = Path(root_path).resolve()
-        self.glob_path = f"{self.root_path}/**/*{extension}"
+        self.extension = extension
+        self.workers = workers
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.shard_mode = shard_mode
+        self.visited_lock = threading.Lock()
 
     @staticmethod
     def get_file_name(path: StrPath) -> str:
@@ -36,6 +87,16 @@ class FileSystemIterator:
 
         return Path(path).name
 
+    @staticmethod
+    def get_file_stem(path: StrPath) -> str:
+        """
+        Extracts a file name, without its extension, out of a path
+        :param path: complete file path
+        :return: file name without extension
+        """
+
+        return Path(path).stem
+
     @staticmethod
     def get_node_name(path: StrPath, node_index: int) -> str:
         """
@@ -66,13 +127,201 @@ class FileSystemIterator:
         path_diff_parts = directory_path.parts[common_path_len:]
         return Path(*path_diff_parts)
 
+    def _in_shard(self, key: str) -> bool:
+        """
+        Checks whether a sharding key belongs to the iterator shard
+        :param key: relative file path or top-level folder name
+        :return: whether the key belongs to the shard
+        """
+
+        if self.shard_count == 1:
+            return True
+
+        return zlib.crc32(key.encode("utf-8")) % self.shard_count == self.shard_index
+
+    def _visit(self, dir_path: str, visited: Set[Tuple[int, int]]) -> bool:
+        """
+        Marks a folder as visited, identified by its device and inode numbers,
+        so folders reachable through several paths (i.e. symlink loops) are only walked once
+        :param dir_path: absolute path of the folder
+        :param visited: device and inode numbers of the already visited folders
+        :return: whether the folder had not been visited before
+        """
+
+        try:
+            dir_stat = os.stat(dir_path)
+        except OSError:
+            return False
+
+        dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+
+        with self.visited_lock:
+            if dir_key in visited:
+                return False
+
+            visited.add(dir_key)
+            return True
+
+    def _walk(
+        self,
+        dir_path: str,
+        rel_dir: str,
+        top_level: bool,
+        visited: Set[Tuple[int, int]],
+    ) -> Generator:
+        """
+        Traverses a sub-tree with a depth-first scan, skipping hidden files and folders,
+        already visited folders, and files removed while being scanned
+        :param dir_path: absolute path of the sub-tree folder
+        :param rel_dir: sub-tree folder path, relative to the tree root
+        :param top_level: whether to only list the files of the provided folder
+        :param visited: device and inode numbers of the already visited folders
+        :return: file entry of one of the matching files
+        """
+
+        pending = [(dir_path, rel_dir)]
+
+        while len(pending) > 0:
+            dir_path, rel_dir = pending.pop()
+            sub_dirs = []
+
+            if not top_level and not self._visit(dir_path, visited):
+                continue
+
+            try:
+                scanner = os.scandir(dir_path)
+            except OSError:
+                continue
+
+            with scanner:
+                for entry in scanner:
+                    if entry.name.startswith("."):
+                        continue
+
+                    if entry.is_dir():
+                        sub_rel_dir = entry.name if rel_dir == "." else f"{rel_dir}/{entry.name}"
+                        sub_dirs.append((entry.path, sub_rel_dir))
+                        continue
+
+                    if not entry.name.endswith(self.extension) or not entry.is_file():
+                        continue
+
+                    if self.shard_mode == SHARD_MODE_HASH and not self._in_shard(
+                        f"{rel_dir}/{entry.name}"
+                    ):
+                        continue
+
+                    try:
+                        entry_stat = entry.stat()
+                    except OSError:
+                        continue
+
+                    yield FileEntry(
+                        path=entry.path,
+                        name=entry.name,
+                        rel_dir=rel_dir,
+                        size=entry_stat.st_size,
+                        mtime_ns=entry_stat.st_mtime_ns,
+                    )
+
+            if top_level:
+                break
+
+            # Reversed, so folders are visited in listing order
+            pending.extend(reversed(sub_dirs))
+
+    def _list_top_level(self) -> List[str]:
+        """
+        Lists the non-hidden top-level folders of the tree belonging to the iterator shard
+        :return: list of top-level folder names
+        """
+
+        with os.scandir(self.root_path) as scanner:
+            folders = [e.name for e in scanner if e.is_dir() and not e.name.startswith(".")]
+
+        if self.shard_mode == SHARD_MODE_DIR:
+            folders = [folder for folder in folders if self._in_shard(folder)]
+
+        return sorted(folders)
+
+    def _walk_parallel(self, folders: List[str], visited: Set[Tuple[int, int]]) -> Generator:
+        """
+        Traverses several top-level folders concurrently, using a bounded queue of entries
+        :param folders: list of top-level folder names
+        :param visited: device and inode numbers of the already visited folders
+        :return: file entry of one of the matching files
+        """
+
+        entries: queue.Queue = queue.Queue(maxsize=self.workers * 1000)
+        stopped = threading.Event()
+        finished = object()
+
+        def walk_folder(folder: str) -> None:
+            try:
+                for entry in self._walk(str(self.root_path / folder), folder, False, visited):
+                    while not stopped.is_set():
+                        try:
+                            entries.put(entry, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+            finally:
+                entries.put(finished)
+
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="walk") as executor:
+            futures = [executor.submit(walk_folder, folder) for folder in folders]
+            pending = len(futures)
+
+            try:
+                while pending > 0:
+                    item = entries.get()
+                    if item is finished:
+                        pending -= 1
+                    else:
+                        yield item
+            finally:
+                stopped.set()
+                # Drain the queue, so blocked walkers are able to finish
+                while any(not future.done() for future in futures):
+                    try:
+                        entries.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+
+            for future in futures:
+                future.result()
+
+    def iter_entries(self) -> Generator:
+        """
+        Traverses the tree shard, skipping hidden files and folders
+        :return: file entry of one of the matching files
+        """
+
+        root_dir = str(self.root_path)
+        visited: Set[Tuple[int, int]] = set()
+
+        # The root is never walked again, even if linked from within the tree
+        self._visit(root_dir, visited)
+
+        # Files at the root level belong to the "." folder when sharding by folder
+        if self.shard_mode == SHARD_MODE_HASH or self._in_shard("."):
+            yield from self._walk(root_dir, ".", True, visited)
+
+        folders = self._list_top_level()
+
+        if self.workers == 1:
+            for folder in folders:
+                yield from self._walk(str(self.root_path / folder), folder, False, visited)
+        else:
+            yield from self._walk_parallel(folders, visited)
+
     def all_paths(self) -> List[str]:
         """
         Returns a list of absolute paths for the matched files
         :return: list of absolute paths
         """
 
-        return glob.glob(self.glob_path, recursive=True)
+        return list(self.iter_paths())
 
     def iter_paths(self) -> Generator:
         """
@@ -80,5 +329,5 @@ class FileSystemIterator:
         :return: absolute path
         """
 
-        for path in glob.iglob(self.glob_path, recursive=True):
-            yield path
+        for entry in self.iter_entries():
+            yield entry.path
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+from pathlib import Path
+from typing import Any
+from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import TYPE_CHECKING
+from urllib.request import Request
+from urllib.request import urlopen
+
+from dialect_map_io import DialectMapAPIHandler
+from dialect_map_io import PDFFileHandler
+from dialect_map_io import TextFileHandler
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter
+from pdfminer.pdfinterp import PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+
+if TYPE_CHECKING:
+    # The output package imports this module, so it cannot be imported at runtime
+    from .output import Authenticator
+
+# Path suffix of the private API bulk ingestion endpoints.
+# They accept a JSON array of records with the same schema as the single record route
+BULK_PATH_SUFFIX = "/bulk"
+
+
+class StreamingPDFFileHandler(PDFFileHandler):
+    """PDF file handler also reading the text of the files one page at a time"""
+
+    def iter_pages(self, file_path: str) -> Generator:
+        """
+        Extracts the raw text out of a PDF file pages with pdfminer, one page at a time.
+        Pages are not cached, so memory is bounded by the largest page
+        :param file_path: path to the PDF file
+        :return: page text
+        """
+
+        page_buffer = io.StringIO()
+        resources = PDFResourceManager(caching=True)
+        converter = TextConverter(resources, page_buffer, laparams=LAParams())
+        interpreter = PDFPageInterpreter(resources, converter)
+
+        try:
+            with open(file_path, "rb") as file:
+                for page in PDFPage.get_pages(file, caching=False):
+                    interpreter.process_page(page)
+                    yield page_buffer.getvalue()
+
+                    page_buffer.seek(0)
+                    page_buffer.truncate(0)
+        finally:
+            converter.close()
+
+
+class StreamingTextFileHandler(TextFileHandler):
+    """TXT file handler also writing the content of the files one chunk at a time"""
+
+    def write_chunks(self, file_path: str, chunks: Iterable[str]) -> None:
+        """
+        Writes the given text chunks into a file, appending one at a time.
+        The file is removed if any of the chunks fails to be produced
+        :param file_path: path to the TXT file
+        :param chunks: content for the TXT file, in chunks
+        """
+
+        try:
+            with open(file_path, "w", encoding="utf-8") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+        except BaseException:
+            Path(file_path).unlink(missing_ok=True)
+            raise
+
+
+class BulkDialectMapAPIHandler(DialectMapAPIHandler):
+    """
+    Dialect map API handler also creating several records with a single request,
+    by sending them to the bulk ingestion endpoint of their route (i.e. /paper/metadata/bulk)
+    """
+
+    def __init__(self, auth_ctl: "Authenticator", base_url: str, timeout: float = 60.0):
+        """
+        Initializes the Dialect map API handler
+        :param auth_ctl: authenticator providing the API tokens
+        :param base_url: Dialect map API base URL
+        :param timeout: seconds to wait for each bulk request (optional)
+        """
+
+        super().__init__(auth_ctl, base_url=base_url)
+
+        self.bulk_auth = auth_ctl
+        self.bulk_url = base_url.rstrip("/")
+        self.bulk_timeout = timeout
+
+    def _build_bulk_headers(self) -> dict:
+        """
+        Builds the headers of a bulk request, refreshing the API token if expired
+        :return: request headers
+        """
+
+        if self.bulk_auth.check_expired():
+            self.bulk_auth.refresh_token()
+
+        headers = {"Content-Type": "application/json"}
+        token = self.bulk_auth.get_token()
+
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        return headers
+
+    def create_records(self, api_path: str, records: List[dict]) -> Any:
+        """
+        Creates several records on the bulk ingestion endpoint of the specified API path.
+        The endpoint must create all of them, or answer with an error status
+        :param api_path: API path of the records route
+        :param records: data records to create
+        :return: JSON response
+        """
+
+        request = Request(
+            url=f"{self.bulk_url}{api_path}{BULK_PATH_SUFFIX}",
+            data=json.dumps(records, default=str).encode(),
+            headers=self._build_bulk_headers(),
+            method="POST",
+        )
+
+        try:
+            with urlopen(request, timeout=self.bulk_timeout) as response:
+                body = response.read()
+        except OSError as error:
+            raise ConnectionError(f"Bulk request to {request.full_url} failed: {error}")
+
+        return json.loads(body) if body else {}
@@ -3,4 +3,6 @@
 from .content import *
 from .metadata import *
 
+from .helpers import API_SOURCE_TYPES
+from .helpers import SOURCE_TYPE_API
 from .helpers import init_source_cls
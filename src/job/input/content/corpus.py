@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
+from typing import Generator
+
 from dialect_map_io import PDFFileHandler
 
+from ...handlers import StreamingPDFFileHandler
+
 
 class PDFCorpusSource:
     """File corpus source for the PDFs content"""
@@ -22,3 +26,16 @@ class PDFCorpusSource:
         """
 
         return self.handler.read_file(file_path)
+
+    def iter_txt(self, file_path: str) -> Generator:
+        """
+        Extracts the raw text out of a PDF file, one page at a time.
+        Handlers unable to read files page by page yield the complete file text at once
+        :param file_path: path to the PDF file
+        :return: page text
+        """
+
+        if isinstance(self.handler, StreamingPDFFileHandler):
+            yield from self.handler.iter_pages(file_path)
+        else:
+            yield self.handler.read_file(file_path)
@@ -7,19 +7,29 @@ from dialect_map_io import ArxivAPIHandler
 from dialect_map_io import JSONFileHandler
 
 from .metadata import *
+from ..parsers import AtomMetadataParser
 from ..parsers import FeedMetadataParser
 from ..parsers import JSONMetadataParser
 
 
 SOURCE_TYPE_API = "api"
+SOURCE_TYPE_API_ATOM = "api-atom"
 SOURCE_TYPE_FILE = "file"
 
+# Source types able to handle the HTTP(S) URLs, by feed parser
+API_SOURCE_TYPES = [SOURCE_TYPE_API, SOURCE_TYPE_API_ATOM]
+
 SOURCE_TYPE_MAPPINGS = {
     SOURCE_TYPE_API: {
         "handler_cls": ArxivAPIHandler,
         "parser_cls": FeedMetadataParser,
         "source_cls": ArxivMetadataSource,
     },
+    SOURCE_TYPE_API_ATOM: {
+        "handler_cls": ArxivAPIHandler,
+        "parser_cls": AtomMetadataParser,
+        "source_cls": ArxivMetadataSource,
+    },
     SOURCE_TYPE_FILE: {
         "handler_cls": JSONFileHandler,
         "parser_cls": JSONMetadataParser,
@@ -28,21 +38,33 @@ SOURCE_TYPE_MAPPINGS = {
 }
 
 
-def init_source_cls(url: ParseResult, handler: BaseHandler) -> BaseMetadataSource:
+def init_source_cls(
+    url: ParseResult,
+    handler: BaseHandler,
+    cache: MetadataCache | None = None,
+    api_source_type: str = SOURCE_TYPE_API,
+) -> BaseMetadataSource:
     """
     Returns a source class depending on the provided URL
     :param url: parsed URL to initialize the source for
     :param handler: handler to get the metadata from
+    :param cache: local cache for the remote sources results (optional)
+    :param api_source_type: source type of the HTTP(S) URLs, by feed parser (optional)
     :return: source instance
     """
 
+    if api_source_type not in API_SOURCE_TYPES:
+        raise ValueError(f"The API source type must be one of {API_SOURCE_TYPES}")
+
+    kwargs: dict
+
     match url.scheme:
         case "file":
             classes = SOURCE_TYPE_MAPPINGS[SOURCE_TYPE_FILE]
             kwargs = {"file_path": url.path}
         case "http" | "https":
-            classes = SOURCE_TYPE_MAPPINGS[SOURCE_TYPE_API]
-            kwargs = {}
+            classes = SOURCE_TYPE_MAPPINGS[api_source_type]
+            kwargs = {"cache": cache}
         case _:
             raise ValueError("Source not specified for the provided URL")
 
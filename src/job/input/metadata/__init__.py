@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 
 from .base import BaseMetadataSource
+from .cache import MetadataCache
+from .index import JSONLinesIndex
 
 from .api import ArxivMetadataSource
 from .file import JSONMetadataSource
+from .snapshot import SnapshotFilter
+from .snapshot import iter_snapshot_ranges
+from .snapshot import parse_snapshot_range
+from .snapshot import snapshot_range_size
@@ -2,45 +2,158 @@
 
 import logging
 
+from typing import Dict
 from typing import List
 from typing import override
 from dialect_map_io import ArxivAPIHandler
 
 from .base import BaseMetadataSource
+from .cache import MetadataCache
 from ...models import ArxivMetadata
 from ...parsers import FeedMetadataParser
 
 logger = logging.getLogger()
 
+# Maximum number of IDs packed into a single export API query.
+# The handler queries do not set 'max_results', so the export API answers with its default
+# page of 10 entries, and the IDs beyond that page would then be requested one at a time
+ARXIV_ID_LIST_LIMIT = 10
+
+# Query type used to address the cached export API results
+ARXIV_CACHE_QUERY = "export-api:id_list"
+
 
 class ArxivMetadataSource(BaseMetadataSource):
     """ArXiv API source for the metadata information"""
 
-    def __init__(self, handler: ArxivAPIHandler, parser: FeedMetadataParser):
+    def __init__(
+        self,
+        handler: ArxivAPIHandler,
+        parser: FeedMetadataParser,
+        batch_size: int = ARXIV_ID_LIST_LIMIT,
+        cache: MetadataCache | None = None,
+    ):
         """
         Initializes the metadata operator with a given API and parser
         :param handler: object to retrieve the ArXiv metadata feed
         :param parser: object to parse the ArXiv metadata feed
+        :param batch_size: maximum number of IDs per API query (optional)
+        :param cache: local cache of previous API results (optional)
         """
 
+        if not 0 < batch_size <= ARXIV_ID_LIST_LIMIT:
+            raise ValueError(f"The batch size must be between 1 and {ARXIV_ID_LIST_LIMIT}")
+
         self.handler = handler
         self.parser = parser
+        self.batch_size = batch_size
+        self.cache = cache
 
-    @override
-    def get_metadata(self, paper_id: str) -> List[ArxivMetadata]:
+    def _get_cached(self, paper_id: str) -> List[ArxivMetadata] | None:
         """
-        Retrieves the complete metadata of the multiple ArXiv paper versions
+        Gets the cached metadata of an ArXiv paper, if any
         :param paper_id: ArXiv paper ID
         :return: ArXiv paper versions metadata
         """
 
-        meta = []
+        if self.cache is None:
+            return None
+
+        return self.cache.get(self.cache.build_key(ARXIV_CACHE_QUERY, paper_id))
+
+    def _put_cached(self, paper_id: str, meta: List[ArxivMetadata]) -> None:
+        """
+        Stores the metadata of an ArXiv paper in the cache, if found
+        :param paper_id: ArXiv paper ID
+        :param meta: ArXiv paper versions metadata
+        """
+
+        if self.cache is None or len(meta) == 0:
+            return
+
+        self.cache.put(self.cache.build_key(ARXIV_CACHE_QUERY, paper_id), meta)
+
+    def _request_single(self, paper_id: str) -> List[ArxivMetadata]:
+        """
+        Retrieves the metadata of an ArXiv paper using an API query.
+        As with the batch queries, entries of any other paper ID are discarded
+        :param paper_id: ArXiv paper ID
+        :return: ArXiv paper versions metadata
+        """
 
         try:
             feed = self.handler.request_metadata(paper_id)
         except ConnectionError:
             logger.error(f"Paper {paper_id} not found in the ArXiv export API")
-        else:
-            meta = self.parser.parse_body(feed)
+            return []
 
+        groups = self.parser.parse_grouped(feed)
+        meta = groups.pop(paper_id, [])
+
+        if len(groups) > 0:
+            logger.warning(f"Paper {paper_id} query returned unrequested papers {list(groups)}")
+
+        self._put_cached(paper_id, meta)
         return meta
+
+    def _request_batch(self, paper_ids: List[str]) -> Dict[str, List[ArxivMetadata]]:
+        """
+        Retrieves the metadata of several ArXiv papers using a single API query
+        :param paper_ids: ArXiv paper IDs
+        :return: dictionary of ArXiv paper ID - ArXiv paper versions metadata
+        """
+
+        try:
+            feed = self.handler.request_metadata(",".join(paper_ids))
+        except ConnectionError:
+            logger.error(f"Papers {paper_ids} batch failed in the ArXiv export API")
+            return {}
+
+        return self.parser.parse_grouped(feed)
+
+    @override
+    def get_metadata(self, paper_id: str) -> List[ArxivMetadata]:
+        """
+        Retrieves the complete metadata of the multiple ArXiv paper versions
+        :param paper_id: ArXiv paper ID
+        :return: ArXiv paper versions metadata
+        """
+
+        meta = self._get_cached(paper_id)
+        if meta is None:
+            meta = self._request_single(paper_id)
+
+        return meta
+
+    @override
+    def get_metadata_many(self, paper_ids: List[str]) -> Dict[str, List[ArxivMetadata]]:
+        """
+        Retrieves the complete metadata of the multiple versions of several ArXiv papers.
+        IDs missing from a batch response (truncated results or batch-wide errors
+        caused by a single malformed ID) are retried one at a time.
+        :param paper_ids: ArXiv paper IDs
+        :return: dictionary of ArXiv paper ID - ArXiv paper versions metadata
+        """
+
+        metas = {}
+        missing_ids = []
+
+        for paper_id in paper_ids:
+            meta = self._get_cached(paper_id)
+            if meta is not None:
+                metas[paper_id] = meta
+            else:
+                missing_ids.append(paper_id)
+
+        for i in range(0, len(missing_ids), self.batch_size):
+            chunk = missing_ids[i : i + self.batch_size]
+            batch = self._request_batch(chunk) if len(chunk) > 1 else {}
+
+            for paper_id in chunk:
+                if paper_id in batch:
+                    metas[paper_id] = batch[paper_id]
+                    self._put_cached(paper_id, batch[paper_id])
+                else:
+                    metas[paper_id] = self._request_single(paper_id)
+
+        return metas
@@ -2,6 +2,7 @@
 
 from abc import ABC
 from abc import abstractmethod
+from typing import Dict
 from typing import List
 
 from ...models import ArxivMetadata
@@ -19,3 +20,17 @@ class BaseMetadataSource(ABC):
         """
 
         raise NotImplementedError()
+
+    def get_metadata_many(self, paper_ids: List[str]) -> Dict[str, List[ArxivMetadata]]:
+        """
+        Retrieves the complete metadata of the multiple versions of several ArXiv papers
+        :param paper_ids: ArXiv paper IDs
+        :return: dictionary of ArXiv paper ID - ArXiv paper versions metadata
+        """
+
+        return {paper_id: self.get_metadata(paper_id) for paper_id in paper_ids}
+
+    def close(self) -> None:
+        """Releases the resources held by the source, if any"""
+
+        pass
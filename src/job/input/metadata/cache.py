@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+
+from pathlib import Path
+from typing import List
+
+from ...models import ArxivMetadata
+
+logger = logging.getLogger()
+
+# Version of the cached values format. Bump it to invalidate the existing entries
+CACHE_VERSION = 2
+
+
+class MetadataCache:
+    """Local SQLite cache of ArXiv metadata records, with expiration and LRU eviction"""
+
+    def __init__(self, db_path: str | Path, ttl: float = 7 * 86400, max_bytes: int = 1 << 30):
+        """
+        Initializes the cache, creating the underlying database if necessary
+        :param db_path: path to the SQLite database file
+        :param ttl: seconds an entry is considered valid (optional)
+        :param max_bytes: maximum size of the cached values in bytes (optional)
+        """
+
+        if ttl <= 0:
+            raise ValueError("The cache TTL must be a positive number")
+        if max_bytes <= 0:
+            raise ValueError("The cache size must be a positive number")
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self.db_lock = threading.Lock()
+        self.db_conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.db_conn.execute("PRAGMA journal_mode=WAL")
+        self.db_conn.execute("PRAGMA synchronous=NORMAL")
+        self.db_conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, "
+            "value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL)"
+        )
+        self.db_conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+        )
+        self.db_conn.commit()
+
+        self.total_bytes = self.db_conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+    @property
+    def hit_ratio(self) -> float:
+        """Ratio of lookups served by the cache"""
+
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    @staticmethod
+    def build_key(query: str, paper_id: str) -> str:
+        """
+        Builds the content address of a paper ID result for a given query type
+        :param query: query type the result comes from
+        :param paper_id: ArXiv paper ID
+        :return: cache key
+        """
+
+        key = f"{CACHE_VERSION}:{query}:{paper_id}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _evict(self) -> None:
+        """Deletes the least recently used entries until the cache fits its maximum size"""
+
+        while self.total_bytes > self.max_bytes:
+            rows = self.db_conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+
+            if len(rows) == 0:
+                break
+
+            for key, size in rows:
+                self.db_conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.total_bytes -= size
+
+                if self.total_bytes <= self.max_bytes:
+                    break
+
+    def get(self, key: str) -> List[ArxivMetadata] | None:
+        """
+        Gets the cached metadata records of a key, if present and not expired
+        :param key: cache key
+        :return: list of ArXiv paper metadata records
+        """
+
+        now = time.time()
+
+        with self.db_lock, self.db_conn:
+            row = self.db_conn.execute(
+                "SELECT value, size, created_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is not None and now - row[2] > self.ttl:
+                self.db_conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.total_bytes -= row[1]
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.db_conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+
+        return pickle.loads(row[0])
+
+    def put(self, key: str, records: List[ArxivMetadata]) -> None:
+        """
+        Stores the metadata records of a key, evicting old entries if necessary
+        :param key: cache key
+        :param records: list of ArXiv paper metadata records
+        """
+
+        value = pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+
+        with self.db_lock, self.db_conn:
+            row = self.db_conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.total_bytes -= row[0]
+
+            self.db_conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now),
+            )
+            self.total_bytes += len(value)
+            self._evict()
+
+    def close(self) -> None:
+        """Closes the underlying database connection"""
+
+        self.db_conn.close()
@@ -1,17 +1,24 @@
 # -*- coding: utf-8 -*-
 
+import json
 import logging
+import os
 
+from typing import Dict
 from typing import List
 from typing import override
 from dialect_map_io import JSONFileHandler
 
 from .base import BaseMetadataSource
+from .index import JSONLinesIndex
 from ...models import ArxivMetadata
 from ...parsers import JSONMetadataParser
 
 logger = logging.getLogger()
 
+# Suffix of the persisted index file, stored next to the metadata file
+INDEX_FILE_SUFFIX = ".idx"
+
 
 class JSONMetadataSource(BaseMetadataSource):
     """JSON file source for the metadata information"""
@@ -26,16 +33,58 @@ class JSONMetadataSource(BaseMetadataSource):
 
         self.handler = handler
         self.parser = parser
-        self.entries = self._build_metadata_file(file_path)
+        self.file_path = file_path
+        self.file_desc = os.open(file_path, os.O_RDONLY)
+        self.entries = self._build_metadata_index(file_path)
 
-    def _build_metadata_file(self, file_path: str) -> dict:
+    def _build_metadata_index(self, file_path: str) -> JSONLinesIndex:
         """
-        Builds an ID - JSON dictionary after iterating the provided metadata file
+        Loads the persisted ID - line offset index of the provided metadata file,
+        building and persisting it next to the file if missing or stale
         :param file_path: path to the metadata file
-        :return: ID - JSON dictionary
+        :return: ID - line offset index
+        """
+
+        index_path = f"{file_path}{INDEX_FILE_SUFFIX}"
+        fingerprint = JSONLinesIndex.fingerprint(file_path)
+
+        index = JSONLinesIndex.load(index_path, fingerprint)
+        if index is not None:
+            logger.info(f"Loaded {len(index)} entries from the ArXiv metadata index")
+            return index
+
+        index = JSONLinesIndex.build(file_path)
+        logger.info(f"Indexed {len(index)} entries from the ArXiv metadata file")
+
+        try:
+            index.save(index_path, fingerprint)
+        except OSError as error:
+            logger.warning(f"Cannot persist the ArXiv metadata index: {error}")
+
+        return index
+
+    def _read_entry(self, paper_id: str) -> dict:
         """
+        Reads and decodes the JSON line of a given ArXiv paper ID
+        :param paper_id: ArXiv paper ID
+        :return: JSON entry
+        """
+
+        for offset, length in self.entries.find(paper_id):
+            line = os.pread(self.file_desc, length, offset)
+            entry = json.loads(line)
 
-        return {json["id"]: json for json in self.handler.read_items(file_path)}
+            if entry["id"] == paper_id:
+                return entry
+
+        raise KeyError(paper_id)
+
+    @override
+    def close(self) -> None:
+        """Closes the underlying metadata file and index"""
+
+        self.entries.close()
+        os.close(self.file_desc)
 
     @override
     def get_metadata(self, paper_id: str) -> List[ArxivMetadata]:
@@ -48,10 +97,33 @@ class JSONMetadataSource(BaseMetadataSource):
         meta = []
 
         try:
-            json = self.entries[paper_id]
+            entry = self._read_entry(paper_id)
         except KeyError:
             logger.error(f"Paper {paper_id} not found in the ArXiv metadata file")
         else:
-            meta = self.parser.parse_body(json)
+            meta = self.parser.parse_body(entry)
 
         return meta
+
+    @override
+    def get_metadata_many(self, paper_ids: List[str]) -> Dict[str, List[ArxivMetadata]]:
+        """
+        Retrieves the complete metadata of the multiple versions of several ArXiv papers,
+        parsing all their entries at once
+        :param paper_ids: ArXiv paper IDs
+        :return: dictionary of ArXiv paper ID - ArXiv paper versions metadata
+        """
+
+        metas: Dict[str, List[ArxivMetadata]] = {paper_id: [] for paper_id in paper_ids}
+        entries = []
+
+        for paper_id in metas:
+            try:
+                entries.append(self._read_entry(paper_id))
+            except KeyError:
+                logger.error(f"Paper {paper_id} not found in the ArXiv metadata file")
+
+        for paper in self.parser.parse_many(entries):
+            metas[paper.paper_id].append(paper)
+
+        return metas
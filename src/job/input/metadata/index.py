@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Generator
+from typing import Sequence
+from typing import Tuple
+
+logger = logging.getLogger()
+
+# Regex to extract the ID of a JSON line without decoding the complete entry
+ENTRY_ID_REGEX = re.compile(rb'^\s*\{\s*"id"\s*:\s*"([^"\\]*)"')
+
+# Persisted index header: magic, source file fingerprint and number of entries
+INDEX_HEADER = struct.Struct("<8s32sQ")
+INDEX_MAGIC = b"DMJIDX01"
+
+# Number of bytes sampled from the source file head and tail to fingerprint it
+FINGERPRINT_SAMPLE = 1 << 20
+
+# Maximum number of leading hash bits used to bucket the entries while sorting them
+MAX_BUCKET_BITS = 20
+
+
+class JSONLinesIndex:
+    """
+    Compact offset index of a JSON-lines file, keyed by the ID of its entries.
+    IDs are stored as sorted 64-bit hashes along their line byte offsets and lengths,
+    taking 20 bytes per entry regardless of the size of the entries
+    """
+
+    def __init__(
+        self,
+        hashes: Sequence[int],
+        offsets: Sequence[int],
+        lengths: Sequence[int],
+        mapped: mmap.mmap | None = None,
+    ):
+        """
+        Initializes the index out of its sorted column sequences
+        :param hashes: sorted ID hashes
+        :param offsets: line byte offsets, in the same order as the hashes
+        :param lengths: line byte lengths, in the same order as the hashes
+        :param mapped: memory-mapped index file the sequences are views of (optional)
+        """
+
+        if not len(hashes) == len(offsets) == len(lengths):
+            raise ValueError("Index sequences must have the same length")
+
+        self.hashes = hashes
+        self.offsets = offsets
+        self.lengths = lengths
+        self.mapped = mapped
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    @staticmethod
+    def hash_id(entry_id: str | bytes) -> int:
+        """
+        Computes the stable 64-bit hash of an entry ID
+        :param entry_id: entry ID
+        :return: entry ID hash
+        """
+
+        if isinstance(entry_id, str):
+            entry_id = entry_id.encode("utf-8")
+
+        digest = hashlib.blake2b(entry_id, digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    @staticmethod
+    def _extract_id(line: bytes) -> bytes | None:
+        """
+        Extracts the ID of a JSON line, decoding the complete entry only if necessary
+        :param line: JSON line
+        :return: entry ID (None if the line is not an entry)
+        """
+
+        match = ENTRY_ID_REGEX.match(line)
+        if match is not None:
+            return match.group(1)
+
+        if line.strip() == b"":
+            return None
+
+        entry_id = json.loads(line)["id"]
+        return entry_id.encode("utf-8")
+
+    @classmethod
+    def build(cls, file_path: str) -> "JSONLinesIndex":
+        """
+        Builds the index with a single streaming pass over a JSON-lines file
+        :param file_path: path to the JSON-lines file
+        :return: index object
+        """
+
+        hashes = array("Q")
+        offsets = array("Q")
+        lengths = array("I")
+
+        offset = 0
+
+        with open(file_path, "rb") as file:
+            for line in file:
+                entry_id = cls._extract_id(line)
+
+                if entry_id is not None:
+                    hashes.append(cls.hash_id(entry_id))
+                    offsets.append(offset)
+                    lengths.append(len(line))
+
+                offset += len(line)
+
+        hashes, offsets, lengths = cls._sort_columns(hashes, offsets, lengths)
+
+        return cls(hashes=hashes, offsets=offsets, lengths=lengths)
+
+    @staticmethod
+    def _sort_columns(hashes: array, offsets: array, lengths: array) -> Tuple[array, array, array]:
+        """
+        Sorts the index columns by hash, without building a Python object per entry.
+        The uniformly distributed hashes are scattered into buckets by their leading bits,
+        so only the few entries of each bucket are sorted at a time
+        :param hashes: ID hashes
+        :param offsets: line byte offsets, in the same order as the hashes
+        :param lengths: line byte lengths, in the same order as the hashes
+        :return: tuple of sorted hashes, offsets and lengths
+        """
+
+        count = len(hashes)
+        bucket_bits = min(max(count.bit_length() - 3, 0), MAX_BUCKET_BITS)
+        bucket_shift = 64 - bucket_bits
+
+        # Bucket boundaries, as the cumulative count of the preceding buckets
+        bounds = array("Q", bytes(8 * ((1 << bucket_bits) + 1)))
+
+        for entry_hash in hashes:
+            bounds[(entry_hash >> bucket_shift) + 1] += 1
+        for bucket in range(1 << bucket_bits):
+            bounds[bucket + 1] += bounds[bucket]
+
+        sorted_hashes = array("Q", bytes(8 * count))
+        sorted_offsets = array("Q", bytes(8 * count))
+        sorted_lengths = array("I", bytes(4 * count))
+        free_slots = array("Q", bounds)
+
+        for entry_hash, offset, length in zip(hashes, offsets, lengths):
+            bucket = entry_hash >> bucket_shift
+            slot = free_slots[bucket]
+            free_slots[bucket] += 1
+
+            sorted_hashes[slot] = entry_hash
+            sorted_offsets[slot] = offset
+            sorted_lengths[slot] = length
+
+        for bucket in range(1 << bucket_bits):
+            start, end = bounds[bucket], bounds[bucket + 1]
+            if end - start < 2:
+                continue
+
+            rows = sorted(
+                zip(
+                    sorted_hashes[start:end],
+                    sorted_offsets[start:end],
+                    sorted_lengths[start:end],
+                )
+            )
+            for slot, (entry_hash, offset, length) in enumerate(rows, start=start):
+                sorted_hashes[slot] = entry_hash
+                sorted_offsets[slot] = offset
+                sorted_lengths[slot] = length
+
+        return sorted_hashes, sorted_offsets, sorted_lengths
+
+    @staticmethod
+    def fingerprint(file_path: str) -> bytes:
+        """
+        Computes a fingerprint of a JSON-lines file out of its size, modification time
+        and a hash of its head and tail bytes, avoiding a read of the complete file
+        :param file_path: path to the JSON-lines file
+        :return: file fingerprint
+        """
+
+        file_stat = os.stat(file_path)
+        file_hash = hashlib.blake2b(digest_size=32)
+        file_hash.update(struct.pack("<QQ", file_stat.st_size, file_stat.st_mtime_ns))
+
+        with open(file_path, "rb") as file:
+            file_hash.update(file.read(FINGERPRINT_SAMPLE))
+            file.seek(max(0, file_stat.st_size - FINGERPRINT_SAMPLE))
+            file_hash.update(file.read(FINGERPRINT_SAMPLE))
+
+        return file_hash.digest()
+
+    @classmethod
+    def load(cls, index_path: str | Path, fingerprint: bytes) -> "JSONLinesIndex | None":
+        """
+        Loads a persisted index by memory-mapping it, if it matches the source fingerprint
+        :param index_path: path to the persisted index file
+        :param fingerprint: fingerprint of the indexed JSON-lines file
+        :return: index object (None if missing or stale)
+        """
+
+        try:
+            with open(index_path, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if len(mapped) < INDEX_HEADER.size:
+            mapped.close()
+            return None
+
+        magic, index_fingerprint, count = INDEX_HEADER.unpack_from(mapped)
+
+        if (
+            magic != INDEX_MAGIC
+            or index_fingerprint != fingerprint
+            or len(mapped) != INDEX_HEADER.size + count * 20
+        ):
+            mapped.close()
+            return None
+
+        view = memoryview(mapped)
+        hashes_start = INDEX_HEADER.size
+        offsets_start = hashes_start + count * 8
+        lengths_start = offsets_start + count * 8
+
+        return cls(
+            hashes=view[hashes_start:offsets_start].cast("Q"),
+            offsets=view[offsets_start:lengths_start].cast("Q"),
+            lengths=view[lengths_start:].cast("I"),
+            mapped=mapped,
+        )
+
+    def save(self, index_path: str | Path, fingerprint: bytes) -> None:
+        """
+        Persists the index atomically, so it can be memory-mapped on later runs
+        :param index_path: path to the persisted index file
+        :param fingerprint: fingerprint of the indexed JSON-lines file
+        """
+
+        temp_path = Path(index_path).with_name(f".{Path(index_path).name}.tmp")
+
+        with open(temp_path, "wb") as file:
+            file.write(INDEX_HEADER.pack(INDEX_MAGIC, fingerprint, len(self)))
+            file.write(array("Q", self.hashes).tobytes())
+            file.write(array("Q", self.offsets).tobytes())
+            file.write(array("I", self.lengths).tobytes())
+
+        os.replace(temp_path, index_path)
+
+    def close(self) -> None:
+        """Releases the memory-mapped index file, if loaded from one"""
+
+        if self.mapped is None:
+            return
+
+        for column in (self.hashes, self.offsets, self.lengths):
+            if isinstance(column, memoryview):
+                column.release()
+
+        self.mapped.close()
+        self.mapped = None
+
+    def find(self, entry_id: str) -> Generator:
+        """
+        Finds the candidate lines of an entry ID (several in case of hash collisions)
+        :param entry_id: entry ID
+        :return: tuple of line byte offset and length
+        """
+
+        entry_hash = self.hash_id(entry_id)
+        position = bisect_left(self.hashes, entry_hash)
+
+        while position < len(self.hashes) and self.hashes[position] == entry_hash:
+            yield self.offsets[position], self.lengths[position]
+            position += 1
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from typing import FrozenSet
+from typing import Generator
+from typing import List
+from typing import Tuple
+
+from ...models import ArxivMetadata
+from ...parsers import JSONMetadataParser
+
+# Parser used by the snapshot worker processes
+_snapshot_parser: JSONMetadataParser | None = None
+
+
+@dataclass(frozen=True)
+class SnapshotFilter:
+    """
+    Object containing the criteria to select the snapshot papers to process
+
+    :attr categories: categories or whole archives (i.e. "math") to keep, all if empty
+    :attr since: earliest revision date to keep, inclusive (optional)
+    :attr until: latest revision date to keep, exclusive (optional)
+    """
+
+    categories: FrozenSet[str] = field(default_factory=frozenset)
+    since: datetime | None = None
+    until: datetime | None = None
+
+    def match_entry(self, entry: dict) -> bool:
+        """
+        Checks whether a snapshot entry belongs to any of the selected categories
+        :param entry: snapshot JSON entry
+        :return: whether the entry is selected
+        """
+
+        if len(self.categories) == 0:
+            return True
+
+        for category in entry["categories"].split():
+            if category in self.categories or category.split(".")[0] in self.categories:
+                return True
+
+        return False
+
+    def match_paper(self, paper: ArxivMetadata) -> bool:
+        """
+        Checks whether a paper revision falls within the selected dates
+        :param paper: paper revision metadata
+        :return: whether the revision is selected
+        """
+
+        if self.since is not None and paper.paper_updated_at < self.since:
+            return False
+        if self.until is not None and paper.paper_updated_at >= self.until:
+            return False
+
+        return True
+
+
+def iter_snapshot_ranges(file_path: str, chunk_size: int) -> Generator:
+    """
+    Iterates on the byte ranges of a JSON-lines snapshot, splitting it at line boundaries
+    :param file_path: path to the snapshot file
+    :param chunk_size: approximate bytes per range
+    :return: tuple of range start and end offsets
+    """
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be a positive integer")
+
+    file_size = os.path.getsize(file_path)
+    start = 0
+
+    with open(file_path, "rb") as file:
+        while start < file_size:
+            end = start + chunk_size
+
+            if end < file_size:
+                file.seek(end)
+                file.readline()
+                end = file.tell()
+
+            yield start, min(end, file_size)
+            start = end
+
+
+def snapshot_range_size(byte_range: Tuple[int, int]) -> int:
+    """
+    Measures the size of a snapshot byte range, for the throughput metrics
+    :param byte_range: tuple of range start and end offsets
+    :return: range size in bytes
+    """
+
+    return byte_range[1] - byte_range[0]
+
+
+def parse_snapshot_range(
+    file_path: str,
+    filters: SnapshotFilter,
+    byte_range: Tuple[int, int],
+) -> List[ArxivMetadata]:
+    """
+    Parses the selected papers within a byte range of a JSON-lines snapshot
+    :param file_path: path to the snapshot file
+    :param filters: criteria to select the papers
+    :param byte_range: tuple of range start and end offsets
+    :return: metadata of the selected paper revisions
+    """
+
+    global _snapshot_parser
+
+    if _snapshot_parser is None:
+        _snapshot_parser = JSONMetadataParser()
+
+    start, end = byte_range
+
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        chunk = file.read(end - start)
+
+    entries = []
+
+    for line in chunk.splitlines():
+        if len(line.strip()) == 0:
+            continue
+
+        entry = json.loads(line)
+        if filters.match_entry(entry):
+            entries.append(entry)
+
+    papers = _snapshot_parser.parse_many(entries)
+
+    return [paper for paper in papers if filters.match_paper(paper)]
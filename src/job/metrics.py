@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import random
+import threading
+import time
+
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+logger = logging.getLogger()
+
+# Latency samples kept per stage to estimate its percentiles
+LATENCY_RESERVOIR_SIZE = 4096
+
+# Latency percentiles reported per stage
+LATENCY_PERCENTILES = [50, 95, 99]
+
+# Kinds of values a probe can read
+PROBE_KIND_GAUGE = "gauge"
+PROBE_KIND_COUNTER = "counter"
+PROBE_KINDS = [PROBE_KIND_GAUGE, PROBE_KIND_COUNTER]
+
+
+class Probe(NamedTuple):
+    """
+    Object reading a value of the job state when the metrics are exported
+
+    :attr name: metric name
+    :attr description: metric description
+    :attr func: function reading the current value
+    :attr kind: whether the value can go up and down (gauge) or only up (counter)
+    :attr labels: tuple of label name - value pairs
+    """
+
+    name: str
+    description: str
+    func: Callable[[], float]
+    kind: str
+    labels: Tuple[Tuple[str, str], ...]
+
+
+class StageMetrics:
+    """
+    Object accumulating the counters and latencies of a routine stage.
+    Latencies are kept on a fixed-size reservoir sample, bounding its memory on long runs
+    """
+
+    def __init__(self, name: str, reservoir_size: int = LATENCY_RESERVOIR_SIZE):
+        """
+        Initializes the stage metrics
+        :param name: stage name
+        :param reservoir_size: latency samples kept to estimate the percentiles (optional)
+        """
+
+        self.name = name
+        self.count = 0
+        self.bytes = 0
+        self.errors = 0
+        self.busy_time = 0.0
+        self.max_latency = 0.0
+        self.reservoir_size = reservoir_size
+        self.latencies: List[float] = []
+        self.lock = threading.Lock()
+        self.random = random.Random(0)
+
+    @staticmethod
+    def _percentile(samples: List[float], percentile: int) -> float:
+        """
+        Computes a nearest-rank percentile out of a sorted list of samples
+        :param samples: sorted list of samples
+        :param percentile: percentile to compute (0 - 100)
+        :return: percentile value
+        """
+
+        if len(samples) == 0:
+            return 0.0
+
+        rank = max(round(percentile / 100 * len(samples)), 1)
+        return samples[rank - 1]
+
+    def observe(self, elapsed: float, size: int = 0) -> None:
+        """
+        Records an item successfully processed by the stage
+        :param elapsed: seconds spent processing the item
+        :param size: bytes processed with the item (optional)
+        """
+
+        with self.lock:
+            self.count += 1
+            self.bytes += size
+            self.busy_time += elapsed
+            self.max_latency = max(self.max_latency, elapsed)
+
+            if len(self.latencies) < self.reservoir_size:
+                self.latencies.append(elapsed)
+                return
+
+            index = self.random.randrange(self.count)
+            if index < self.reservoir_size:
+                self.latencies[index] = elapsed
+
+    def fail(self) -> None:
+        """Records an item the stage failed to process"""
+
+        with self.lock:
+            self.errors += 1
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        """
+        Summarizes the stage counters, rates and latencies
+        :param elapsed: seconds since the metrics started to be recorded
+        :return: dictionary of stage metrics
+        """
+
+        with self.lock:
+            count, size, errors = self.count, self.bytes, self.errors
+            busy_time, max_latency = self.busy_time, self.max_latency
+            samples = sorted(self.latencies)
+
+        latency = {f"p{p}": self._percentile(samples, p) for p in LATENCY_PERCENTILES}
+        latency["mean"] = busy_time / count if count > 0 else 0.0
+        latency["max"] = max_latency
+
+        return {
+            "stage": self.name,
+            "count": count,
+            "bytes": size,
+            "errors": errors,
+            "busy_seconds": busy_time,
+            "items_per_sec": count / elapsed if elapsed > 0 else 0.0,
+            "bytes_per_sec": size / elapsed if elapsed > 0 else 0.0,
+            "latency": latency,
+        }
+
+
+class MetricsRecorder:
+    """
+    Class collecting the per-stage metrics of the routines in-process.
+    They can be periodically logged as JSON lines, and dumped as a JSON summary
+    """
+
+    enabled = True
+
+    def __init__(self, reservoir_size: int = LATENCY_RESERVOIR_SIZE):
+        """
+        Initializes the metrics recorder
+        :param reservoir_size: latency samples kept per stage (optional)
+        """
+
+        self.reservoir_size = reservoir_size
+        self.stages: Dict[str, StageMetrics] = {}
+        self.probes: Dict[Tuple, Probe] = {}
+        self.lock = threading.Lock()
+        self.start_time = time.perf_counter()
+        self.stop_event = threading.Event()
+        self.reporters: List[threading.Thread] = []
+
+    def __enter__(self) -> "MetricsRecorder":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def stage(self, name: str) -> StageMetrics:
+        """
+        Gets the metrics of a stage, creating them if necessary
+        :param name: stage name
+        :return: stage metrics
+        """
+
+        stage = self.stages.get(name)
+
+        if stage is None:
+            with self.lock:
+                stage = self.stages.setdefault(name, StageMetrics(name, self.reservoir_size))
+
+        return stage
+
+    def observe(self, name: str, elapsed: float, size: int = 0) -> None:
+        """
+        Records an item successfully processed by a stage
+        :param name: stage name
+        :param elapsed: seconds spent processing the item
+        :param size: bytes processed with the item (optional)
+        """
+
+        self.stage(name).observe(elapsed, size)
+
+    def fail(self, name: str) -> None:
+        """
+        Records an item a stage failed to process
+        :param name: stage name
+        """
+
+        self.stage(name).fail()
+
+    def register(
+        self,
+        name: str,
+        description: str,
+        func: Callable[[], float],
+        kind: str = PROBE_KIND_GAUGE,
+        labels: Dict[str, str] | None = None,
+    ) -> None:
+        """
+        Registers a probe reading a value of the job state, replacing any with the same labels
+        :param name: metric name
+        :param description: metric description
+        :param func: function reading the current value
+        :param kind: whether the value can go up and down or only up (optional)
+        :param labels: dictionary of label name - value (optional)
+        """
+
+        if kind not in PROBE_KINDS:
+            raise ValueError(f"The probe kind must be one of {PROBE_KINDS}")
+
+        label_pairs = tuple(sorted((labels or {}).items()))
+
+        with self.lock:
+            self.probes[(name, label_pairs)] = Probe(name, description, func, kind, label_pairs)
+
+    def read_probes(self) -> List[Tuple[Probe, float]]:
+        """
+        Reads the current value of all the registered probes
+        :return: list of probes and their values
+        """
+
+        with self.lock:
+            probes = list(self.probes.values())
+
+        return [(probe, float(probe.func())) for probe in probes]
+
+    def timed_iter(
+        self,
+        name: str,
+        items: Iterable,
+        size: Callable[[Any], int] | None = None,
+    ) -> Iterable:
+        """
+        Wraps an iterable, recording the time spent producing each of its items
+        :param name: stage name
+        :param items: iterable of items (i.e. walked file entries)
+        :param size: function measuring the bytes of an item (optional)
+        :return: iterable of the same items
+        """
+
+        return self._iter_timed(name, items, size)
+
+    def _iter_timed(
+        self,
+        name: str,
+        items: Iterable,
+        size: Callable[[Any], int] | None,
+    ) -> Generator:
+        """
+        Iterates on the items of an iterable, recording the time spent producing each of them
+        :param name: stage name
+        :param items: iterable of items
+        :param size: function measuring the bytes of an item
+        :return: item
+        """
+
+        stage = self.stage(name)
+        iterator = iter(items)
+
+        while True:
+            start = time.perf_counter()
+
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+
+            stage.observe(time.perf_counter() - start, size(item) if size else 0)
+            yield item
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarizes the metrics of all the stages
+        :return: dictionary with the elapsed time and the metrics of each stage
+        """
+
+        elapsed = time.perf_counter() - self.start_time
+
+        with self.lock:
+            stages = list(self.stages.values())
+
+        return {
+            "elapsed": elapsed,
+            "stages": {stage.name: stage.summary(elapsed) for stage in stages},
+        }
+
+    def report(self) -> None:
+        """Logs the metrics of each stage as a JSON line"""
+
+        for stage in self.summary()["stages"].values():
+            logger.info(f"Metrics: {json.dumps(stage, sort_keys=True)}")
+
+    def dump(self, file_path: str | Path) -> None:
+        """
+        Writes the metrics summary to a JSON file
+        :param file_path: path to the JSON file
+        """
+
+        with open(file_path, "w") as file:
+            json.dump(self.summary(), file, indent=2, sort_keys=True)
+
+    def _run_reporter(self, report: Callable[[], None], interval: float) -> None:
+        """
+        Runs a report function every interval, until the recorder is closed
+        :param report: function reporting the metrics
+        :param interval: seconds between reports
+        """
+
+        while not self.stop_event.wait(interval):
+            try:
+                report()
+            except Exception as error:
+                logger.error(f"Cannot report the metrics: {error}")
+
+    def add_reporter(self, report: Callable[[], None], interval: float) -> None:
+        """
+        Starts running a report function periodically, on a background thread
+        :param report: function reporting the metrics (i.e. the report method)
+        :param interval: seconds between reports
+        """
+
+        if interval <= 0:
+            raise ValueError("The report interval must be a positive number")
+
+        reporter = threading.Thread(
+            target=self._run_reporter,
+            args=(report, interval),
+            name=f"metrics-reporter-{len(self.reporters)}",
+            daemon=True,
+        )
+        reporter.start()
+
+        self.reporters.append(reporter)
+
+    def close(self) -> None:
+        """Stops the periodic reports, if any"""
+
+        self.stop_event.set()
+
+        for reporter in self.reporters:
+            reporter.join()
+
+
+class NullMetricsRecorder(MetricsRecorder):
+    """
+    Metrics recorder discarding every measure, used when the metrics are disabled.
+    The instrumented code checks the enabled flag to skip taking time measures at all
+    """
+
+    enabled = False
+
+    def observe(self, name: str, elapsed: float, size: int = 0) -> None:
+        pass
+
+    def fail(self, name: str) -> None:
+        pass
+
+    def register(
+        self,
+        name: str,
+        description: str,
+        func: Callable[[], float],
+        kind: str = PROBE_KIND_GAUGE,
+        labels: Dict[str, str] | None = None,
+    ) -> None:
+        pass
+
+    def timed_iter(
+        self,
+        name: str,
+        items: Iterable,
+        size: Callable[[Any], int] | None = None,
+    ) -> Iterable:
+        return items
+
+
+# Recorder used by default, when the metrics are disabled
+NULL_METRICS = NullMetricsRecorder()
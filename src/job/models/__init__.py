@@ -4,3 +4,5 @@ from .arxiv import ArxivMetadata
 from .arxiv import ArxivMetadataAuthor
 from .arxiv import ArxivMetadataCategory
 from .arxiv import ArxivMetadataLink
+from .serializers import PaperMetadataSerializer
+from .serializers import get_metadata_serializer
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+from functools import cache
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from dialect_map_schemas import CategoryMembershipSchema
+from dialect_map_schemas import PaperSchema
+from dialect_map_schemas import PaperAuthorSchema
+from dialect_map_schemas import PaperMetadataSchema
+
+if TYPE_CHECKING:
+    from .arxiv import ArxivMetadata
+
+
+class PaperKeys(NamedTuple):
+    """Key names of a Paper record"""
+
+    arxiv_id: str
+    arxiv_rev: str
+    title: str
+    doi_id: str
+    revision_date: str
+    submission_date: str
+    created_at: str
+    updated_at: str
+
+
+class PaperAuthorKeys(NamedTuple):
+    """Key names of a PaperAuthor record"""
+
+    arxiv_id: str
+    arxiv_rev: str
+    author_name: str
+    created_at: str
+
+
+class CategoryMembershipKeys(NamedTuple):
+    """Key names of a CategoryMembership record"""
+
+    arxiv_id: str
+    arxiv_rev: str
+    category_id: str
+    created_at: str
+
+
+class PaperMetadataKeys(NamedTuple):
+    """Key names of a PaperMetadata record"""
+
+    paper: str
+    authors: str
+    memberships: str
+
+
+class PaperMetadataSerializer:
+    """
+    Class adapting ArXiv metadata objects into PaperMetadata records.
+    The record schemas are only instantiated once, to resolve their key names
+    """
+
+    def __init__(self):
+        """Initializes the serializer, resolving the key names of the record schemas"""
+
+        paper = PaperSchema()
+        author = PaperAuthorSchema()
+        membership = CategoryMembershipSchema()
+        metadata = PaperMetadataSchema()
+
+        self.paper_keys = PaperKeys(*(getattr(paper, f).name for f in PaperKeys._fields))
+        self.author_keys = PaperAuthorKeys(
+            *(getattr(author, f).name for f in PaperAuthorKeys._fields)
+        )
+        self.membership_keys = CategoryMembershipKeys(
+            *(getattr(membership, f).name for f in CategoryMembershipKeys._fields)
+        )
+        self.metadata_keys = PaperMetadataKeys(
+            *(getattr(metadata, f).name for f in PaperMetadataKeys._fields)
+        )
+
+    def serialize(self, meta: "ArxivMetadata") -> dict:
+        """
+        Builds a PaperMetadata record out of an ArXiv metadata object
+        :param meta: ArXiv metadata object
+        :return: PaperMetadata record
+        """
+
+        paper_keys = self.paper_keys
+        author_keys = self.author_keys
+        membership_keys = self.membership_keys
+
+        # Dates are formatted once per record
+        created_at = meta.paper_created_at.isoformat()
+        updated_at = meta.paper_updated_at.isoformat()
+
+        paper = {
+            paper_keys.arxiv_id: meta.paper_id,
+            paper_keys.arxiv_rev: meta.paper_rev,
+            paper_keys.title: meta.paper_title,
+            paper_keys.doi_id: meta.paper_doi,
+            paper_keys.revision_date: meta.paper_updated_at.date().isoformat(),
+            paper_keys.submission_date: meta.paper_created_at.date().isoformat(),
+            paper_keys.created_at: created_at,
+            paper_keys.updated_at: updated_at,
+        }
+
+        authors = [
+            {
+                author_keys.arxiv_id: meta.paper_id,
+                author_keys.arxiv_rev: meta.paper_rev,
+                author_keys.author_name: author.name,
+                author_keys.created_at: created_at,
+            }
+            for author in meta.paper_authors
+        ]
+
+        memberships = [
+            {
+                membership_keys.arxiv_id: meta.paper_id,
+                membership_keys.arxiv_rev: meta.paper_rev,
+                membership_keys.category_id: category.name,
+                membership_keys.created_at: created_at,
+            }
+            for category in meta.paper_categories
+        ]
+
+        return {
+            self.metadata_keys.paper: paper,
+            self.metadata_keys.authors: authors,
+            self.metadata_keys.memberships: memberships,
+        }
+
+
+@cache
+def get_metadata_serializer() -> PaperMetadataSerializer:
+    """
+    Gets the process-wide PaperMetadata serializer
+    :return: serializer object
+    """
+
+    return PaperMetadataSerializer()
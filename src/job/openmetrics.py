@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+import os
+import resource
+import sys
+import tempfile
+
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+from .metrics import LATENCY_PERCENTILES
+from .metrics import MetricsRecorder
+from .metrics import PROBE_KIND_COUNTER
+
+# Prefix of all the exported metric names
+METRIC_PREFIX = "dialect_map"
+
+# Metric sample: name suffix, labels and value
+Sample = Tuple[str, Tuple[Tuple[str, str], ...], float]
+
+
+def read_resident_memory() -> int:
+    """
+    Reads the resident memory of the current process.
+    Falls back to the peak resident memory on platforms without the /proc file system
+    :return: resident memory in bytes
+    """
+
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        pass
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # The peak resident memory is reported in bytes on macOS, and in KB elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss << 10
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Formats a set of metric labels with the Prometheus text syntax
+    :param labels: tuple of label name - value pairs
+    :return: formatted labels
+    """
+
+    if len(labels) == 0:
+        return ""
+
+    pairs = []
+
+    for name, value in labels:
+        value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_family(
+    name: str,
+    kind: str,
+    description: str,
+    samples: Sequence[Sample],
+) -> List[str]:
+    """
+    Formats a metric family with the Prometheus text syntax
+    :param name: metric family name, without prefix. Counters must include the '_total' suffix
+    :param kind: metric family type
+    :param description: metric family description
+    :param samples: list of sample suffix, labels and value
+    :return: list of text lines
+    """
+
+    family = f"{METRIC_PREFIX}_{name}"
+    lines = [f"# TYPE {family} {kind}", f"# HELP {family} {description}"]
+
+    for suffix, labels, value in samples:
+        lines.append(f"{family}{suffix}{_format_labels(labels)} {value}")
+
+    return lines
+
+
+def format_openmetrics(metrics: MetricsRecorder) -> str:
+    """
+    Formats the stage metrics and the probe values with the Prometheus text syntax.
+    Counter families are declared under their '_total' sample names, as the classic format
+    read by the node exporter textfile collector does not strip the suffix
+    :param metrics: metrics recorder
+    :return: Prometheus text exposition
+    """
+
+    summaries = list(metrics.summary()["stages"].values())
+    stage_labels = [(("stage", summary["stage"]),) for summary in summaries]
+
+    lines = []
+    lines += _format_family(
+        "stage_items_total",
+        PROBE_KIND_COUNTER,
+        "Items processed by each routine stage",
+        [("", labels, s["count"]) for labels, s in zip(stage_labels, summaries)],
+    )
+    lines += _format_family(
+        "stage_bytes_total",
+        PROBE_KIND_COUNTER,
+        "Bytes processed by each routine stage",
+        [("", labels, s["bytes"]) for labels, s in zip(stage_labels, summaries)],
+    )
+    lines += _format_family(
+        "stage_errors_total",
+        PROBE_KIND_COUNTER,
+        "Items each routine stage failed to process",
+        [("", labels, s["errors"]) for labels, s in zip(stage_labels, summaries)],
+    )
+
+    latency_samples: List[Sample] = []
+
+    for labels, summary in zip(stage_labels, summaries):
+        for percentile in LATENCY_PERCENTILES:
+            quantile = labels + (("quantile", str(percentile / 100)),)
+            latency_samples.append(("", quantile, summary["latency"][f"p{percentile}"]))
+
+        latency_samples.append(("_sum", labels, summary["busy_seconds"]))
+        latency_samples.append(("_count", labels, summary["count"]))
+
+    lines += _format_family(
+        "stage_latency_seconds",
+        "summary",
+        "Seconds spent processing each item, by routine stage",
+        latency_samples,
+    )
+
+    families: Dict[str, List] = {}
+
+    for probe, value in metrics.read_probes():
+        families.setdefault(probe.name, []).append((probe, value))
+
+    for name, probes in sorted(families.items()):
+        first_probe = probes[0][0]
+        if first_probe.kind == PROBE_KIND_COUNTER:
+            name = f"{name}_total"
+
+        lines += _format_family(
+            name,
+            first_probe.kind,
+            first_probe.description,
+            [("", probe.labels, value) for probe, value in probes],
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def write_openmetrics(metrics: MetricsRecorder, file_path: str | Path) -> None:
+    """
+    Writes the metrics Prometheus text exposition to a file, atomically replacing it.
+    Scrapers (i.e. the node exporter textfile collector) never read a partially written file
+    :param metrics: metrics recorder
+    :param file_path: path to the exposition file
+    """
+
+    file_path = Path(file_path)
+    contents = format_openmetrics(metrics)
+
+    # The temporary file must be on the same file system for the rename to be atomic
+    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.")
+
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(contents)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
 
 from .api import DialectMapOperator
+from .auth import Authenticator
+from .auth import NoAuthenticator
 from .files import LocalFileOperator
+from .manifest import FileManifest
+from .manifest import ManifestRecord
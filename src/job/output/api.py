@@ -1,23 +1,96 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
+import json
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Set
+
 from dialect_map_io import DialectMapAPIHandler
 from dialect_map_schemas import APIRoute
 
+from ..handlers import BulkDialectMapAPIHandler
+
 logger = logging.getLogger()
 
 
+@dataclass
+class RecordBuffer:
+    """
+    Object accumulating validated records to be sent to a bulk ingestion endpoint
+
+    :attr records: buffered records
+    :attr size: approximate JSON size of the buffered records in bytes
+    :attr timer: handle of the max-latency flush timer
+    """
+
+    records: List[dict] = field(default_factory=list)
+    size: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+
 class DialectMapOperator:
     """Class to operate on the Dialect map API"""
 
-    def __init__(self, api_handler: DialectMapAPIHandler):
+    def __init__(
+        self,
+        api_handler: DialectMapAPIHandler,
+        max_workers: int = 8,
+        bulk_size: int = 0,
+        bulk_bytes: int = 1 << 20,
+        bulk_latency: float = 1.0,
+    ):
         """
         Initializes the Dialect map API operator object
         :param api_handler: Dialect map API instantiated object
+        :param max_workers: maximum number of concurrent API requests (optional)
+        :param bulk_size: records per bulk request, 0 to send them one by one.
+            Bulk requests require a handler supporting them (optional)
+        :param bulk_bytes: maximum bytes per bulk request (optional)
+        :param bulk_latency: maximum seconds a record waits to be sent (optional)
         """
 
+        if max_workers < 1:
+            raise ValueError("The number of workers must be a positive integer")
+        if bulk_size < 0:
+            raise ValueError("The bulk size must be a non-negative integer")
+        if bulk_bytes < 1 or bulk_latency <= 0:
+            raise ValueError("The bulk limits must be positive numbers")
+        if bulk_size > 0 and not isinstance(api_handler, BulkDialectMapAPIHandler):
+            raise ValueError("The bulk requests require a bulk API handler")
+
         self.api_handler = api_handler
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="api")
+
+        self.bulk_size = bulk_size
+        self.bulk_bytes = bulk_bytes
+        self.bulk_latency = bulk_latency
+        self.bulk_buffers: Dict[str, RecordBuffer] = {}
+        self.bulk_flushes: Set[asyncio.Task] = set()
+        self.bulk_errors: List[BaseException] = []
+        self.schemas: Dict[str, Any] = {}
+
+    def _get_schema(self, record_route: APIRoute) -> Any:
+        """
+        Gets the schema of an API route, instantiating it only once
+        :param record_route: data record route
+        :return: schema object
+        """
+
+        schema = self.schemas.get(record_route.api_path)
+
+        if schema is None:
+            schema = record_route.schema()
+            self.schemas[record_route.api_path] = schema
+
+        return schema
 
     def _create(self, api_path: str, record: dict) -> None:
         """
@@ -33,6 +106,22 @@ class DialectMapOperator:
             logger.error(f"Error: {error}")
             raise
 
+    def _create_many(self, api_path: str, records: List[dict]) -> None:
+        """
+        Creates the given records on the bulk ingestion endpoint of the specified API path
+        :param api_path: API path to send the data
+        :param records: data records to send
+        """
+
+        assert isinstance(self.api_handler, BulkDialectMapAPIHandler)
+
+        try:
+            self.api_handler.create_records(api_path, records)
+        except Exception as error:
+            logger.error(f"Cannot create {len(records)} records on {api_path}")
+            logger.error(f"Error: {error}")
+            raise
+
     def _archive(self, api_path: str, record_id: str) -> None:
         """
         Archives an existing record on the specified API path
@@ -47,19 +136,97 @@ class DialectMapOperator:
             logger.error(f"Error: {error}")
             raise
 
-    async def create_record(self, record_route: APIRoute, record_data: dict) -> None:
+    async def _buffer(self, api_path: str, record: dict) -> None:
+        """
+        Buffers a validated record, sending the buffer when any of its limits is reached
+        :param api_path: API path to send the data
+        :param record: data record to send
+        """
+
+        buffer = self.bulk_buffers.setdefault(api_path, RecordBuffer())
+        buffer.records.append(record)
+        buffer.size += len(json.dumps(record, default=str))
+
+        if len(buffer.records) >= self.bulk_size or buffer.size >= self.bulk_bytes:
+            await self._flush_buffer(api_path)
+            return
+
+        if buffer.timer is None:
+            loop = asyncio.get_running_loop()
+            buffer.timer = loop.call_later(self.bulk_latency, self._schedule_flush, api_path)
+
+    def _schedule_flush(self, api_path: str) -> None:
+        """
+        Schedules the sending of a buffer once its maximum latency has expired
+        :param api_path: API path to send the data
+        """
+
+        task = asyncio.get_running_loop().create_task(self._flush_buffer(api_path))
+        task.add_done_callback(self._complete_flush)
+        self.bulk_flushes.add(task)
+
+    def _complete_flush(self, task: asyncio.Task) -> None:
+        """
+        Forgets a finished scheduled flush, keeping its error to be raised by the next flush
+        :param task: finished flush task
+        """
+
+        self.bulk_flushes.discard(task)
+
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error is not None:
+            self.bulk_errors.append(error)
+
+    async def _flush_buffer(self, api_path: str) -> None:
+        """
+        Sends the buffered records of an API path in a single bulk request
+        :param api_path: API path to send the data
+        """
+
+        buffer = self.bulk_buffers.pop(api_path, None)
+        if buffer is None or len(buffer.records) == 0:
+            return
+
+        if buffer.timer is not None:
+            buffer.timer.cancel()
+
+        await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            self._create_many,
+            api_path,
+            buffer.records,
+        )
+
+    async def create_record(
+        self,
+        record_route: APIRoute,
+        record_data: dict,
+        trusted: bool = False,
+    ) -> None:
         """
         Performs the creation of a record on a REST API
-        :param record_data: data record
         :param record_route: data record route
+        :param record_data: data record
+        :param trusted: whether the record was built by a serializer, skipping validation
         """
 
-        record_schema = record_route.schema()
-        record_data = record_schema.load(record_data)
+        if not trusted:
+            record_schema = self._get_schema(record_route)
+            record_data = record_schema.load(record_data)
+            record_data = record_schema.dump(record_data)
+
+        if self.bulk_size > 0:
+            await self._buffer(record_route.api_path, record_data)
+            return
 
-        self._create(
+        await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            self._create,
             record_route.api_path,
-            record_schema.dump(record_data),
+            record_data,
         )
 
     async def archive_record(self, record_route: APIRoute, record_data: dict) -> None:
@@ -69,10 +236,56 @@ class DialectMapOperator:
         :param record_route: data record route
         """
 
-        record_schema = record_route.schema()
+        record_schema = self._get_schema(record_route)
         schema_id_field = record_schema.schema_id
 
-        self._archive(
+        await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            self._archive,
             record_route.api_path,
             record_data[schema_id_field],
         )
+
+    async def flush(self) -> None:
+        """
+        Sends all the buffered records, waiting for the pending bulk requests.
+        Raises the first error of the bulk requests scheduled by their latency limit
+        """
+
+        for api_path in list(self.bulk_buffers.keys()):
+            await self._flush_buffer(api_path)
+
+        if len(self.bulk_flushes) > 0:
+            await asyncio.gather(*self.bulk_flushes, return_exceptions=True)
+
+        if len(self.bulk_errors) > 0:
+            error = self.bulk_errors[0]
+            self.bulk_errors.clear()
+            raise error
+
+    def discard(self) -> None:
+        """Drops all the buffered records, logging them, once their sending has been aborted"""
+
+        for api_path, buffer in self.bulk_buffers.items():
+            if buffer.timer is not None:
+                buffer.timer.cancel()
+
+            logger.error(f"Dropped {len(buffer.records)} buffered records of {api_path}")
+            logger.error(f"Records: {buffer.records}")
+
+        self.bulk_buffers.clear()
+
+    async def __aenter__(self) -> "DialectMapOperator":
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, *args) -> None:
+        # Buffered records are only sent if every record was created successfully
+        if exc_type is None:
+            await self.flush()
+        else:
+            self.discard()
+
+    def close(self) -> None:
+        """Waits for the pending API requests and releases the request threads"""
+
+        self.executor.shutdown(wait=True)
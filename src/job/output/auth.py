@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from datetime import timezone
+from typing import Protocol
+
+
+class Authenticator(Protocol):
+    """Interface of the authenticators providing the Dialect map API tokens"""
+
+    def check_expired(self) -> bool:
+        """
+        Checks whether the token has expired
+        :return: whether the token has expired
+        """
+
+        ...
+
+    def get_token(self) -> str:
+        """
+        Gets the current token
+        :return: token
+        """
+
+        ...
+
+    def refresh_token(self) -> str:
+        """
+        Refreshes the token
+        :return: token
+        """
+
+        ...
+
+
+class NoAuthenticator(Authenticator):
+    """
+    Authenticator providing an empty, never expiring token.
+    Meant for API servers without authentication (i.e. local stand-in servers)
+    """
+
+    def __init__(self, token: str = ""):
+        """
+        Initializes the authenticator
+        :param token: static token to provide (optional)
+        """
+
+        self.token = token
+        self.expiration = datetime.max.replace(tzinfo=timezone.utc)
+
+    def check_expired(self) -> bool:
+        """
+        Checks whether the token has expired
+        :return: always False
+        """
+
+        return False
+
+    def get_token(self) -> str:
+        """
+        Gets the static token
+        :return: token
+        """
+
+        return self.token
+
+    def refresh_token(self) -> str:
+        """
+        Refreshes the static token, a no-op
+        :return: token
+        """
+
+        return self.token
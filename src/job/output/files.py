@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import os
 
 from pathlib import Path
+from typing import Iterable
 from dialect_map_io import BaseFileHandler
 
+from ..handlers import StreamingTextFileHandler
+
 logger = logging.getLogger()
 
 
@@ -30,20 +34,79 @@ class LocalFileOperator:
 
         return Path(self.destination, file_name)
 
-    def write_text(self, file_name: str, text: str) -> None:
+    @staticmethod
+    def _build_temp_path(file_path: Path) -> Path:
+        """
+        Builds the temporary path where a file is written before being moved into place,
+        so interrupted writes never leave partial files
+        :param file_path: complete file path
+        :return: complete temporary file path
+        """
+
+        temp_path = file_path.with_name(f".{file_path.name}.tmp")
+        temp_path.parent.mkdir(parents=True, exist_ok=True)
+
+        return temp_path
+
+    def _check_path(self, file_name: str, overwrite: bool) -> Path | None:
+        """
+        Builds the complete path of a file, unless it already exists and cannot be replaced
+        :param file_name: file name
+        :param overwrite: whether to replace an already existing file
+        :return: complete file path
+        """
+
+        file_path = self._build_path(file_name)
+
+        if file_path.exists() and not overwrite:
+            logger.warning(f"File {file_path} already exists")
+            return None
+
+        return file_path
+
+    def write_text(self, file_name: str, text: str, overwrite: bool = False) -> None:
         """
         Writes the given text into the desired file name
         :param file_name: name for the output file
         :param text: content for the output file
+        :param overwrite: whether to replace an already existing file (optional)
         """
 
-        file_path = self._build_path(file_name)
-
-        if not file_path.exists():
-            logging.warning(f"File {file_path} already exists")
+        file_path = self._check_path(file_name, overwrite)
+        if file_path is None:
             return
 
+        temp_path = self._build_temp_path(file_path)
+
         self.file_handler.write_file(
-            file_path=str(file_path),
+            file_path=str(temp_path),
             content=text,
         )
+
+        os.replace(temp_path, file_path)
+
+    def write_chunks(self, file_name: str, chunks: Iterable[str], overwrite: bool = False) -> None:
+        """
+        Writes the given text chunks into the desired file name, appending one at a time.
+        Handlers unable to write files chunk by chunk write the joined chunks at once
+        :param file_name: name for the output file
+        :param chunks: content for the output file, in chunks
+        :param overwrite: whether to replace an already existing file (optional)
+        """
+
+        if not isinstance(self.file_handler, StreamingTextFileHandler):
+            self.write_text(file_name, "".join(chunks), overwrite)
+            return
+
+        file_path = self._check_path(file_name, overwrite)
+        if file_path is None:
+            return
+
+        temp_path = self._build_temp_path(file_path)
+
+        self.file_handler.write_chunks(
+            file_path=str(temp_path),
+            chunks=chunks,
+        )
+
+        os.replace(temp_path, file_path)
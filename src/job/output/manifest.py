@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import sqlite3
+import threading
+import time
+
+from pathlib import Path
+from typing import NamedTuple
+
+logger = logging.getLogger()
+
+
+class ManifestRecord(NamedTuple):
+    """
+    Object containing the manifest information of a converted file
+
+    :attr path: source file path, relative to the corpus root
+    :attr size: source file size in bytes
+    :attr mtime_ns: source file modification time in nanoseconds
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+
+
+class FileManifest:
+    """Class to keep track of the converted files on a local SQLite database"""
+
+    def __init__(self, db_path: str | Path):
+        """
+        Initializes the manifest, creating the underlying database if necessary
+        :param db_path: path to the SQLite database file
+        """
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.db_path = str(db_path)
+        self.db_lock = threading.Lock()
+        self.db_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.db_conn.execute("PRAGMA journal_mode=WAL")
+        self.db_conn.execute("PRAGMA synchronous=NORMAL")
+        self.db_conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, "
+            "size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, "
+            "converted_at REAL NOT NULL)"
+        )
+        self.db_conn.execute(
+            "CREATE TABLE IF NOT EXISTS quarantine ("
+            "path TEXT PRIMARY KEY, "
+            "size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, "
+            "reason TEXT NOT NULL, "
+            "quarantined_at REAL NOT NULL)"
+        )
+        self.db_conn.commit()
+
+    def __enter__(self) -> "FileManifest":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self.db_lock:
+            return self.db_conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def get(self, path: str) -> ManifestRecord | None:
+        """
+        Gets the manifest record of a source file, if any
+        :param path: source file path, relative to the corpus root
+        :return: manifest record
+        """
+
+        with self.db_lock:
+            row = self.db_conn.execute(
+                "SELECT path, size, mtime_ns FROM files WHERE path = ?",
+                (path,),
+            ).fetchone()
+
+        return ManifestRecord(*row) if row is not None else None
+
+    def is_converted(self, path: str, size: int, mtime_ns: int) -> bool:
+        """
+        Checks whether a source file was converted and has not changed since
+        :param path: source file path, relative to the corpus root
+        :param size: current source file size in bytes
+        :param mtime_ns: current source file modification time in nanoseconds
+        :return: whether the file can be skipped
+        """
+
+        record = self.get(path)
+
+        if record is None:
+            return False
+
+        return record.size == size and record.mtime_ns == mtime_ns
+
+    def is_quarantined(self, path: str, size: int, mtime_ns: int) -> bool:
+        """
+        Checks whether a source file failed to be converted and has not changed since
+        :param path: source file path, relative to the corpus root
+        :param size: current source file size in bytes
+        :param mtime_ns: current source file modification time in nanoseconds
+        :return: whether the file can be skipped
+        """
+
+        with self.db_lock:
+            row = self.db_conn.execute(
+                "SELECT 1 FROM quarantine WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, size, mtime_ns),
+            ).fetchone()
+
+        return row is not None
+
+    def quarantine(self, path: str, size: int, mtime_ns: int, reason: str) -> None:
+        """
+        Adds or replaces the quarantine record of a file that failed to be converted
+        :param path: source file path, relative to the corpus root
+        :param size: source file size in bytes
+        :param mtime_ns: source file modification time in nanoseconds
+        :param reason: conversion failure description
+        """
+
+        with self.db_lock, self.db_conn:
+            self.db_conn.execute(
+                "INSERT OR REPLACE INTO quarantine VALUES (?, ?, ?, ?, ?)",
+                (path, size, mtime_ns, reason, time.time()),
+            )
+
+    def add(self, record: ManifestRecord) -> None:
+        """
+        Adds or replaces the manifest record of a converted file
+        :param record: manifest record
+        """
+
+        with self.db_lock, self.db_conn:
+            self.db_conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                (*record, time.time()),
+            )
+            self.db_conn.execute("DELETE FROM quarantine WHERE path = ?", (record.path,))
+
+    def close(self) -> None:
+        """Closes the underlying database connection"""
+
+        self.db_conn.close()
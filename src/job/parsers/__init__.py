@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from .atom import AtomMetadataParser
 from .base import BaseMetadataParser
 from .feed import FeedMetadataParser
 from .json import JSONMetadataParser
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+import io
+import logging
+
+from typing import List
+from typing import override
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import iterparse
+
+from .feed import FeedMetadataParser
+from ..models import ArxivMetadata
+from ..models import ArxivMetadataAuthor
+from ..models import ArxivMetadataLink
+
+logger = logging.getLogger()
+
+# XML namespaces of the ArXiv feed elements
+ATOM_NAMESPACE = "{http://www.w3.org/2005/Atom}"
+ARXIV_NAMESPACE = "{http://arxiv.org/schemas/atom}"
+
+# Link type assumed when the link element does not specify one (as feedparser does)
+DEFAULT_LINK_TYPE = "text/html"
+
+
+class AtomMetadataParser(FeedMetadataParser):
+    """
+    Class implementing the Atom 1.0 parsing functionality for the ArXiv feed,
+    with an incremental XML parser only extracting the fields of the metadata objects.
+    Its output is equivalent to the one of the feedparser based FeedMetadataParser
+    """
+
+    @staticmethod
+    def _find_text(entry: Element, tag: str) -> str | None:
+        """
+        Finds the stripped text of an entry child element
+        :param entry: feed <entry> element
+        :param tag: namespaced tag of the child element
+        :return: stripped text, or None if the element is missing
+        """
+
+        element = entry.find(tag)
+
+        if element is None:
+            return None
+
+        return (element.text or "").strip()
+
+    def _extract_entry_doi(self, entry: Element, entry_id: str) -> str:
+        """
+        Extract the paper DOI from the value found on the <entry> element
+        :param entry: feed <entry> element
+        :param entry_id: value found on <entry>.<id>
+        :return: paper DOI
+        """
+
+        paper_doi = self._find_text(entry, f"{ARXIV_NAMESPACE}doi")
+
+        if paper_doi is None:
+            paper_doi = ""
+            paper_id = self._extract_id(entry_id)
+            logger.info(f"Paper {paper_id} does not specify a DOI")
+
+        return paper_doi
+
+    def _parse_entry(self, entry: Element) -> ArxivMetadata | None:
+        """
+        Parses a feed <entry> element
+        :param entry: feed <entry> element
+        :return: parsed metadata object, or None if the entry is not a paper
+        """
+
+        entry_id = self._find_text(entry, f"{ATOM_NAMESPACE}id") or ""
+        title = self._find_text(entry, f"{ATOM_NAMESPACE}title") or ""
+        summary = self._find_text(entry, f"{ATOM_NAMESPACE}summary") or ""
+        published = self._find_text(entry, f"{ATOM_NAMESPACE}published") or ""
+        updated = self._find_text(entry, f"{ATOM_NAMESPACE}updated") or ""
+
+        if not self.entry_id_prefix.match(entry_id):
+            logger.error(f"Feed entry {entry_id} is not an ArXiv paper: {summary}")
+            return None
+
+        categos = tuple(
+            self._build_category(tag.get("term", ""))
+            for tag in entry.iterfind(f"{ATOM_NAMESPACE}category")
+        )
+        authors = tuple(
+            ArxivMetadataAuthor(self._find_text(author, f"{ATOM_NAMESPACE}name") or "")
+            for author in entry.iterfind(f"{ATOM_NAMESPACE}author")
+        )
+        links = tuple(
+            ArxivMetadataLink(link.get("href", ""), link.get("type", DEFAULT_LINK_TYPE))
+            for link in entry.iterfind(f"{ATOM_NAMESPACE}link")
+        )
+
+        return ArxivMetadata(
+            paper_id=self._extract_id(entry_id),
+            paper_rev=self._extract_rev(entry_id),
+            paper_doi=self._extract_entry_doi(entry, entry_id),
+            paper_title=self._parse_string(title),
+            paper_description=self._parse_string(summary),
+            paper_categories=categos,
+            paper_authors=authors,
+            paper_links=links,
+            paper_created_at=self._parse_date(published),
+            paper_updated_at=self._parse_date(updated),
+        )
+
+    @override
+    def parse_body(self, feed: str | bytes) -> List[ArxivMetadata]:
+        """
+        Parses the body section of a given feed API result
+        :param feed: metadata string for a given paper
+        :return: parsed metadata objects
+        """
+
+        papers = []
+
+        if isinstance(feed, str):
+            feed = feed.encode("utf-8")
+
+        for _, element in iterparse(io.BytesIO(feed), events=("end",)):
+            if element.tag != f"{ATOM_NAMESPACE}entry":
+                continue
+
+            paper = self._parse_entry(element)
+            if paper is not None:
+                papers.append(paper)
+
+            # Release the already parsed entry subtree
+            element.clear()
+
+        return papers
@@ -6,8 +6,13 @@ import re
 from abc import ABC
 from abc import abstractmethod
 from datetime import datetime
-from datetime import timezone
+from functools import lru_cache
 from typing import Any
+from typing import Dict
+from typing import List
+
+from .dates import parse_iso_date
+from ..models import ArxivMetadataCategory
 
 logger = logging.getLogger()
 
@@ -24,14 +29,24 @@ class BaseMetadataParser(ABC):
         """
 
         try:
-            off_date = datetime.fromisoformat(date_string)
-            utc_date = datetime.fromtimestamp(off_date.timestamp(), timezone.utc)
+            utc_date = parse_iso_date(date_string)
         except Exception as err:
             logger.error(err)
             raise err
 
         return utc_date
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _build_category(name: str) -> ArxivMetadataCategory:
+        """
+        Builds a category object, reusing the instances of previously seen categories
+        :param name: name of the category
+        :return: category object
+        """
+
+        return ArxivMetadataCategory(name)
+
     @staticmethod
     def _parse_string(long_string: str) -> str:
         """
@@ -42,6 +57,20 @@ class BaseMetadataParser(ABC):
 
         return re.sub(r"\s\s+", " ", long_string)
 
+    def parse_grouped(self, metadata: Any) -> Dict[str, List]:
+        """
+        Parses the sections of a metadata record grouping the objects by paper ID
+        :param metadata: external metadata record
+        :return: dictionary of paper ID - parsed metadata objects
+        """
+
+        groups: Dict[str, List] = {}
+
+        for paper in self.parse_body(metadata):
+            groups.setdefault(paper.paper_id, []).append(paper)
+
+        return groups
+
     @abstractmethod
     def parse_body(self, metadata: Any) -> list:
         """
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from datetime import timezone
+from functools import lru_cache
+
+import pytz
+
+# Number of distinct date strings memoized per format
+DATE_CACHE_SIZE = 8192
+
+# Format of the Kaggle snapshot version dates (i.e. "Mon, 2 Apr 2007 19:18:42 GMT")
+RFC_2822_FORMAT = "%a, %d %b %Y %H:%M:%S %Z"
+
+MONTH_NUMBERS = {
+    month: number
+    for number, month in enumerate(
+        ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
+        start=1,
+    )
+}
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_iso_date(date_string: str) -> datetime:
+    """
+    Parses an ISO-8601 date string (ArXiv Atom feed dates) to a UTC datetime object.
+    Naive dates are considered to be in local time
+    :param date_string: date in ISO-8601 format
+    :return: UTC datetime object
+    """
+
+    return datetime.fromisoformat(date_string).astimezone(timezone.utc)
+
+
+def _parse_gmt_date(date_string: str) -> datetime | None:
+    """
+    Parses a GMT RFC-2822 date string straight into a UTC datetime object
+    :param date_string: date in RFC-2822 format
+    :return: UTC datetime object, or None if the string is not a regular GMT date
+    """
+
+    parts = date_string.split()
+
+    if len(parts) != 6 or parts[5] != "GMT":
+        return None
+
+    try:
+        hour, minute, second = parts[4].split(":")
+        return datetime(
+            int(parts[3]),
+            MONTH_NUMBERS[parts[2]],
+            int(parts[1]),
+            int(hour),
+            int(minute),
+            int(second),
+            tzinfo=timezone.utc,
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_rfc2822_date(date_string: str) -> datetime:
+    """
+    Parses an RFC-2822 date string (Kaggle snapshot dates) to a UTC datetime object
+    :param date_string: date in RFC-2822 format, with a timezone abbreviation
+    :return: UTC datetime object
+    """
+
+    # Most snapshot dates are in GMT, skipping the timezone lookup
+    utc_date = _parse_gmt_date(date_string)
+    if utc_date is not None:
+        return utc_date
+
+    # Extracting the timezone out of the string
+    dt = date_string[:-3].strip()
+    tz = date_string[-3:].strip()
+
+    off_date = datetime.strptime(dt, RFC_2822_FORMAT[:-3])
+    off_date = off_date.replace(tzinfo=pytz.timezone(tz))
+
+    return off_date.astimezone(timezone.utc)
@@ -13,7 +13,6 @@ from feedparser import parse as feed_parse
 from .base import BaseMetadataParser
 from ..models import ArxivMetadata
 from ..models import ArxivMetadataAuthor
-from ..models import ArxivMetadataCategory
 from ..models import ArxivMetadataLink
 
 logger = logging.getLogger()
@@ -95,9 +94,13 @@ class FeedMetadataParser(BaseMetadataParser):
         parsed = feed_parse(feed)
 
         for entry in parsed.entries:
-            categos = [ArxivMetadataCategory(tag.term) for tag in entry.tags]
-            authors = [ArxivMetadataAuthor(author.name) for author in entry.authors]
-            links = [ArxivMetadataLink(l["href"], l["type"]) for l in entry.links]
+            if not self.entry_id_prefix.match(entry.id):
+                logger.error(f"Feed entry {entry.id} is not an ArXiv paper: {entry.summary}")
+                continue
+
+            categos = tuple(self._build_category(tag.term) for tag in entry.tags)
+            authors = tuple(ArxivMetadataAuthor(author.name) for author in entry.authors)
+            links = tuple(ArxivMetadataLink(l["href"], l["type"]) for l in entry.links)
 
             paper = ArxivMetadata(
                 paper_id=self._extract_id(entry.id),
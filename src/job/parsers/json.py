@@ -4,15 +4,16 @@ import logging
 import re
 
 from datetime import datetime
+from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Mapping
 from typing import override
 
-import pytz
-
 from .base import BaseMetadataParser
+from .dates import parse_rfc2822_date
 from ..models import ArxivMetadata
 from ..models import ArxivMetadataAuthor
-from ..models import ArxivMetadataCategory
 
 logger = logging.getLogger()
 
@@ -26,7 +27,6 @@ class JSONMetadataParser(BaseMetadataParser):
     def __init__(self):
         """Initializes the Arxiv json metadata parser object"""
 
-        self.entry_dt_format = "%a, %d %b %Y %H:%M:%S %Z"
         self.entry_rev_regex = re.compile(r"v(\d+)")
 
     @staticmethod
@@ -45,25 +45,15 @@ class JSONMetadataParser(BaseMetadataParser):
             for first_name, last_name in zip(author_first_names, author_last_names)
         ]
 
-    def _extract_date(self, date: str) -> datetime:
+    @staticmethod
+    def _extract_date(date: str) -> datetime:
         """
         Parses a date string to a UTC datetime object
         :param date: string date to parse
         :return: UTC datetime object
         """
 
-        # Extracting the timezone out of the string
-        dt = date[:-3].strip()
-        tz = date[-3:].strip()
-
-        # Pruning the timezone out of the format
-        fmt = self.entry_dt_format[:-3]
-
-        off_date = datetime.strptime(dt, fmt)
-        off_date = off_date.replace(tzinfo=pytz.timezone(tz))
-        utc_date = self._parse_date(off_date.isoformat())
-
-        return utc_date
+        return parse_rfc2822_date(date)
 
     def _extract_rev(self, version: str) -> int:
         """
@@ -72,6 +62,9 @@ class JSONMetadataParser(BaseMetadataParser):
         :return: paper revision
         """
 
+        if version[:1] == "v" and version[1:].isdigit():
+            return int(version[1:])
+
         rev = re.search(self.entry_rev_regex, version)
         rev = rev.group(1) if rev is not None else 1
 
@@ -93,30 +86,38 @@ class JSONMetadataParser(BaseMetadataParser):
 
         return paper_doi
 
-    @override
-    def parse_body(self, entry: dict) -> List[ArxivMetadata]:
+    def _build_papers(self, entry: dict, dates: Mapping[str, datetime]) -> List[ArxivMetadata]:
         """
-        Parses the metadata fields of a given metadata JSON entry
+        Builds the metadata objects of every revision of a given metadata JSON entry
         :param entry: metadata fields of a given paper
+        :param dates: dictionary of version date string - parsed UTC datetime
         :return: parsed metadata objects
         """
 
         papers = []
         created = None
 
+        # Fields shared by all the paper revisions
+        paper_id = entry["id"]
+        paper_doi = self._extract_doi(entry)
+        title = self._parse_string(entry["title"])
+        description = self._parse_string(entry["abstract"])
+        categos = tuple(self._build_category(c) for c in entry["categories"].split())
+        authors = tuple(
+            ArxivMetadataAuthor(a) for a in self._parse_authors(entry["authors_parsed"])
+        )
+        links = ()
+
         for version in entry["versions"]:
-            created = self._extract_date(version["created"]) if created is None else created
-            updated = self._extract_date(version["created"])
-            categos = [ArxivMetadataCategory(c) for c in entry["categories"].split()]
-            authors = [ArxivMetadataAuthor(a) for a in self._parse_authors(entry["authors_parsed"])]
-            links = []  # type: ignore
+            updated = dates[version["created"]]
+            created = updated if created is None else created
 
             paper = ArxivMetadata(
-                paper_id=entry["id"],
+                paper_id=paper_id,
                 paper_rev=self._extract_rev(version["version"]),
-                paper_doi=self._extract_doi(entry),
-                paper_title=self._parse_string(entry["title"]),
-                paper_description=self._parse_string(entry["abstract"]),
+                paper_doi=paper_doi,
+                paper_title=title,
+                paper_description=description,
                 paper_categories=categos,
                 paper_authors=authors,
                 paper_links=links,
@@ -127,3 +128,40 @@ class JSONMetadataParser(BaseMetadataParser):
             papers.append(paper)
 
         return papers
+
+    def _parse_dates(self, entries: Iterable[dict]) -> Dict[str, datetime]:
+        """
+        Parses the distinct version dates of several metadata JSON entries
+        :param entries: metadata fields of several papers
+        :return: dictionary of version date string - parsed UTC datetime
+        """
+
+        dates = {version["created"] for entry in entries for version in entry["versions"]}
+        return {date: self._extract_date(date) for date in dates}
+
+    @override
+    def parse_body(self, entry: dict) -> List[ArxivMetadata]:
+        """
+        Parses the metadata fields of a given metadata JSON entry
+        :param entry: metadata fields of a given paper
+        :return: parsed metadata objects
+        """
+
+        return self._build_papers(entry, self._parse_dates([entry]))
+
+    def parse_many(self, entries: Iterable[dict]) -> List[ArxivMetadata]:
+        """
+        Parses the metadata fields of several metadata JSON entries at once,
+        parsing each distinct version date a single time
+        :param entries: metadata fields of several papers
+        :return: parsed metadata objects, of all the paper revisions
+        """
+
+        entries = list(entries)
+        dates = self._parse_dates(entries)
+        papers = []
+
+        for entry in entries:
+            papers.extend(self._build_papers(entry, dates))
+
+        return papers
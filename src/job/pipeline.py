@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import queue
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+from .metrics import MetricsRecorder
+from .metrics import NULL_METRICS
+
+logger = logging.getLogger()
+
+# Kinds of workers a stage can run its items with
+STAGE_KIND_THREAD = "thread"
+STAGE_KIND_PROCESS = "process"
+STAGE_KINDS = [STAGE_KIND_THREAD, STAGE_KIND_PROCESS]
+
+# Markers travelling through the stage queues
+_END = object()
+_EMPTY = object()
+
+# Seconds between checks of the pipeline stop flag while blocked
+_POLL_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    Object describing a step of a pipeline
+
+    :attr name: stage name, used on logs
+    :attr func: function transforming an item. Returning None drops the item
+    :attr workers: number of threads or processes running the function
+    :attr kind: whether the function runs on threads (I/O) or processes (CPU)
+    :attr executor: factory of the process stage executor (optional)
+    :attr on_error: function called with the failed item and error (optional).
+    Its return value, if not None, is passed downstream. Without it, errors stop the pipeline
+    :attr size: function measuring the bytes of an item, for the throughput metrics (optional)
+    """
+
+    name: str
+    func: Callable
+    workers: int = 1
+    kind: str = STAGE_KIND_THREAD
+    executor: Callable[[], Executor] | None = None
+    on_error: Callable[[Any, Exception], Any] | None = None
+    size: Callable[[Any], int] | None = None
+
+
+class Pipeline:
+    """
+    Chain of stages connected by bounded queues, consumed as an iterator.
+    Each stage runs on its own workers, so a slow stage only blocks the others
+    once the queues around it are full (back-pressure) instead of on every item
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        buffer_size: int = 100,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
+        """
+        Initializes the pipeline
+        :param stages: ordered list of stages
+        :param buffer_size: maximum items queued between consecutive stages (optional)
+        :param metrics: recorder of the stage latencies and errors (optional)
+        """
+
+        if len(stages) == 0:
+            raise ValueError("The pipeline must have at least one stage")
+        if buffer_size < 1:
+            raise ValueError("The buffer size must be a positive integer")
+
+        for stage in stages:
+            if stage.workers < 1:
+                raise ValueError(f"The {stage.name} stage workers must be a positive integer")
+            if stage.kind not in STAGE_KINDS:
+                raise ValueError(f"The {stage.name} stage kind must be one of {STAGE_KINDS}")
+
+        self.stages = stages
+        self.buffer_size = buffer_size
+        self.metrics = metrics
+        self.queues: List[queue.Queue] = []
+        self.threads: List[threading.Thread] = []
+        self.active: List[int] = []
+        self.counts: Dict[str, int] = {}
+        self.errors: List[BaseException] = []
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __iter__(self) -> "Pipeline":
+        return self
+
+    def __next__(self) -> Any:
+        item = self._get(self.queues[-1])
+
+        if item is _END:
+            self._raise_errors()
+            raise StopIteration
+
+        return item
+
+    def _get(self, items: queue.Queue, block: bool = True) -> Any:
+        """
+        Gets the next item of a queue, unless the pipeline stops
+        :param items: queue to get the item from
+        :param block: whether to wait for an item to be available (optional)
+        :return: queued item, _EMPTY if not blocking, or _END if stopped
+        """
+
+        while not self.stop_event.is_set():
+            try:
+                return items.get(timeout=_POLL_INTERVAL) if block else items.get_nowait()
+            except queue.Empty:
+                if not block:
+                    return _EMPTY
+
+        return _END
+
+    def _put(self, items: queue.Queue, item: Any) -> bool:
+        """
+        Puts an item in a queue, unless the pipeline stops
+        :param items: queue to put the item in
+        :param item: item to put
+        :return: whether the item was put
+        """
+
+        while not self.stop_event.is_set():
+            try:
+                items.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def _fail(self, error: BaseException) -> None:
+        """
+        Records a pipeline error and stops all the stages
+        :param error: error raised by a stage
+        """
+
+        with self.lock:
+            self.errors.append(error)
+            self.stop_event.set()
+
+    def _raise_errors(self) -> None:
+        """Raises the first error recorded by the stages, if any"""
+
+        if len(self.errors) > 0:
+            raise self.errors[0]
+
+    def _release(self, index: int) -> None:
+        """
+        Marks a stage worker as finished, closing the stage output when it was the last one
+        :param index: stage index
+        """
+
+        with self.lock:
+            self.active[index] -= 1
+            last = self.active[index] == 0
+
+        if last:
+            self._put(self.queues[index + 1], _END)
+
+    def _observe(self, stage: Stage, item: Any, start: float, failed: bool) -> None:
+        """
+        Records the latency or failure of an item processed by a stage, if metrics are enabled
+        :param stage: stage the item was processed by
+        :param item: processed item
+        :param start: performance counter value when the item started being processed
+        :param failed: whether the stage function raised an error
+        """
+
+        if failed:
+            self.metrics.fail(stage.name)
+            return
+
+        size = stage.size(item) if stage.size is not None else 0
+        self.metrics.observe(stage.name, time.perf_counter() - start, size)
+
+    def _forward(self, index: int, item: Any) -> bool:
+        """
+        Passes an item processed by a stage to the next one, dropping None items
+        :param index: stage index
+        :param item: processed item
+        :return: whether the pipeline is still running
+        """
+
+        if item is None:
+            return True
+
+        with self.lock:
+            self.counts[self.stages[index].name] += 1
+
+        return self._put(self.queues[index + 1], item)
+
+    def _feed(self, source: Iterable) -> None:
+        """
+        Puts the source items in the first stage queue
+        :param source: iterable of items
+        """
+
+        try:
+            for item in source:
+                if not self._put(self.queues[0], item):
+                    break
+        except BaseException as error:
+            self._fail(error)
+        finally:
+            self._put(self.queues[0], _END)
+
+    def _run_thread_worker(self, index: int) -> None:
+        """
+        Runs the function of a thread stage on its queued items
+        :param index: stage index
+        """
+
+        stage = self.stages[index]
+        items = self.queues[index]
+        timed = self.metrics.enabled
+
+        try:
+            while (item := self._get(items)) is not _END:
+                start = time.perf_counter() if timed else 0.0
+
+                try:
+                    result = stage.func(item)
+                except Exception as error:
+                    if timed:
+                        self._observe(stage, item, start, failed=True)
+                    if stage.on_error is None:
+                        raise
+                    result = stage.on_error(item, error)
+                else:
+                    if timed:
+                        self._observe(stage, item, start, failed=False)
+
+                if not self._forward(index, result):
+                    break
+            else:
+                # Let the sibling workers see the end of the stream
+                self._put(items, _END)
+        except BaseException as error:
+            self._fail(error)
+        finally:
+            self._release(index)
+
+    def _collect(self, index: int, future: Future, item: Any, start: float) -> bool:
+        """
+        Collects the outcome of a process stage future
+        :param index: stage index
+        :param future: item future
+        :param item: item the future was submitted with
+        :param start: performance counter value when the future was submitted
+        :return: whether the pipeline is still running
+        """
+
+        stage = self.stages[index]
+        timed = self.metrics.enabled
+
+        try:
+            result = future.result()
+        except Exception as error:
+            if timed:
+                self._observe(stage, item, start, failed=True)
+            if stage.on_error is None:
+                raise
+            result = stage.on_error(item, error)
+        else:
+            if timed:
+                self._observe(stage, item, start, failed=False)
+
+        return self._forward(index, result)
+
+    def _run_process_dispatcher(self, index: int) -> None:
+        """
+        Submits the queued items of a process stage to its executor, bounding those in flight
+        :param index: stage index
+        """
+
+        stage = self.stages[index]
+        items = self.queues[index]
+        pending: Dict[Future, Tuple[Any, float]] = {}
+        exhausted = False
+
+        if stage.executor is not None:
+            executor = stage.executor()
+        else:
+            executor = ProcessPoolExecutor(stage.workers)
+
+        try:
+            while not self.stop_event.is_set() and (not exhausted or len(pending) > 0):
+                while not exhausted and len(pending) < stage.workers * 2:
+                    item = self._get(items, block=len(pending) == 0)
+                    if item is _EMPTY:
+                        break
+                    if item is _END:
+                        exhausted = True
+                        break
+                    # Process stage latencies span from the item submission to its result
+                    pending[executor.submit(stage.func, item)] = (item, time.perf_counter())
+
+                if len(pending) == 0:
+                    continue
+
+                done, _ = wait(pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if not self._collect(index, future, *pending.pop(future)):
+                        break
+        except BaseException as error:
+            self._fail(error)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=self.stop_event.is_set())
+            self._release(index)
+
+    def start(self, source: Iterable) -> "Pipeline":
+        """
+        Starts feeding the source items through the stages
+        :param source: iterable of items
+        :return: pipeline, iterable of the last stage results
+        """
+
+        if len(self.threads) > 0:
+            raise RuntimeError("The pipeline has already been started")
+
+        self.queues = [queue.Queue(self.buffer_size) for _ in range(len(self.stages) + 1)]
+        self.threads = [threading.Thread(target=self._feed, args=(source,), name="pipe-source")]
+
+        for index, stage in enumerate(self.stages):
+            self.counts[stage.name] = 0
+            self.metrics.register(
+                "queue_depth",
+                "Items waiting to be processed by each pipeline stage",
+                self.queues[index].qsize,
+                labels={"queue": stage.name},
+            )
+
+            if stage.kind == STAGE_KIND_PROCESS:
+                self.active.append(1)
+                self.threads.append(
+                    threading.Thread(
+                        target=self._run_process_dispatcher,
+                        args=(index,),
+                        name=f"pipe-{stage.name}",
+                    )
+                )
+                continue
+
+            self.active.append(stage.workers)
+            self.threads.extend(
+                threading.Thread(
+                    target=self._run_thread_worker,
+                    args=(index,),
+                    name=f"pipe-{stage.name}-{worker}",
+                )
+                for worker in range(stage.workers)
+            )
+
+        for thread in self.threads:
+            thread.start()
+
+        return self
+
+    def close(self) -> None:
+        """Stops the stages, if still running, and waits for their workers"""
+
+        self.stop_event.set()
+
+        for thread in self.threads:
+            thread.join()
+
+    def run(self, source: Iterable, sink: Callable[[Any], None]) -> None:
+        """
+        Feeds the source items through the stages, passing the results to a sink function
+        :param source: iterable of items
+        :param sink: function consuming the last stage results
+        """
+
+        with self.start(source):
+            for result in self:
+                sink(result)
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from collections import Counter
+from multiprocessing.util import Finalize
+from pathlib import Path
+from types import CodeType
+from types import FrameType
+from typing import Dict
+
+logger = logging.getLogger()
+
+# Environment variable passing the profiles folder down to the worker processes
+PROFILE_PATH_ENV = "DIALECT_MAP_PROFILE_PATH"
+
+# Seconds between stack samples
+SAMPLE_INTERVAL = 0.01
+
+# Seconds between profile writes, so the profile of a killed process is not lost
+FLUSH_INTERVAL = 30.0
+
+# Profiler of the current worker process, if any
+_process_profiler: "SamplingProfiler | None" = None
+
+
+class SamplingProfiler:
+    """
+    Profiler periodically sampling the stacks of every thread of the current process.
+    Unlike cProfile, it covers all the routine threads (pipeline stages, API requests...)
+    at a fixed low overhead. Samples are written in the collapsed stack format,
+    readable by flame graph tools (i.e. flamegraph.pl, speedscope)
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        interval: float = SAMPLE_INTERVAL,
+        flush_interval: float = FLUSH_INTERVAL,
+    ):
+        """
+        Initializes the sampling profiler
+        :param file_path: path to the collapsed stacks file
+        :param interval: seconds between stack samples (optional)
+        :param flush_interval: seconds between profile writes (optional)
+        """
+
+        if interval <= 0 or flush_interval <= 0:
+            raise ValueError("The profiler intervals must be positive numbers")
+
+        self.file_path = Path(file_path)
+        self.interval = interval
+        self.flush_interval = flush_interval
+        self.pid = os.getpid()
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self.labels: Dict[CodeType, str] = {}
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def _get_label(self, code: CodeType) -> str:
+        """
+        Gets the collapsed stack label of a code object, building it only once
+        :param code: code object of a stack frame
+        :return: function label
+        """
+
+        label = self.labels.get(code)
+
+        if label is None:
+            name = f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+            label = self.labels[code] = name.replace(";", ":")
+
+        return label
+
+    def _build_stack(self, thread_name: str, frame: FrameType | None) -> str:
+        """
+        Builds the collapsed stack of a thread, from the outermost frame to the innermost one
+        :param thread_name: name of the thread
+        :param frame: innermost frame of the thread
+        :return: collapsed stack
+        """
+
+        labels = []
+
+        while frame is not None:
+            labels.append(self._get_label(frame.f_code))
+            frame = frame.f_back
+
+        labels.append(thread_name)
+
+        return ";".join(reversed(labels))
+
+    def _sample(self) -> None:
+        """Samples the current stack of every thread, except the profiler one"""
+
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()
+        stacks = [
+            self._build_stack(names.get(ident, str(ident)), frame)
+            for ident, frame in frames.items()
+            if ident != self.thread.ident
+        ]
+
+        with self.lock:
+            self.samples += 1
+            self.stacks.update(stacks)
+
+    def _run(self) -> None:
+        """Samples the thread stacks every interval, writing the profile periodically"""
+
+        last_flush = time.monotonic()
+
+        while not self.stop_event.wait(self.interval):
+            self._sample()
+
+            if time.monotonic() - last_flush >= self.flush_interval:
+                self.write()
+                last_flush = time.monotonic()
+
+    def write(self) -> None:
+        """Writes the collapsed stacks file, atomically replacing any previous version"""
+
+        with self.lock:
+            lines = [f"{stack} {count}\n" for stack, count in self.stacks.most_common()]
+
+        fd, temp_path = tempfile.mkstemp(dir=self.file_path.parent, prefix=".profile.")
+
+        with os.fdopen(fd, "w") as file:
+            file.writelines(lines)
+
+        os.replace(temp_path, self.file_path)
+
+    def start(self) -> None:
+        """Starts sampling the thread stacks, on a background thread"""
+
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling the thread stacks, writing the final profile"""
+
+        self.stop_event.set()
+        self.thread.join()
+        self.write()
+
+        logger.info(f"Profile of {self.samples} samples written to {self.file_path}")
+
+
+def start_profiler(profile_path: str | Path, name: str) -> SamplingProfiler:
+    """
+    Starts profiling the current process, exporting the profiles folder to its child processes
+    :param profile_path: folder to write the collapsed stacks files to
+    :param name: name of the process profile file, without extension
+    :return: started profiler
+    """
+
+    Path(profile_path).mkdir(parents=True, exist_ok=True)
+    os.environ[PROFILE_PATH_ENV] = str(profile_path)
+
+    profiler = SamplingProfiler(Path(profile_path).joinpath(f"{name}-{os.getpid()}.collapsed"))
+    profiler.start()
+
+    return profiler
+
+
+def init_process_profiler() -> None:
+    """
+    Starts profiling a worker process, if the profiles folder was exported by its parent.
+    To be called from the worker process initializers. The profile is written on exit
+    """
+
+    global _process_profiler
+
+    profile_path = os.environ.get(PROFILE_PATH_ENV)
+
+    if profile_path is None:
+        return
+
+    # Forked processes inherit the profiler global, but not its sampling thread
+    if _process_profiler is not None and _process_profiler.pid == os.getpid():
+        return
+
+    _process_profiler = start_profiler(profile_path, "worker")
+
+    # Multiprocessing children skip the atexit handlers, running their finalizers instead
+    Finalize(None, _process_profiler.stop, exitpriority=0)
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import multiprocessing
+import queue
+import resource
+import threading
+
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from multiprocessing.connection import Connection
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+logger = logging.getLogger()
+
+
+class WorkerTimeoutError(Exception):
+    """Error raised when a task exceeds its wall-clock limit"""
+
+
+class WorkerCrashedError(Exception):
+    """Error raised when a worker process dies while running a task"""
+
+
+def _worker_main(
+    conn: Connection,
+    initializer: Callable | None,
+    initargs: Tuple,
+    memory_limit: int | None,
+) -> None:
+    """
+    Main loop of an isolated worker process, running tasks until told to stop
+    :param conn: pipe end to receive tasks and send results
+    :param initializer: function to call when the process starts
+    :param initargs: arguments of the initializer function
+    :param memory_limit: maximum address space of the process in bytes
+    """
+
+    if memory_limit is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    if initializer is not None:
+        initializer(*initargs)
+
+    while True:
+        task = conn.recv()
+        if task is None:
+            break
+
+        func, args, kwargs = task
+
+        try:
+            result = (True, func(*args, **kwargs))
+        except BaseException as error:
+            result = (False, error)
+
+        try:
+            conn.send(result)
+        except Exception as error:
+            conn.send((False, RuntimeError(f"Unpicklable task outcome: {error!r}")))
+
+
+class IsolatedWorker:
+    """Handle of a worker process, able to run tasks under a time limit"""
+
+    def __init__(self, pool: "IsolatedWorkerPool"):
+        """
+        Initializes and starts the worker process
+        :param pool: pool the worker belongs to
+        """
+
+        parent_conn, child_conn = pool.context.Pipe()
+
+        self.conn = parent_conn
+        self.tasks = 0
+        self.process = pool.context.Process(
+            target=_worker_main,
+            args=(child_conn, pool.initializer, pool.initargs, pool.memory_limit),
+            daemon=True,
+        )
+
+        try:
+            self.process.start()
+        except BaseException:
+            parent_conn.close()
+            raise
+        finally:
+            child_conn.close()
+
+    def run(self, func: Callable, args: Tuple, kwargs: dict, timeout: float | None) -> Any:
+        """
+        Runs a task in the worker process, waiting for its outcome
+        :param func: task function
+        :param args: task function positional arguments
+        :param kwargs: task function keyword arguments
+        :param timeout: maximum seconds to wait for the outcome
+        :return: task function result
+        """
+
+        self.tasks += 1
+
+        try:
+            self.conn.send((func, args, kwargs))
+            if not self.conn.poll(timeout):
+                raise WorkerTimeoutError(f"Task exceeded its {timeout}s limit")
+            success, outcome = self.conn.recv()
+        except (EOFError, OSError):
+            raise WorkerCrashedError(f"Worker exited with code {self.process.exitcode}")
+
+        if not success:
+            raise outcome
+
+        return outcome
+
+    def is_alive(self) -> bool:
+        """Checks whether the worker process is running"""
+
+        return self.process.is_alive()
+
+    def stop(self) -> None:
+        """Stops the worker process, gracefully if it is idle"""
+
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        """Terminates the worker process right away"""
+
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+        self.conn.close()
+
+
+class IsolatedWorkerPool(Executor):
+    """
+    Process pool running each task under a wall-clock and a memory limit.
+    Workers running over their time limit, or dying, are replaced by fresh ones
+    (so are workers after completing a given number of tasks), failing their task
+    futures with WorkerTimeoutError or WorkerCrashedError respectively
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        initializer: Callable | None = None,
+        initargs: Tuple = (),
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+        max_tasks: int | None = None,
+    ):
+        """
+        Initializes the pool, starting its worker processes
+        :param max_workers: number of worker processes
+        :param initializer: function to call when each worker process starts (optional)
+        :param initargs: arguments of the initializer function (optional)
+        :param timeout: maximum seconds per task (optional)
+        :param memory_limit: maximum address space per worker process in bytes (optional)
+        :param max_tasks: number of tasks after which workers are recycled (optional)
+        """
+
+        if max_workers < 1:
+            raise ValueError("The number of workers must be a positive integer")
+        if max_tasks is not None and max_tasks < 1:
+            raise ValueError("The number of tasks per worker must be a positive integer")
+
+        self.context = multiprocessing.get_context("spawn")
+        self.initializer = initializer
+        self.initargs = initargs
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_tasks = max_tasks
+
+        self.queue: queue.Queue = queue.Queue()
+        self.shutdown_lock = threading.Lock()
+        self.shutdown_flag = False
+        self.threads: List[threading.Thread] = []
+
+        for index in range(max_workers):
+            thread = threading.Thread(target=self._supervise, name=f"isolated-{index}")
+            thread.start()
+            self.threads.append(thread)
+
+    def _spawn(self) -> IsolatedWorker | None:
+        """
+        Starts a worker process ahead of its tasks, logging any spawn error
+        :return: worker handle, or None if the process could not be started
+        """
+
+        try:
+            return IsolatedWorker(self)
+        except Exception as error:
+            logger.error(f"Cannot start a worker process: {error!r}")
+            return None
+
+    def _supervise(self) -> None:
+        """
+        Feeds queued tasks to a worker process, replacing it whenever necessary.
+        Tasks that cannot get a worker process started are failed with the spawn error,
+        so the queue keeps being drained
+        """
+
+        worker = self._spawn()
+
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+
+            future, func, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            if worker is not None and not worker.is_alive():
+                worker.kill()
+                worker = None
+
+            if worker is None:
+                try:
+                    worker = IsolatedWorker(self)
+                except Exception as error:
+                    future.set_exception(error)
+                    continue
+
+            try:
+                result = worker.run(func, args, kwargs, self.timeout)
+            except (WorkerTimeoutError, WorkerCrashedError) as error:
+                worker.kill()
+                worker = self._spawn()
+                future.set_exception(error)
+                continue
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+            if self.max_tasks is not None and worker.tasks >= self.max_tasks:
+                worker.stop()
+                worker = self._spawn()
+
+        if worker is not None:
+            worker.stop()
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """
+        Schedules a task to be run by one of the worker processes
+        :param fn: task function (must be picklable)
+        :param args: task function positional arguments
+        :param kwargs: task function keyword arguments
+        :return: task future
+        """
+
+        with self.shutdown_lock:
+            if self.shutdown_flag:
+                raise RuntimeError("Cannot schedule new tasks after shutdown")
+
+            future: Future = Future()
+            self.queue.put((future, fn, args, kwargs))
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stops the worker processes once the queued tasks are done
+        :param wait: whether to wait for the worker processes to stop (optional)
+        :param cancel_futures: whether to cancel the queued tasks (optional)
+        """
+
+        with self.shutdown_lock:
+            self.shutdown_flag = True
+
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+
+            for _ in self.threads:
+                self.queue.put(None)
+
+        if wait:
+            for thread in self.threads:
+                thread.join()
@@ -1,20 +1,532 @@
 #!/usr/bin/env python
 
+from contextlib import ExitStack
+from datetime import datetime
+from datetime import timezone
+from functools import partial
+from typing import Callable
+from typing import List
+from typing import Tuple
+
 import click
 
+from click import BadParameter
+from click import Choice
 from click import Context
+from click import DateTime
+from click import FloatRange
+from click import IntRange
 from click import Path
+from click import UsageError
 
 from dialect_map_gcp.auth import OpenIDAuthenticator
 from dialect_map_io.handlers import DialectMapAPIHandler
-from dialect_map_io.handlers import PDFFileHandler
 
 from job.files import FileSystemIterator
+from job.files import SHARD_MODE_HASH
+from job.files import SHARD_MODES
+from job.handlers import BulkDialectMapAPIHandler
+from job.handlers import StreamingPDFFileHandler
+from job.input import API_SOURCE_TYPES
+from job.input import MetadataCache
+from job.input import SOURCE_TYPE_API
+from job.input import SnapshotFilter
 from job.input import PDFCorpusSource
+from job.metrics import MetricsRecorder
+from job.metrics import NULL_METRICS
+from job.openmetrics import read_resident_memory
+from job.openmetrics import write_openmetrics
+from job.profiling import start_profiler
+from job.output import Authenticator
 from job.output import DialectMapOperator
+from job.output import FileManifest
+from job.output import NoAuthenticator
 from logs import setup_logger
+from routines import CombinedRoutine
 from routines import LocalTextRoutine
 from routines import MetadataRoutine
+from routines import SnapshotBackfillRoutine
+
+
+MANIFEST_FILE_NAME = ".manifest.db"
+
+
+def parse_shard(context: Context, param: click.Parameter, value: str) -> Tuple[int, int]:
+    """
+    Parses a shard specification with the INDEX/COUNT format
+    :param context: Click command context
+    :param param: Click command parameter
+    :param value: shard specification
+    :return: tuple of shard index and number of shards
+    """
+
+    try:
+        index, count = (int(number) for number in value.split("/"))
+    except ValueError:
+        raise BadParameter("The shard must have the INDEX/COUNT format")
+
+    if not 0 <= index < count:
+        raise BadParameter("The shard index must be between 0 and COUNT - 1")
+
+    return index, count
+
+
+def add_options(options: List[Callable]) -> Callable:
+    """
+    Builds a decorator adding a group of Click options to a command
+    :param options: Click option decorators, in the order they are displayed
+    :return: command decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        for option in reversed(options):
+            func = option(func)
+        return func
+
+    return decorator
+
+
+WALK_OPTIONS = [
+    click.option(
+        "--input-files-path",
+        help="PDF input files local path",
+        required=True,
+        type=Path(
+            exists=True,
+            file_okay=False,
+            dir_okay=True,
+        ),
+    ),
+    click.option(
+        "--walk-workers",
+        help="Number of threads traversing the input top-level folders",
+        default=1,
+        required=False,
+        type=IntRange(min=1),
+    ),
+    click.option(
+        "--shard",
+        help="Shard of the input files to process, as INDEX/COUNT (i.e. 0/4)",
+        default="0/1",
+        required=False,
+        callback=parse_shard,
+        type=str,
+    ),
+    click.option(
+        "--shard-mode",
+        help="Split the input files by path hash or by top-level folder",
+        default=SHARD_MODE_HASH,
+        required=False,
+        type=Choice(SHARD_MODES),
+    ),
+]
+
+TEXT_OPTIONS = [
+    click.option(
+        "--output-files-path",
+        help="TXT output files local path",
+        required=True,
+        type=Path(
+            exists=False,
+            file_okay=False,
+            dir_okay=True,
+        ),
+    ),
+    click.option(
+        "--workers",
+        help="Number of PDF extraction processes",
+        default=1,
+        required=False,
+        type=IntRange(min=1),
+    ),
+    click.option(
+        "--manifest/--no-manifest",
+        help="Whether to skip PDF files converted on previous runs",
+        default=True,
+        required=False,
+    ),
+    click.option(
+        "--streaming/--no-streaming",
+        help="Whether to extract and write the PDF texts page by page",
+        default=False,
+        required=False,
+    ),
+    click.option(
+        "--file-timeout",
+        help="Maximum seconds per PDF extraction, quarantining slower files",
+        default=None,
+        required=False,
+        type=FloatRange(min=0, min_open=True),
+    ),
+    click.option(
+        "--file-memory-limit",
+        help="Maximum MB per PDF extraction process, quarantining heavier files",
+        default=None,
+        required=False,
+        type=IntRange(min=1),
+    ),
+    click.option(
+        "--worker-max-files",
+        help="Number of PDF extractions after which processes are recycled",
+        default=None,
+        required=False,
+        type=IntRange(min=1),
+    ),
+]
+
+METADATA_OPTIONS = [
+    click.option(
+        "--input-metadata-urls",
+        help="URLs to the paper metadata sources",
+        default=["https://export.arxiv.org/api"],
+        required=False,
+        multiple=True,
+        type=str,
+    ),
+    click.option(
+        "--api-source-type",
+        help="Parser of the ArXiv export API feeds: feedparser (api) or iterparse (api-atom)",
+        default=SOURCE_TYPE_API,
+        required=False,
+        type=Choice(API_SOURCE_TYPES),
+    ),
+    click.option(
+        "--batch-size",
+        help="Number of papers to request metadata for at once",
+        default=100,
+        required=False,
+        type=IntRange(min=1),
+    ),
+    click.option(
+        "--fetch-workers",
+        help="Number of threads fetching metadata batches from the sources",
+        default=1,
+        required=False,
+        type=IntRange(min=1),
+    ),
+    click.option(
+        "--cache-path",
+        help="Local cache file for the ArXiv export API results",
+        default=None,
+        required=False,
+        type=Path(
+            exists=False,
+            file_okay=True,
+            dir_okay=False,
+        ),
+    ),
+    click.option(
+        "--cache-ttl",
+        help="Hours the cached ArXiv export API results remain valid",
+        default=168.0,
+        required=False,
+        type=FloatRange(min=0, min_open=True),
+    ),
+    click.option(
+        "--cache-size",
+        help="Maximum size of the ArXiv export API results cache, in MB",
+        default=1024,
+        required=False,
+        type=IntRange(min=1),
+    ),
+]
+
+API_OPTIONS = [
+    click.option(
+        "--gcp-key-path",
+        help="GCP Service Account key path. Required unless using --no-auth",
+        default=None,
+        required=False,
+        type=Path(
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+        ),
+    ),
+    click.option(
+        "--no-auth",
+        help="Whether to send unauthenticated API requests (i.e. to a local stand-in server)",
+        is_flag=True,
+        default=False,
+        required=False,
+    ),
+    click.option(
+        "--output-api-url",
+        help="Private API base URL",
+        required=True,
+        type=str,
+    ),
+    click.option(
+        "--max-concurrency",
+        help="Maximum number of concurrent API requests",
+        default=8,
+        required=False,
+        type=IntRange(min=1),
+    ),
+    click.option(
+        "--bulk-size",
+        help="Records per request to the bulk API endpoints (0 to send them one by one)",
+        default=0,
+        required=False,
+        type=IntRange(min=0),
+    ),
+    click.option(
+        "--bulk-bytes",
+        help="Maximum size of a bulk API request, in KB",
+        default=1024,
+        required=False,
+        type=IntRange(min=1),
+    ),
+    click.option(
+        "--bulk-latency",
+        help="Maximum seconds a record waits to be sent in a bulk API request",
+        default=1.0,
+        required=False,
+        type=FloatRange(min=0, min_open=True),
+    ),
+]
+
+
+def init_metrics(
+    context: Context,
+    metrics_interval: float | None,
+    metrics_summary: str | None,
+    metrics_file: str | None,
+    metrics_file_interval: float,
+) -> MetricsRecorder:
+    """
+    Initializes the routines metrics recorder, reporting them once the command finishes.
+    The metrics are only recorded when any of the metrics options is provided
+    :param context: Click group context
+    :param metrics_interval: seconds between the stage metrics logs
+    :param metrics_summary: JSON file to dump the stage metrics summary to
+    :param metrics_file: Prometheus text file to periodically write the metrics to
+    :param metrics_file_interval: seconds between the Prometheus text file writes
+    :return: metrics recorder
+    """
+
+    if metrics_interval is None and metrics_summary is None and metrics_file is None:
+        return NULL_METRICS
+
+    metrics = MetricsRecorder()
+    metrics.register(
+        "process_resident_memory_bytes",
+        "Resident memory of the job main process",
+        read_resident_memory,
+    )
+
+    context.call_on_close(partial(close_metrics, metrics, metrics_summary, metrics_file))
+
+    if metrics_interval is not None:
+        metrics.add_reporter(metrics.report, metrics_interval)
+    if metrics_file is not None:
+        write_file = partial(write_openmetrics, metrics, metrics_file)
+        metrics.add_reporter(write_file, metrics_file_interval)
+
+    return metrics
+
+
+def close_metrics(
+    metrics: MetricsRecorder,
+    metrics_summary: str | None,
+    metrics_file: str | None,
+) -> None:
+    """
+    Stops the metrics periodic reports, logging and writing their final values
+    :param metrics: metrics recorder
+    :param metrics_summary: JSON file to dump the stage metrics summary to
+    :param metrics_file: Prometheus text file to write the metrics to
+    """
+
+    metrics.close()
+    metrics.report()
+
+    if metrics_summary is not None:
+        metrics.dump(metrics_summary)
+    if metrics_file is not None:
+        write_openmetrics(metrics, metrics_file)
+
+
+def init_files_iterator(
+    input_files_path: str,
+    walk_workers: int,
+    shard: Tuple[int, int],
+    shard_mode: str,
+    **_,
+) -> FileSystemIterator:
+    """
+    Initializes the PDF files iterator from the walk options
+    :param input_files_path: PDF input files local path
+    :param walk_workers: number of threads traversing the input top-level folders
+    :param shard: tuple of shard index and number of shards
+    :param shard_mode: strategy to split the input files into shards
+    :return: file system iterator
+    """
+
+    return FileSystemIterator(
+        input_files_path,
+        ".pdf",
+        workers=walk_workers,
+        shard_index=shard[0],
+        shard_count=shard[1],
+        shard_mode=shard_mode,
+    )
+
+
+def init_text_routine(
+    stack: ExitStack,
+    files_iterator: FileSystemIterator,
+    metrics: MetricsRecorder,
+    output_files_path: str,
+    workers: int,
+    manifest: bool,
+    streaming: bool,
+    file_timeout: float | None,
+    file_memory_limit: int | None,
+    worker_max_files: int | None,
+    **_,
+) -> LocalTextRoutine:
+    """
+    Initializes the text extraction routine from the text options
+    :param stack: context stack closing the routine resources
+    :param files_iterator: file system iterator
+    :param metrics: recorder of the routine stage metrics
+    :param output_files_path: TXT output files local path
+    :param workers: number of PDF extraction processes
+    :param manifest: whether to skip PDF files converted on previous runs
+    :param streaming: whether to extract and write the PDF texts page by page
+    :param file_timeout: maximum seconds per PDF extraction
+    :param file_memory_limit: maximum MB per PDF extraction process
+    :param worker_max_files: number of PDF extractions after which processes are recycled
+    :return: text extraction routine
+    """
+
+    # Initialize PDF reader
+    pdf_handler = StreamingPDFFileHandler()
+    pdf_source = PDFCorpusSource(pdf_handler)
+
+    # Initialize converted files manifest
+    files_manifest = None
+    if manifest:
+        files_manifest = FileManifest(f"{output_files_path}/{MANIFEST_FILE_NAME}")
+        stack.callback(files_manifest.close)
+
+    return LocalTextRoutine(
+        files_iterator,
+        pdf_source,
+        workers=workers,
+        manifest=files_manifest,
+        streaming=streaming,
+        timeout=file_timeout,
+        memory_limit=file_memory_limit << 20 if file_memory_limit else None,
+        max_tasks=worker_max_files,
+        metrics=metrics,
+    )
+
+
+def init_api_operator(
+    stack: ExitStack,
+    gcp_key_path: str | None,
+    no_auth: bool,
+    output_api_url: str,
+    max_concurrency: int,
+    bulk_size: int,
+    bulk_bytes: int,
+    bulk_latency: float,
+    **_,
+) -> DialectMapOperator:
+    """
+    Initializes the Dialect map API operator from the API options
+    :param stack: context stack closing the operator resources
+    :param gcp_key_path: GCP Service Account key path
+    :param no_auth: whether to send unauthenticated API requests
+    :param output_api_url: private API base URL
+    :param max_concurrency: maximum number of concurrent API requests
+    :param bulk_size: records per bulk API request
+    :param bulk_bytes: maximum size of a bulk API request, in KB
+    :param bulk_latency: maximum seconds a record waits to be sent
+    :return: API operator
+    """
+
+    api_auth: Authenticator
+
+    if no_auth:
+        api_auth = NoAuthenticator()
+    elif gcp_key_path is not None:
+        api_auth = OpenIDAuthenticator(gcp_key_path, target_url=output_api_url)
+    else:
+        raise UsageError("The --gcp-key-path option is required unless using --no-auth")
+
+    api_conn: DialectMapAPIHandler
+
+    if bulk_size > 0:
+        api_conn = BulkDialectMapAPIHandler(api_auth, base_url=output_api_url)
+    else:
+        api_conn = DialectMapAPIHandler(api_auth, base_url=output_api_url)
+
+    api_ctl = DialectMapOperator(
+        api_conn,
+        max_workers=max_concurrency,
+        bulk_size=bulk_size,
+        bulk_bytes=bulk_bytes << 10,
+        bulk_latency=bulk_latency,
+    )
+    stack.callback(api_ctl.close)
+
+    return api_ctl
+
+
+def init_metadata_routine(
+    stack: ExitStack,
+    files_iterator: FileSystemIterator,
+    metrics: MetricsRecorder,
+    input_metadata_urls: list,
+    api_source_type: str,
+    batch_size: int,
+    fetch_workers: int,
+    cache_path: str | None,
+    cache_ttl: float,
+    cache_size: int,
+    **options,
+) -> MetadataRoutine:
+    """
+    Initializes the metadata extraction routine from the metadata and API options
+    :param stack: context stack closing the routine resources
+    :param files_iterator: file system iterator
+    :param metrics: recorder of the routine stage metrics
+    :param input_metadata_urls: URLs to the paper metadata sources
+    :param api_source_type: source type of the ArXiv export API URLs
+    :param batch_size: number of papers to request metadata for at once
+    :param fetch_workers: number of threads fetching metadata batches from the sources
+    :param cache_path: local cache file for the ArXiv export API results
+    :param cache_ttl: hours the cached ArXiv export API results remain valid
+    :param cache_size: maximum size of the ArXiv export API results cache, in MB
+    :param options: API options
+    :return: metadata extraction routine
+    """
+
+    api_ctl = init_api_operator(stack, **options)
+
+    # Initialize API results cache
+    cache = None
+    if cache_path is not None:
+        cache = MetadataCache(cache_path, ttl=cache_ttl * 3600, max_bytes=cache_size << 20)
+        stack.callback(cache.close)
+
+    routine = MetadataRoutine(
+        files_iterator,
+        api_ctl,
+        batch_size=batch_size,
+        cache=cache,
+        fetch_workers=fetch_workers,
+        metrics=metrics,
+    )
+    routine.add_sources(input_metadata_urls, api_source_type)
+
+    for source in routine.sources:
+        stack.callback(source.close)
+
+    return routine
 
 
 @click.group()
@@ -26,106 +538,216 @@ from routines import MetadataRoutine
     required=False,
     type=str,
 )
-@click.pass_context
-def main(context: Context, log_level: str):
-    """Default command group for the jobs"""
-
-    setup_logger(log_level)
-
-    params = context.ensure_object(dict)
-    params["LOG_LEVEL"] = log_level
-
-
-@main.command()
 @click.option(
-    "--input-files-path",
-    help="PDF input files local path",
-    required=True,
+    "--metrics-interval",
+    help="Seconds between the routine stage metrics logs",
+    default=None,
+    required=False,
+    type=FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--metrics-summary",
+    help="JSON file to dump the routine stage metrics to, once finished",
+    default=None,
+    required=False,
     type=Path(
-        exists=True,
-        file_okay=False,
-        dir_okay=True,
+        exists=False,
+        file_okay=True,
+        dir_okay=False,
     ),
 )
 @click.option(
-    "--output-files-path",
-    help="TXT output files local path",
-    required=True,
+    "--metrics-file",
+    help="Prometheus text file to periodically write the routine metrics to",
+    default=None,
+    required=False,
+    type=Path(
+        exists=False,
+        file_okay=True,
+        dir_okay=False,
+    ),
+)
+@click.option(
+    "--metrics-file-interval",
+    help="Seconds between the Prometheus text file writes",
+    default=15.0,
+    required=False,
+    type=FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--profile",
+    help="Folder to write the sampled stacks of every job process to",
+    default=None,
+    required=False,
     type=Path(
         exists=False,
         file_okay=False,
         dir_okay=True,
     ),
 )
-def text_job(input_files_path: str, output_files_path: str):
+@click.pass_context
+def main(
+    context: Context,
+    log_level: str,
+    metrics_interval: float | None,
+    metrics_summary: str | None,
+    metrics_file: str | None,
+    metrics_file_interval: float,
+    profile: str | None,
+):
+    """Default command group for the jobs"""
+
+    setup_logger(log_level)
+
+    if profile is not None:
+        profiler = start_profiler(profile, "main")
+        context.call_on_close(profiler.stop)
+
+    params = context.ensure_object(dict)
+    params["LOG_LEVEL"] = log_level
+    params["METRICS"] = init_metrics(
+        context,
+        metrics_interval,
+        metrics_summary,
+        metrics_file,
+        metrics_file_interval,
+    )
+
+
+@main.command()
+@add_options(WALK_OPTIONS)
+@add_options(TEXT_OPTIONS)
+@click.pass_obj
+def text_job(params: dict, **options):
     """Iterates on all PDF papers generating TXT equivalents in the output folder"""
 
-    # Initialize file iterator
-    files_iterator = FileSystemIterator(input_files_path, ".pdf")
+    with ExitStack() as stack:
+        files_iterator = init_files_iterator(**options)
+        routine = init_text_routine(stack, files_iterator, params["METRICS"], **options)
+        routine.run(options["output_files_path"])
 
-    # Initialize PDF reader
-    pdf_handler = PDFFileHandler()
-    pdf_source = PDFCorpusSource(pdf_handler)
 
-    routine = LocalTextRoutine(files_iterator, pdf_source)
-    routine.run(output_files_path)
+@main.command()
+@add_options(WALK_OPTIONS)
+@add_options(METADATA_OPTIONS)
+@add_options(API_OPTIONS)
+@click.pass_obj
+def metadata_job(params: dict, **options):
+    """Iterates on all PDF papers and send their metadata to the specified API"""
+
+    with ExitStack() as stack:
+        files_iterator = init_files_iterator(**options)
+        routine = init_metadata_routine(stack, files_iterator, params["METRICS"], **options)
+        routine.run()
 
 
 @main.command()
+@add_options(WALK_OPTIONS)
+@add_options(TEXT_OPTIONS)
+@add_options(METADATA_OPTIONS)
+@add_options(API_OPTIONS)
 @click.option(
-    "--input-files-path",
-    help="PDF input files local path",
+    "--buffer-size",
+    help="Maximum walked PDF files waiting to be processed by each routine",
+    default=1000,
+    required=False,
+    type=IntRange(min=1),
+)
+@click.pass_obj
+def combined_job(params: dict, buffer_size: int, **options):
+    """Iterates once on all PDF papers generating TXT equivalents and sending their metadata"""
+
+    metrics = params["METRICS"]
+
+    with ExitStack() as stack:
+        files_iterator = init_files_iterator(**options)
+        routine = CombinedRoutine(
+            files_iterator,
+            init_text_routine(stack, files_iterator, metrics, **options),
+            init_metadata_routine(stack, files_iterator, metrics, **options),
+            buffer_size=buffer_size,
+            metrics=metrics,
+        )
+        routine.run(options["output_files_path"])
+
+
+@main.command()
+@click.option(
+    "--input-snapshot-path",
+    help="ArXiv Kaggle JSON-lines snapshot local path",
     required=True,
     type=Path(
         exists=True,
-        file_okay=False,
-        dir_okay=True,
+        file_okay=True,
+        dir_okay=False,
     ),
 )
 @click.option(
-    "--input-metadata-urls",
-    help="URLs to the paper metadata sources",
-    default=["https://export.arxiv.org/api"],
+    "--workers",
+    help="Number of snapshot parsing processes",
+    default=1,
+    required=False,
+    type=IntRange(min=1),
+)
+@click.option(
+    "--chunk-size",
+    help="Approximate size of the snapshot ranges parsed at once, in MB",
+    default=16,
+    required=False,
+    type=IntRange(min=1),
+)
+@click.option(
+    "--categories",
+    help="Categories or archives of the papers to send (i.e. hep-th, math). All by default",
+    default=[],
     required=False,
     multiple=True,
     type=str,
 )
 @click.option(
-    "--gcp-key-path",
-    help="GCP Service Account key path",
-    required=True,
-    type=Path(
-        exists=True,
-        file_okay=True,
-        dir_okay=False,
-    ),
+    "--since",
+    help="Earliest revision date of the papers to send, inclusive",
+    default=None,
+    required=False,
+    type=DateTime(formats=["%Y-%m-%d"]),
 )
 @click.option(
-    "--output-api-url",
-    help="Private API base URL",
-    required=True,
-    type=str,
+    "--until",
+    help="Latest revision date of the papers to send, exclusive",
+    default=None,
+    required=False,
+    type=DateTime(formats=["%Y-%m-%d"]),
 )
-def metadata_job(
-    input_files_path: str,
-    input_metadata_urls: list,
-    gcp_key_path: str,
-    output_api_url: str,
+@add_options(API_OPTIONS)
+@click.pass_obj
+def backfill_job(
+    params: dict,
+    input_snapshot_path: str,
+    workers: int,
+    chunk_size: int,
+    categories: list,
+    since: datetime | None,
+    until: datetime | None,
+    **options,
 ):
-    """Iterates on all PDF papers and send their metadata to the specified API"""
-
-    # Initialize file iterator
-    file_iter = FileSystemIterator(input_files_path, ".pdf")
+    """Sends the metadata of every paper within an ArXiv snapshot to the specified API"""
 
-    # Initialize API controller
-    api_auth = OpenIDAuthenticator(gcp_key_path, target_url=output_api_url)
-    api_conn = DialectMapAPIHandler(api_auth, base_url=output_api_url)
-    api_ctl = DialectMapOperator(api_conn)
+    filters = SnapshotFilter(
+        categories=frozenset(categories),
+        since=since.replace(tzinfo=timezone.utc) if since else None,
+        until=until.replace(tzinfo=timezone.utc) if until else None,
+    )
 
-    # Initialize and run routine
-    routine = MetadataRoutine(file_iter, api_ctl)
-    routine.add_sources(input_metadata_urls)
-    routine.run()
+    with ExitStack() as stack:
+        routine = SnapshotBackfillRoutine(
+            input_snapshot_path,
+            init_api_operator(stack, **options),
+            workers=workers,
+            chunk_size=chunk_size << 20,
+            filters=filters,
+            metrics=params["METRICS"],
+        )
+        routine.run()
 
 
 if __name__ == "__main__":
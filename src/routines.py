@@ -2,27 +2,148 @@
 
 import asyncio
 import logging
+import os
+import queue
+import threading
+import time
 
 from abc import ABC
 from abc import abstractmethod
+from collections import defaultdict
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import attrgetter
+from typing import Dict
+from typing import Generator
+from typing import Iterable
 from typing import List
+from typing import NamedTuple
+from typing import Tuple
 from typing import override
 from urllib.parse import urlparse
 
-from dialect_map_io.handlers import TextFileHandler
 from dialect_map_io.handlers import init_handler_cls
 from dialect_map_schemas.routes import DM_PAPER_METADATA_ROUTE
 
+from job.files import FileEntry
 from job.files import FileSystemIterator
+from job.handlers import StreamingTextFileHandler
+from job.input import MetadataCache
 from job.input import PDFCorpusSource
+from job.input import SOURCE_TYPE_API
+from job.input import SnapshotFilter
 from job.input import init_source_cls
+from job.input import iter_snapshot_ranges
+from job.input import parse_snapshot_range
+from job.input import snapshot_range_size
+from job.metrics import MetricsRecorder
+from job.metrics import NULL_METRICS
+from job.metrics import PROBE_KIND_COUNTER
 from job.models import ArxivMetadata
 from job.output import DialectMapOperator
+from job.output import FileManifest
 from job.output import LocalFileOperator
+from job.output import ManifestRecord
+from job.profiling import init_process_profiler
+from job.pipeline import Pipeline
+from job.pipeline import Stage
+from job.pipeline import STAGE_KIND_PROCESS
+from job.workers import IsolatedWorkerPool
 
 logger = logging.getLogger()
 
 
+class TextTask(NamedTuple):
+    """
+    Object containing the information to extract the text of a PDF file
+
+    :attr file_path: path to the PDF file
+    :attr file_name: name of the output TXT file
+    :attr file_size: size of the PDF file in bytes
+    :attr file_mtime_ns: modification time of the PDF file in nanoseconds
+    :attr output_path: output folder to save the plain text
+    :attr manifest_key: PDF file path relative to the corpus root
+    :attr overwrite: whether to replace already existing TXT files
+    :attr streaming: whether to extract and write the text page by page
+    """
+
+    file_path: str
+    file_name: str
+    file_size: int
+    file_mtime_ns: int
+    output_path: str
+    manifest_key: str
+    overwrite: bool
+    streaming: bool
+
+
+class TextTaskResult(NamedTuple):
+    """
+    Object containing the outcome of a text extraction task
+
+    :attr task: text extraction task
+    :attr worker_pid: ID of the process that run the task
+    :attr elapsed: seconds spent on the task
+    """
+
+    task: TextTask
+    worker_pid: int
+    elapsed: float
+
+
+# Source used by the text extraction worker processes
+_worker_pdf_source: PDFCorpusSource | None = None
+
+
+def _init_text_worker(pdf_source: PDFCorpusSource) -> None:
+    """
+    Initializes the PDF source and the profiler (if enabled) of a text extraction worker process
+    :param pdf_source: PDF file corpus source
+    """
+
+    global _worker_pdf_source
+    _worker_pdf_source = pdf_source
+
+    init_process_profiler()
+
+
+def _extract_text(pdf_source: PDFCorpusSource, task: TextTask) -> TextTaskResult:
+    """
+    Extracts the text of a PDF file and stores it in the output path
+    :param pdf_source: PDF file corpus source
+    :param task: text extraction task
+    :return: text extraction result
+    """
+
+    start = time.perf_counter()
+
+    # Initialize TXT file writer
+    txt_handler = StreamingTextFileHandler()
+    txt_operator = LocalFileOperator(task.output_path, txt_handler)
+
+    # Save paper contents
+    if task.streaming:
+        txt_pages = pdf_source.iter_txt(task.file_path)
+        txt_operator.write_chunks(task.file_name, txt_pages, task.overwrite)
+    else:
+        txt_content = pdf_source.extract_txt(task.file_path)
+        txt_operator.write_text(task.file_name, txt_content, task.overwrite)
+
+    return TextTaskResult(task, os.getpid(), time.perf_counter() - start)
+
+
+def _extract_text_worker(task: TextTask) -> TextTaskResult:
+    """
+    Extracts the text of a PDF file from within a worker process
+    :param task: text extraction task
+    :return: text extraction result
+    """
+
+    assert _worker_pdf_source is not None
+    return _extract_text(_worker_pdf_source, task)
+
+
 class BaseRoutine(ABC):
     """Base class for the job routines"""
 
@@ -36,18 +157,264 @@ class BaseRoutine(ABC):
         raise NotImplementedError()
 
 
-class LocalTextRoutine(BaseRoutine):
+class FileRoutine(BaseRoutine):
+    """Base class for the job routines processing the walked corpus files"""
+
+    @abstractmethod
+    def run_entries(self, entries: Iterable[FileEntry], destination_path: str) -> None:
+        """
+        Main routine to move data from a source to a destination, given the source files
+        :param entries: file entries to process
+        :param destination_path: output path to save the data
+        """
+
+        raise NotImplementedError()
+
+
+class APIRoutine(BaseRoutine):
+    """Base class for the routines sending metadata records to the Dialect map API"""
+
+    def __init__(self, api_ctl: DialectMapOperator, metrics: MetricsRecorder = NULL_METRICS):
+        """
+        Initializes the API routine
+        :param api_ctl: API REST operator to be used as output
+        :param metrics: recorder of the routine stage metrics (optional)
+        """
+
+        self.api_controller = api_ctl
+        self.metrics = metrics
+        self.in_flight = 0
+
+        self.metrics.register(
+            "api_in_flight",
+            "Metadata records being sent to the API",
+            lambda: self.in_flight,
+        )
+
+    async def _dispatch_record(self, record: ArxivMetadata, slots: asyncio.Semaphore) -> None:
+        """
+        Dispatch a metadata record to the destination API, releasing its in-flight slot
+        :param record: Paper metadata record
+        :param slots: semaphore bounding the in-flight API requests
+        """
+
+        start = time.perf_counter()
+        self.in_flight += 1
+
+        try:
+            await self.api_controller.create_record(
+                DM_PAPER_METADATA_ROUTE,
+                record.paper_metadata,
+                trusted=True,
+            )
+        except Exception:
+            self.metrics.fail("api")
+            raise
+        else:
+            self.metrics.observe("api", time.perf_counter() - start)
+        finally:
+            self.in_flight -= 1
+            slots.release()
+
+
+class LocalTextRoutine(FileRoutine):
     """Routine extracting local ArXiv corpus texts"""
 
-    def __init__(self, file_iter: FileSystemIterator, pdf_source: PDFCorpusSource):
+    def __init__(
+        self,
+        file_iter: FileSystemIterator,
+        pdf_source: PDFCorpusSource,
+        workers: int = 1,
+        manifest: FileManifest | None = None,
+        streaming: bool = False,
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+        max_tasks: int | None = None,
+        buffer_size: int = 100,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
         """
-        Initializes the local ArXiv corpus text extraction routine
+        Initializes the local ArXiv corpus text extraction routine.
+        Providing any of the isolation limits runs each PDF extraction in a recyclable
+        worker process, quarantining the files whose extraction fails
         :param file_iter: Local file system iterator
         :param pdf_source: PDF file corpus source
+        :param workers: number of PDF extraction processes (optional)
+        :param manifest: manifest of already converted files (optional)
+        :param streaming: whether to extract and write the texts page by page (optional)
+        :param timeout: maximum seconds per PDF extraction (optional)
+        :param memory_limit: maximum bytes per PDF extraction process (optional)
+        :param max_tasks: PDF extractions after which processes are recycled (optional)
+        :param buffer_size: maximum PDF files queued between the routine stages (optional)
+        :param metrics: recorder of the routine stage metrics (optional)
         """
 
+        if workers < 1:
+            raise ValueError("The number of workers must be a positive integer")
+
         self.file_iter = file_iter
         self.pdf_source = pdf_source
+        self.manifest = manifest
+        self.streaming = streaming
+        self.workers = workers
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_tasks = max_tasks
+        self.metrics = metrics
+        self.isolated = any(limit is not None for limit in (timeout, memory_limit, max_tasks))
+        self.quarantined: List[Tuple[str, str]] = []
+        self.skipped = 0
+
+    def _build_task(self, destination_path: str, entry: FileEntry) -> TextTask | None:
+        """
+        Builds the extraction task of a PDF file, unless already converted or quarantined
+        :param destination_path: output folder to save the plain texts
+        :param entry: PDF file entry
+        :return: text extraction task
+        """
+
+        output_path = f"{destination_path}/{entry.rel_dir}"
+        manifest_key = f"{entry.rel_dir}/{entry.name}"
+
+        if self.manifest is not None and (
+            self.manifest.is_converted(manifest_key, entry.size, entry.mtime_ns)
+            or self.manifest.is_quarantined(manifest_key, entry.size, entry.mtime_ns)
+        ):
+            self.skipped += 1
+            return None
+
+        return TextTask(
+            file_path=entry.path,
+            file_name=entry.name,
+            file_size=entry.size,
+            file_mtime_ns=entry.mtime_ns,
+            output_path=output_path,
+            manifest_key=manifest_key,
+            overwrite=self.manifest is not None,
+            streaming=self.streaming,
+        )
+
+    def _record_result(self, result: TextTaskResult, timings: Dict[int, List[float]]) -> None:
+        """
+        Records a text extraction result in the manifest and the worker timings
+        :param result: text extraction result
+        :param timings: dictionary of process ID - elapsed seconds per file
+        """
+
+        timings[result.worker_pid].append(result.elapsed)
+
+        if self.manifest is None:
+            return
+
+        self.manifest.add(
+            ManifestRecord(
+                path=result.task.manifest_key,
+                size=result.task.file_size,
+                mtime_ns=result.task.file_mtime_ns,
+            )
+        )
+
+    def _record_failure(self, task: TextTask, error: Exception) -> None:
+        """
+        Records a failed text extraction in the quarantine list, when running isolated
+        :param task: text extraction task
+        :param error: text extraction error
+        """
+
+        if not self.isolated:
+            raise error
+
+        reason = f"{type(error).__name__}: {error}"
+        logger.error(f"Quarantining file {task.file_path}. {reason}")
+        self.quarantined.append((task.file_path, reason))
+
+        if self.manifest is not None:
+            self.manifest.quarantine(
+                path=task.manifest_key,
+                size=task.file_size,
+                mtime_ns=task.file_mtime_ns,
+                reason=reason,
+            )
+
+    def _build_executor(self) -> Executor:
+        """
+        Builds the pool of worker processes to extract the texts with
+        :return: executor object
+        """
+
+        if self.isolated:
+            return IsolatedWorkerPool(
+                max_workers=self.workers,
+                initializer=_init_text_worker,
+                initargs=(self.pdf_source,),
+                timeout=self.timeout,
+                memory_limit=self.memory_limit,
+                max_tasks=self.max_tasks,
+            )
+
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_text_worker,
+            initargs=(self.pdf_source,),
+        )
+
+    def _build_pipeline(self, destination_path: str) -> Pipeline:
+        """
+        Builds the pipeline planning the PDF file tasks and extracting their texts.
+        A single extraction worker without limits runs in-process, on a thread
+        :param destination_path: output folder to save the plain texts
+        :return: pipeline object
+        """
+
+        plan_stage = Stage(
+            name="plan",
+            func=partial(self._build_task, destination_path),
+        )
+
+        if self.workers == 1 and not self.isolated:
+            extract_stage = Stage(
+                name="extract",
+                func=partial(_extract_text, self.pdf_source),
+                size=attrgetter("file_size"),
+            )
+        else:
+            extract_stage = Stage(
+                name="extract",
+                func=_extract_text_worker,
+                workers=self.workers,
+                kind=STAGE_KIND_PROCESS,
+                executor=self._build_executor,
+                on_error=self._record_failure,
+                size=attrgetter("file_size"),
+            )
+
+        return Pipeline([plan_stage, extract_stage], self.buffer_size, self.metrics)
+
+    def _report_throughput(self, timings: Dict[int, List[float]], wall_time: float) -> None:
+        """
+        Logs the number of processed files and the throughput of each worker
+        :param timings: dictionary of process ID - elapsed seconds per file
+        :param wall_time: total elapsed seconds of the routine
+        """
+
+        for pid, elapsed in sorted(timings.items()):
+            busy_time = sum(elapsed)
+            file_count = len(elapsed)
+            file_rate = file_count / busy_time if busy_time > 0 else 0.0
+            logger.info(
+                f"Worker {pid}: {file_count} files in {busy_time:.2f}s ({file_rate:.2f} files/s)"
+            )
+
+        total_files = sum(len(elapsed) for elapsed in timings.values())
+        total_rate = total_files / wall_time if wall_time > 0 else 0.0
+        logger.info(f"Processed {total_files} files in {wall_time:.2f}s ({total_rate:.2f} files/s)")
+        logger.info(f"Skipped {self.skipped} already converted or quarantined files")
+
+        if len(self.quarantined) > 0:
+            logger.warning(f"Quarantined {len(self.quarantined)} files:")
+            for file_path, reason in self.quarantined:
+                logger.warning(f"{file_path} - {reason}")
 
     @override
     def run(self, destination_path: str) -> None:
@@ -56,76 +423,172 @@ class LocalTextRoutine(BaseRoutine):
         :param destination_path: output folder to save the plain texts
         """
 
-        for file_path in self.file_iter.iter_paths():
-            file_name = self.file_iter.get_file_name(file_path)
-            path_diff = self.file_iter.get_path_diff(file_path)
-            output_path = f"{destination_path}/{path_diff}"
+        entries = self.file_iter.iter_entries()
+        entries = self.metrics.timed_iter("walk", entries, attrgetter("size"))
+        self.run_entries(entries, destination_path)
 
-            # Initialize TXT file writer
-            txt_handler = TextFileHandler()
-            txt_operator = LocalFileOperator(output_path, txt_handler)
+    @override
+    def run_entries(self, entries: Iterable[FileEntry], destination_path: str) -> None:
+        """
+        Main routine to extract ArXiv corpus text and store it locally, given the PDF files
+        :param entries: PDF file entries
+        :param destination_path: output folder to save the plain texts
+        """
+
+        start = time.perf_counter()
+        timings: Dict[int, List[float]] = defaultdict(list)
 
-            # Save paper contents
-            txt_content = self.pdf_source.extract_txt(file_path)
-            txt_operator.write_text(file_name, txt_content)
+        pipeline = self._build_pipeline(destination_path)
+        pipeline.run(entries, partial(self._record_result, timings=timings))
 
+        self._report_throughput(timings, time.perf_counter() - start)
 
-class MetadataRoutine(BaseRoutine):
+
+class MetadataRoutine(APIRoutine, FileRoutine):
     """Routine extracting ArXiv metadata"""
 
-    def __init__(self, file_iter: FileSystemIterator, api_ctl: DialectMapOperator):
+    def __init__(
+        self,
+        file_iter: FileSystemIterator,
+        api_ctl: DialectMapOperator,
+        batch_size: int = 100,
+        cache: MetadataCache | None = None,
+        fetch_workers: int = 1,
+        buffer_size: int = 10,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
         """
         Initializes the ArXiv corpus metadata extraction routine
         :param file_iter: Local file system iterator
         :param api_ctl: API REST operator to be used as output
+        :param batch_size: number of papers to request metadata for at once (optional)
+        :param cache: local cache for the remote metadata sources (optional)
+        :param fetch_workers: number of threads fetching metadata batches (optional)
+        :param buffer_size: maximum batches queued between the routine stages (optional)
+        :param metrics: recorder of the routine stage metrics (optional)
         """
 
+        if batch_size < 1:
+            raise ValueError("The batch size must be a positive integer")
+        if fetch_workers < 1:
+            raise ValueError("The number of fetch workers must be a positive integer")
+
+        super().__init__(api_ctl, metrics)
+
         self.files_iterator = file_iter
-        self.api_controller = api_ctl
+        self.batch_size = batch_size
+        self.cache = cache
+        self.fetch_workers = fetch_workers
+        self.buffer_size = buffer_size
         self.sources = []  # type: ignore
 
-    async def _dispatch_records(self, records: List[ArxivMetadata]) -> None:
+        if cache is not None:
+            self.metrics.register(
+                "cache_hits",
+                "Lookups served by the metadata cache",
+                lambda: cache.hits,
+                kind=PROBE_KIND_COUNTER,
+            )
+            self.metrics.register(
+                "cache_misses",
+                "Lookups not served by the metadata cache",
+                lambda: cache.misses,
+                kind=PROBE_KIND_COUNTER,
+            )
+            self.metrics.register(
+                "cache_hit_ratio",
+                "Ratio of lookups served by the metadata cache",
+                lambda: cache.hit_ratio,
+            )
+
+    def _get_metadata_records(self, paper_ids: List[str]) -> Dict[str, List[ArxivMetadata]]:
         """
-        Dispatch metadata records to the destination API
-        :param records: Paper metadata records
+        Gets the metadata records from the sources given a batch of ArXiv paper IDs
+        :param paper_ids: ArXiv paper IDs to get the metadata of
+        :return: dictionary of ArXiv paper ID - list of ArXiv paper metadata records
         """
 
-        func = self.api_controller.create_record
-        route = DM_PAPER_METADATA_ROUTE
+        metadata_records: Dict[str, List[ArxivMetadata]] = {}
+        missing_ids = paper_ids
 
-        async with asyncio.TaskGroup() as group:
-            for record in records:
-                group.create_task(func(route, record.paper_metadata))
+        for source in self.sources:
+            source_records = source.get_metadata_many(missing_ids)
+            metadata_records.update({k: v for k, v in source_records.items() if len(v) > 0})
 
-    def _get_metadata_records(self, paper_id: str) -> List[ArxivMetadata]:
+            missing_ids = [paper_id for paper_id in missing_ids if paper_id not in metadata_records]
+            if len(missing_ids) == 0:
+                break
+
+        return metadata_records
+
+    def _fetch_batch(self, paper_ids: List[str]) -> Tuple[List[str], Dict[str, List]]:
         """
-        Gets the metadata records from the sources given an ArXiv paper ID
-        :param paper_id: ArXiv paper metadata to get
-        :return: list of ArXiv paper metadata records
+        Fetches the metadata records of a batch of ArXiv paper IDs
+        :param paper_ids: ArXiv paper IDs to get the metadata of
+        :return: tuple of ArXiv paper IDs and their metadata records
         """
 
-        metadata_records = []
+        return paper_ids, self._get_metadata_records(paper_ids)
 
-        for source in self.sources:
-            metadata_records = source.get_metadata(paper_id)
-            if len(metadata_records) > 0:
-                break
+    def _iter_batches(self, entries: Iterable[FileEntry]) -> Generator:
+        """
+        Iterates on the PDF files generating batches of ArXiv paper IDs
+        :param entries: PDF file entries
+        :return: list of ArXiv paper IDs
+        """
 
-        return metadata_records
+        batch = []
+
+        for entry in entries:
+            batch.append(self.files_iterator.get_file_stem(entry.name))
+
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
 
-    def add_sources(self, metadata_urls: List[str]) -> None:
+        if len(batch) > 0:
+            yield batch
+
+    def add_sources(self, metadata_urls: List[str], api_source_type: str = SOURCE_TYPE_API) -> None:
         """
         Adds an ArXiv metadata source to the list of sources
         :param metadata_urls: URLs to extract ArXiv metadata from
+        :param api_source_type: source type of the HTTP(S) URLs, by feed parser (optional)
         """
 
         for url in metadata_urls:
             url_obj = urlparse(url)
             handler = init_handler_cls(url_obj)
-            source = init_source_cls(url_obj, handler)
+            source = init_source_cls(url_obj, handler, self.cache, api_source_type)
 
             self.sources.append(source)
 
+    async def _run_async(self, entries: Iterable[FileEntry]) -> None:
+        """
+        Fetches the metadata batches and dispatches their records concurrently
+        :param entries: PDF file entries
+        """
+
+        slots = asyncio.Semaphore(self.api_controller.max_workers)
+        fetch_stage = Stage(name="fetch", func=self._fetch_batch, workers=self.fetch_workers)
+        pipeline = Pipeline([fetch_stage], self.buffer_size, self.metrics)
+
+        with pipeline.start(self._iter_batches(entries)):
+            async with self.api_controller, asyncio.TaskGroup() as group:
+                while (batch := await asyncio.to_thread(next, pipeline, None)) is not None:
+                    paper_ids, batch_records = batch
+
+                    for paper_id in paper_ids:
+                        records = batch_records.get(paper_id, [])
+
+                        if len(records) == 0:
+                            logger.warning(f"Metadata for paper {paper_id} not found")
+                            continue
+
+                        for record in records:
+                            await slots.acquire()
+                            group.create_task(self._dispatch_record(record, slots))
+
     @override
     def run(self, *args) -> None:
         """
@@ -133,12 +596,286 @@ class MetadataRoutine(BaseRoutine):
         :param args: placeholder for positional arguments (avoid MyPy errors)
         """
 
-        for file_path in self.files_iterator.iter_paths():
-            file_name = self.files_iterator.get_file_name(file_path)
-            records = self._get_metadata_records(file_name)
+        entries = self.files_iterator.iter_entries()
+        entries = self.metrics.timed_iter("walk", entries, attrgetter("size"))
+        self.run_entries(entries)
+
+    @override
+    def run_entries(self, entries: Iterable[FileEntry], *args) -> None:
+        """
+        Main routine to extract ArXiv corpus metadata and send it to a REST API,
+        given the PDF files
+        :param entries: PDF file entries
+        :param args: placeholder for positional arguments (avoid MyPy errors)
+        """
+
+        asyncio.run(self._run_async(entries))
+
+        if self.cache is not None:
+            logger.info(
+                f"Metadata cache: {self.cache.hits} hits, {self.cache.misses} misses "
+                f"({self.cache.hit_ratio:.1%} hit ratio)"
+            )
+
+
+class CombinedRoutine(FileRoutine):
+    """
+    Routine extracting both the ArXiv corpus texts and metadata with a single tree walk.
+    The walked entries are fed to both routines through bounded queues, so the slowest
+    of them applies back-pressure on the walk instead of buffering the whole tree
+    """
+
+    def __init__(
+        self,
+        file_iter: FileSystemIterator,
+        text_routine: LocalTextRoutine,
+        metadata_routine: MetadataRoutine,
+        buffer_size: int = 1000,
+        log_interval: float = 60.0,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
+        """
+        Initializes the combined routine
+        :param file_iter: file system iterator
+        :param text_routine: routine extracting the corpus texts
+        :param metadata_routine: routine extracting the corpus metadata
+        :param buffer_size: maximum entries queued for each routine (optional)
+        :param log_interval: seconds between progress logs (optional)
+        :param metrics: recorder of the walk metrics (optional)
+        """
+
+        if buffer_size < 1:
+            raise ValueError("The buffer size must be a positive integer")
+
+        self.file_iter = file_iter
+        self.routines: Dict[str, FileRoutine] = {
+            "text": text_routine,
+            "metadata": metadata_routine,
+        }
+
+        self.buffer_size = buffer_size
+        self.log_interval = log_interval
+        self.metrics = metrics
+        self.walked = 0
+        self.consumed: Dict[str, int] = {name: 0 for name in self.routines}
+        self.errors: List[BaseException] = []
+        self.failed = threading.Event()
+
+    def _iter_queue(self, name: str, entries: queue.Queue) -> Generator:
+        """
+        Iterates on the entries queued for a routine, until the end-of-walk sentinel
+        :param name: routine name
+        :param entries: routine queue of file entries
+        :return: file entry
+        """
+
+        while (entry := entries.get()) is not None:
+            self.consumed[name] += 1
+            yield entry
+
+    def _consume(self, name: str, entries: queue.Queue, destination_path: str) -> None:
+        """
+        Runs a routine on its queued entries, recording any error it raises
+        :param name: routine name
+        :param entries: routine queue of file entries
+        :param destination_path: output path to save the data
+        """
+
+        try:
+            self.routines[name].run_entries(self._iter_queue(name, entries), destination_path)
+        except BaseException as error:
+            logger.error(f"The {name} routine failed: {error}")
+            self.errors.append(error)
+            self.failed.set()
+
+    def _put(
+        self,
+        entries: queue.Queue,
+        entry: FileEntry | None,
+        consumer: threading.Thread,
+    ) -> None:
+        """
+        Queues an entry for a routine, giving up on file entries if any of the routines fails
+        :param entries: routine queue of file entries
+        :param entry: file entry, or None to signal the end of the walk
+        :param consumer: thread running the routine
+        """
 
-            if len(records) == 0:
-                logger.warning(f"Metadata for paper {file_name} not found")
+        while consumer.is_alive():
+            if entry is not None and self.failed.is_set():
+                return
+            try:
+                entries.put(entry, timeout=0.5)
+                return
+            except queue.Full:
                 continue
 
-            asyncio.run(self._dispatch_records(records))
+    def _report_progress(self, elapsed: float) -> None:
+        """
+        Logs the number of walked and processed files
+        :param elapsed: seconds since the routine started
+        """
+
+        consumed = ", ".join(f"{name}: {count}" for name, count in self.consumed.items())
+        rate = self.walked / elapsed if elapsed > 0 else 0.0
+
+        logger.info(f"Walked {self.walked} files ({rate:.2f} files/s). Processed: {consumed}")
+
+    @override
+    def run(self, destination_path: str) -> None:
+        """
+        Main routine to extract ArXiv corpus texts and metadata with a single tree walk
+        :param destination_path: output folder to save the plain texts
+        """
+
+        entries = self.file_iter.iter_entries()
+        entries = self.metrics.timed_iter("walk", entries, attrgetter("size"))
+        self.run_entries(entries, destination_path)
+
+    @override
+    def run_entries(self, entries: Iterable[FileEntry], destination_path: str) -> None:
+        """
+        Main routine to extract ArXiv corpus texts and metadata, given the PDF files
+        :param entries: PDF file entries
+        :param destination_path: output folder to save the plain texts
+        """
+
+        queues: Dict[str, queue.Queue] = {
+            name: queue.Queue(self.buffer_size) for name in self.routines
+        }
+        threads = {
+            name: threading.Thread(
+                target=self._consume,
+                args=(name, queues[name], destination_path),
+                name=f"combined-{name}",
+            )
+            for name in self.routines
+        }
+
+        for name, entries_queue in queues.items():
+            self.metrics.register(
+                "queue_depth",
+                "Items waiting to be processed by each pipeline stage",
+                entries_queue.qsize,
+                labels={"queue": f"combined-{name}"},
+            )
+
+        for thread in threads.values():
+            thread.start()
+
+        start = last_log = time.perf_counter()
+
+        try:
+            for entry in entries:
+                if self.failed.is_set():
+                    break
+
+                self.walked += 1
+                for name, entries_queue in queues.items():
+                    self._put(entries_queue, entry, threads[name])
+
+                now = time.perf_counter()
+                if now - last_log >= self.log_interval:
+                    self._report_progress(now - start)
+                    last_log = now
+        except BaseException:
+            self.failed.set()
+            raise
+        finally:
+            for name, entries_queue in queues.items():
+                self._put(entries_queue, None, threads[name])
+            for thread in threads.values():
+                thread.join()
+
+        if len(self.errors) > 0:
+            raise self.errors[0]
+
+        self._report_progress(time.perf_counter() - start)
+
+
+class SnapshotBackfillRoutine(APIRoutine):
+    """
+    Routine sending the metadata of every paper within an ArXiv Kaggle snapshot,
+    regardless of the local PDF files. The snapshot is split into byte ranges,
+    parsed by a pool of worker processes
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        api_ctl: DialectMapOperator,
+        workers: int = 1,
+        chunk_size: int = 16 << 20,
+        filters: SnapshotFilter | None = None,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
+        """
+        Initializes the ArXiv snapshot backfill routine
+        :param snapshot_path: path to the Kaggle JSON-lines snapshot
+        :param api_ctl: API REST operator to be used as output
+        :param workers: number of snapshot parsing processes (optional)
+        :param chunk_size: approximate bytes per parsed snapshot range (optional)
+        :param filters: criteria to select the papers to send (optional)
+        :param metrics: recorder of the routine stage metrics (optional)
+        """
+
+        if workers < 1:
+            raise ValueError("The number of workers must be a positive integer")
+
+        super().__init__(api_ctl, metrics)
+
+        self.snapshot_path = snapshot_path
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.filters = filters or SnapshotFilter()
+        self.records = 0
+
+    def _build_executor(self) -> Executor:
+        """
+        Builds the pool of worker processes to parse the snapshot ranges with
+        :return: executor object
+        """
+
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_process_profiler,
+        )
+
+    async def _run_async(self) -> None:
+        """Parses the snapshot ranges and dispatches their records concurrently"""
+
+        slots = asyncio.Semaphore(self.api_controller.max_workers)
+        parse_stage = Stage(
+            name="parse",
+            func=partial(parse_snapshot_range, self.snapshot_path, self.filters),
+            workers=self.workers,
+            kind=STAGE_KIND_PROCESS,
+            executor=self._build_executor,
+            size=snapshot_range_size,
+        )
+
+        pipeline = Pipeline([parse_stage], self.workers * 2, self.metrics)
+        ranges = iter_snapshot_ranges(self.snapshot_path, self.chunk_size)
+
+        with pipeline.start(ranges):
+            async with self.api_controller, asyncio.TaskGroup() as group:
+                while (records := await asyncio.to_thread(next, pipeline, None)) is not None:
+                    for record in records:
+                        await slots.acquire()
+                        group.create_task(self._dispatch_record(record, slots))
+
+                    self.records += len(records)
+
+    @override
+    def run(self, *args) -> None:
+        """
+        Main routine to send the ArXiv snapshot metadata to a REST API
+        :param args: placeholder for positional arguments (avoid MyPy errors)
+        """
+
+        start = time.perf_counter()
+        asyncio.run(self._run_async())
+        elapsed = time.perf_counter() - start
+
+        rate = self.records / elapsed if elapsed > 0 else 0.0
+        logger.info(f"Sent {self.records} paper revisions in {elapsed:.2f}s ({rate:.2f} records/s)")
@@ -9,3 +9,4 @@ DATA_FOLDER = PROJECT_PATH.joinpath(".data")
 
 FEED_FOLDER = DATA_FOLDER.joinpath("feed")
 JSON_FOLDER = DATA_FOLDER.joinpath("json")
+PDF_FOLDER = DATA_FOLDER.joinpath("pdf")
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+import json
+import threading
+import time
+
+from contextlib import contextmanager
+from typing import Generator
+from typing import Tuple
+from urllib.error import HTTPError
+from urllib.request import Request
+from urllib.request import urlopen
+
+import pytest
+
+from benchmarks.servers import ArxivAPIRequestHandler
+from benchmarks.servers import DialectMapAPIRequestHandler
+from benchmarks.servers import ServerBehavior
+from benchmarks.servers import StandInServer
+from benchmarks.servers import load_feed_entries
+
+from src.job.handlers import BulkDialectMapAPIHandler
+from src.job.output import NoAuthenticator
+
+from ..__paths import FEED_FOLDER
+
+
+@contextmanager
+def serve(handler_cls: type, behavior: ServerBehavior, entries: dict | None = None) -> Generator:
+    """
+    Serves a stand-in server on an ephemeral port, within a background thread
+    :param handler_cls: request handler class
+    :param behavior: latency and failures of the responses
+    :param entries: dictionary of paper ID - Atom <entry> element (optional)
+    :return: server base URL
+    """
+
+    server = StandInServer(("127.0.0.1", 0), handler_cls, behavior, entries)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def request(url: str, body: object = None) -> Tuple[int, dict, bytes]:
+    """
+    Sends a GET request, or a POST request if a JSON body is provided
+    :param url: request URL
+    :param body: JSON body (optional)
+    :return: response status, headers and body
+    """
+
+    data = json.dumps(body).encode() if body is not None else None
+
+    try:
+        with urlopen(Request(url, data=data), timeout=10) as response:
+            return response.status, dict(response.headers), response.read()
+    except HTTPError as error:
+        return error.code, dict(error.headers), error.read()
+
+
+def test_server_latency():
+    """
+    Tests the delayed responses of the stand-in servers
+    """
+
+    with serve(DialectMapAPIRequestHandler, ServerBehavior(latency=0.2)) as url:
+        start = time.perf_counter()
+        status, _, _ = request(f"{url}/paper/metadata", {"id": 0})
+        elapsed = time.perf_counter() - start
+
+    assert status == 201
+    assert elapsed >= 0.2
+
+
+def test_server_error_rate():
+    """
+    Tests the ratio of failed responses of the stand-in servers, and their counting
+    """
+
+    with serve(DialectMapAPIRequestHandler, ServerBehavior(error_rate=0.5, seed=1)) as url:
+        statuses = [request(f"{url}/paper/metadata", {"id": i})[0] for i in range(200)]
+        _, _, stats = request(f"{url}/stats")
+
+    failures = statuses.count(503)
+    counters = json.loads(stats)
+
+    assert set(statuses) == {201, 503}
+    assert 60 <= failures <= 140
+    assert counters["statuses"]["503"] == failures
+    assert counters["records"]["POST"] == 200 - failures
+
+
+def test_server_rate_limit():
+    """
+    Tests the 429 responses of the stand-in servers, once over their rate limit
+    """
+
+    with serve(DialectMapAPIRequestHandler, ServerBehavior(rate_limit=2)) as url:
+        responses = [request(f"{url}/paper/metadata", {"id": i}) for i in range(3)]
+
+    assert [status for status, _, _ in responses] == [201, 201, 429]
+    assert responses[2][1]["Retry-After"] == "1"
+
+
+def test_server_rate_limit_below_one():
+    """
+    Tests the stand-in servers rate limits below one request per second
+    """
+
+    with serve(DialectMapAPIRequestHandler, ServerBehavior(rate_limit=0.5)) as url:
+        statuses = [request(f"{url}/paper/metadata", {"id": i})[0] for i in range(2)]
+
+    assert statuses == [201, 429]
+
+
+def test_server_bulk_records():
+    """
+    Tests the bulk records creation on the Dialect Map API stand-in server,
+    through the bulk API handler with no authentication
+    """
+
+    with serve(DialectMapAPIRequestHandler, ServerBehavior()) as url:
+        handler = BulkDialectMapAPIHandler(NoAuthenticator(), base_url=url)
+        response = handler.create_records("/paper/metadata", [{"id": 0}, {"id": 1}])
+
+        status, _, stats = request(f"{url}/stats")
+
+    assert response == {"accepted": 2}
+    assert status == 200
+    assert json.loads(stats) == {"records": {"POST": 2}, "statuses": {"201": 1}}
+
+
+def test_server_bulk_records_failure():
+    """
+    Tests the raising of the failed bulk records creations by the bulk API handler
+    """
+
+    with serve(DialectMapAPIRequestHandler, ServerBehavior(error_rate=1)) as url:
+        handler = BulkDialectMapAPIHandler(NoAuthenticator(), base_url=url)
+
+        with pytest.raises(ConnectionError) as error_info:
+            handler.create_records("/paper/metadata", [{"id": 0}])
+
+    assert "/paper/metadata/bulk" in str(error_info.value)
+    assert "503" in str(error_info.value)
+
+
+def test_server_arxiv_query():
+    """
+    Tests the ArXiv export API stand-in server feeds, truncated to the default page size
+    """
+
+    entries = load_feed_entries(FEED_FOLDER)
+    paper_ids = ",".join(["hep-ex/0307015", "0704.0002", "missing"])
+
+    with serve(ArxivAPIRequestHandler, ServerBehavior(), entries) as url:
+        status, headers, feed = request(f"{url}/api/query?id_list={paper_ids}")
+        paged_status, _, paged_feed = request(f"{url}/api/query?id_list={paper_ids}&max_results=1")
+
+    assert status == 200
+    assert headers["Content-Type"].startswith("application/atom+xml")
+    assert feed.count(b"<entry") == 2
+    assert paged_status == 200
+    assert paged_feed.count(b"<entry") == 1
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import shutil
+import threading
+import time
+
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+import pytest
+
+from src.job.handlers import BulkDialectMapAPIHandler
+
+from .__paths import PDF_FOLDER
+
+
+class StubAPIServer:
+    """Dialect map API handler stub recording the received requests and their concurrency"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.failure: Exception | None = None
+        self.routine: Any = None
+        self.requests: List[Tuple[str, dict | list]] = []
+        self.active = 0
+        self.max_active = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def records(self) -> List[dict | list]:
+        return [record for _, record in self.requests]
+
+    def _receive(self, api_path: str, record: dict | list) -> None:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            if self.routine is not None:
+                self.max_in_flight = max(self.max_in_flight, self.routine.in_flight)
+
+        time.sleep(self.latency)
+
+        with self.lock:
+            self.active -= 1
+            self.requests.append((api_path, record))
+
+        if self.failure is not None:
+            raise self.failure
+
+    def create_record(self, api_path: str, record: dict) -> None:
+        self._receive(api_path, record)
+
+
+class StubBulkAPIServer(BulkDialectMapAPIHandler, StubAPIServer):
+    """Dialect map API bulk handler stub recording the received requests and their concurrency"""
+
+    def __init__(self, latency: float = 0.0):
+        StubAPIServer.__init__(self, latency)
+
+    def create_records(self, api_path: str, records: List[dict]) -> None:
+        self._receive(f"{api_path}/bulk", records)
+
+
+@pytest.fixture
+def api_server() -> StubAPIServer:
+    """
+    Dialect map API handler stub, without latency nor failures by default
+    :return: API handler stub
+    """
+
+    return StubAPIServer()
+
+
+@pytest.fixture
+def bulk_api_server() -> StubBulkAPIServer:
+    """
+    Dialect map API bulk handler stub, without latency nor failures by default
+    :return: API bulk handler stub
+    """
+
+    return StubBulkAPIServer()
+
+
+@pytest.fixture
+def build_corpus(tmp_path: Path) -> Callable[[int], Path]:
+    """
+    Factory of nested corpora of PDF files, copying the sample PDF under ArXiv paper IDs
+    :param tmp_path: folder to build the corpora in
+    :return: corpus factory, given the number of PDF files
+    """
+
+    def build(papers: int) -> Path:
+        corpus_path = tmp_path.joinpath("corpus")
+
+        for index in range(papers):
+            file_path = corpus_path.joinpath(f"07{index % 2:02}", f"0704.{index:04}.pdf")
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(PDF_FOLDER.joinpath("sample.pdf"), file_path)
+
+        return corpus_path
+
+    return build
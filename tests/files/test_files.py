@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import os
 import tempfile
 import shutil
 
 from pathlib import Path
+from typing import Any
 from typing import Generator
 from typing import List
 from typing import Tuple
@@ -73,3 +75,152 @@ def test_file_iterator_all_paths(tmp_files: Tuple[str, List[str]]):
     assert len(file_paths) == len(tmp_file_paths)
     assert all(Path(path).is_file() for path in file_paths)
     assert all(Path(path).suffix == TEST_EXTENSION for path in file_paths)
+
+
+def test_file_iterator_iter_entries(tmp_path: Path):
+    """
+    Tests the correct entries generated by the FileSystemIterator class tree walk
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    (tmp_path / "A" / "B").mkdir(parents=True)
+    (tmp_path / ".hidden").mkdir()
+
+    (tmp_path / "root.test").write_text("1")
+    (tmp_path / "A" / "a.test").write_text("12")
+    (tmp_path / "A" / "B" / "b.test").write_text("123")
+    (tmp_path / "A" / "B" / "b.other").write_text("1234")
+    (tmp_path / ".hidden" / "h.test").write_text("12345")
+
+    iterator = FileSystemIterator(tmp_path, TEST_EXTENSION)
+    entries = sorted(iterator.iter_entries(), key=lambda entry: (entry.rel_dir, entry.name))
+
+    assert [(entry.rel_dir, entry.name, entry.size) for entry in entries] == [
+        (".", "root.test", 1),
+        ("A", "a.test", 2),
+        ("A/B", "b.test", 3),
+    ]
+
+    for entry in entries:
+        assert Path(entry.path).is_file()
+        assert iterator.get_path_diff(entry.path) == Path(entry.rel_dir)
+        assert Path(entry.path).stat().st_mtime_ns == entry.mtime_ns
+
+
+def test_file_iterator_symlink_loops(tmp_path: Path):
+    """
+    Tests the single traversal of the FileSystemIterator class folders linked within the tree
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    (tmp_path / "A" / "B").mkdir(parents=True)
+    (tmp_path / "A" / "a.test").write_text("")
+    (tmp_path / "A" / "B" / "b.test").write_text("")
+    (tmp_path / "A" / "B" / "parent").symlink_to(tmp_path / "A")
+    (tmp_path / "A" / "root").symlink_to(tmp_path)
+
+    for workers in (1, 2):
+        iterator = FileSystemIterator(tmp_path, TEST_EXTENSION, workers=workers)
+        names = sorted(entry.name for entry in iterator.iter_entries())
+
+        assert names == ["a.test", "b.test"]
+
+
+def test_file_iterator_removed_files(tmp_path: Path, monkeypatch):
+    """
+    Tests the skipping of files removed while the FileSystemIterator class scans their folder
+    :param tmp_path: Pytest provided fixture to use as base path
+    :param monkeypatch: Pytest provided fixture to patch the folder scans
+    """
+
+    (tmp_path / "A").mkdir()
+    (tmp_path / "A" / "kept.test").write_text("")
+    (tmp_path / "A" / "removed.test").write_text("")
+
+    scandir = os.scandir
+
+    class ListedScanner(list):
+        def __enter__(self) -> "ListedScanner":
+            return self
+
+        def __exit__(self, *args) -> None:
+            pass
+
+    def scandir_and_remove(path: str) -> Any:
+        with scandir(path) as scanner:
+            entries = ListedScanner(scanner)
+
+        Path(path, "removed.test").unlink(missing_ok=True)
+        return entries
+
+    monkeypatch.setattr(os, "scandir", scandir_and_remove)
+
+    iterator = FileSystemIterator(tmp_path, TEST_EXTENSION)
+    names = [entry.name for entry in iterator.iter_entries()]
+
+    assert names == ["kept.test"]
+
+
+@pytest.fixture(scope="function")
+def tmp_tree(tmp_path: Path) -> Path:
+    """
+    Fixture to make a tree of temporal files, within several top-level folders, available
+    :param tmp_path: Pytest provided fixture to use as base path
+    :return: tree root path
+    """
+
+    for folder_index in range(5):
+        folder = tmp_path / f"F{folder_index}" / "sub"
+        folder.mkdir(parents=True)
+
+        for file_index in range(10):
+            (folder / f"{file_index}{TEST_EXTENSION}").write_text("")
+
+    (tmp_path / f"root{TEST_EXTENSION}").write_text("")
+    return tmp_path
+
+
+def test_file_iterator_parallel_walk(tmp_tree: Path):
+    """
+    Tests the equivalence of the FileSystemIterator class serial and parallel traversals
+    :param tmp_tree: tree root path
+    """
+
+    serial_iterator = FileSystemIterator(tmp_tree, TEST_EXTENSION)
+    parallel_iterator = FileSystemIterator(tmp_tree, TEST_EXTENSION, workers=3)
+
+    serial_paths = serial_iterator.all_paths()
+    parallel_paths = parallel_iterator.all_paths()
+
+    assert len(serial_paths) == 51
+    assert sorted(serial_paths) == sorted(parallel_paths)
+
+    # Stopping the iteration early must not block the walker threads
+    parallel_entries = parallel_iterator.iter_entries()
+    next(parallel_entries)
+    parallel_entries.close()
+
+
+@pytest.mark.parametrize("shard_mode", ["hash", "dir"])
+def test_file_iterator_sharding(tmp_tree: Path, shard_mode: str):
+    """
+    Tests the disjoint and complete split of files among the FileSystemIterator class shards
+    :param tmp_tree: tree root path
+    :param shard_mode: split the tree by file path hash or top-level folder
+    """
+
+    shard_paths = [
+        FileSystemIterator(
+            tmp_tree,
+            TEST_EXTENSION,
+            shard_index=shard_index,
+            shard_count=3,
+            shard_mode=shard_mode,
+        ).all_paths()
+        for shard_index in range(3)
+    ]
+
+    all_paths = [path for paths in shard_paths for path in paths]
+
+    assert len(all_paths) == len(set(all_paths)) == 51
+    assert pytest.raises(ValueError, FileSystemIterator, tmp_tree, TEST_EXTENSION, 1, 3, 3)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+from typing import List
+
+from src.job.input import ArxivMetadataSource
+from src.job.parsers import FeedMetadataParser
+
+from ..__paths import FEED_FOLDER
+
+
+class StubArxivAPIHandler:
+    """ArXiv API handler stub serving a fixed multi-entry feed"""
+
+    def __init__(self, feed_text: str):
+        self.feed_text = feed_text
+        self.queries: List[str] = []
+
+    def request_metadata(self, paper_id: str) -> str:
+        self.queries.append(paper_id)
+        return self.feed_text
+
+
+class PagedArxivAPIHandler(StubArxivAPIHandler):
+    """ArXiv API handler stub truncating the responses to the export API default page size"""
+
+    page_size = 10
+
+    def request_metadata(self, paper_id: str) -> str:
+        self.queries.append(paper_id)
+
+        feed_head, feed_entry = re.findall(r"(.*?)(<entry>.*?</entry>)", self.feed_text, re.S)[-1]
+        paper_ids = paper_id.split(",")[: self.page_size]
+        entries = [feed_entry.replace("0704.0002", paper_id) for paper_id in paper_ids]
+
+        return feed_head + "".join(entries) + "</feed>"
+
+
+def test_api_source_batch_request():
+    """
+    Tests the packing of several paper IDs into a single ArXiv export API query
+    """
+
+    feed_file = FEED_FOLDER.joinpath("arxiv_feed_multi.xml")
+    feed_text = open(feed_file, "r").read()
+
+    handler = StubArxivAPIHandler(feed_text)
+    source = ArxivMetadataSource(handler, FeedMetadataParser())  # type: ignore
+
+    metadata = source.get_metadata_many(["hep-ex/0307015", "0704.0002"])
+
+    assert handler.queries == ["hep-ex/0307015,0704.0002"]
+    assert [entry.paper_id for entry in metadata["hep-ex/0307015"]] == ["hep-ex/0307015"]
+    assert [entry.paper_id for entry in metadata["0704.0002"]] == ["0704.0002"]
+
+
+def test_api_source_batch_fallback():
+    """
+    Tests the individual retrieval of paper IDs missing from a batch response
+    """
+
+    feed_file = FEED_FOLDER.joinpath("arxiv_feed.xml")
+    feed_text = open(feed_file, "r").read()
+
+    handler = StubArxivAPIHandler(feed_text)
+    source = ArxivMetadataSource(handler, FeedMetadataParser(), batch_size=2)  # type: ignore
+
+    metadata = source.get_metadata_many(["hep-ex/0307015", "0704.0002", "0704.0003"])
+
+    assert handler.queries == ["hep-ex/0307015,0704.0002", "0704.0002", "0704.0003"]
+    assert len(metadata) == 3
+    assert [entry.paper_id for entry in metadata["hep-ex/0307015"]] == ["hep-ex/0307015"]
+    assert metadata["0704.0002"] == []
+    assert metadata["0704.0003"] == []
+
+
+def test_api_source_single_request_id_check():
+    """
+    Tests the discarding of unrequested paper IDs returned by single ArXiv export API queries
+    """
+
+    feed_file = FEED_FOLDER.joinpath("arxiv_feed_multi.xml")
+    feed_text = open(feed_file, "r").read()
+
+    handler = StubArxivAPIHandler(feed_text)
+    source = ArxivMetadataSource(handler, FeedMetadataParser())  # type: ignore
+
+    metadata = source.get_metadata("0704.0002")
+
+    assert handler.queries == ["0704.0002"]
+    assert [entry.paper_id for entry in metadata] == ["0704.0002"]
+
+
+def test_api_source_batch_page_size():
+    """
+    Tests the packing of the paper IDs into queries answered within a single results page
+    """
+
+    feed_file = FEED_FOLDER.joinpath("arxiv_feed_multi.xml")
+    feed_text = open(feed_file, "r").read()
+
+    paper_ids = [f"0704.{i:04}" for i in range(100, 125)]
+
+    handler = PagedArxivAPIHandler(feed_text)
+    source = ArxivMetadataSource(handler, FeedMetadataParser())  # type: ignore
+
+    metadata = source.get_metadata_many(paper_ids)
+
+    assert [len(query.split(",")) for query in handler.queries] == [10, 10, 5]
+    assert all([entry.paper_id for entry in metadata[p]] == [p] for p in paper_ids)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+
+from src.job.input import MetadataCache
+from src.job.models import ArxivMetadata
+from src.job.models import ArxivMetadataAuthor
+from src.job.models import ArxivMetadataCategory
+
+
+def build_metadata(paper_id: str) -> ArxivMetadata:
+    """
+    Builds a sample metadata object given a paper ID
+    :param paper_id: ArXiv paper ID
+    :return: metadata object
+    """
+
+    date = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    return ArxivMetadata(
+        paper_id=paper_id,
+        paper_rev=1,
+        paper_doi="",
+        paper_title="Title",
+        paper_description="Description",
+        paper_categories=(ArxivMetadataCategory("hep-ex"),),
+        paper_authors=(ArxivMetadataAuthor("Author"),),
+        paper_links=(),
+        paper_created_at=date,
+        paper_updated_at=date,
+    )
+
+
+def test_cache_hit_and_miss(tmp_path: Path):
+    """
+    Tests the correct storage and lookup counters of the MetadataCache class
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    cache = MetadataCache(tmp_path / "cache.db")
+    records = [build_metadata("0704.0001")]
+
+    key_1 = cache.build_key("query", "0704.0001")
+    key_2 = cache.build_key("query", "0704.0002")
+
+    assert cache.get(key_1) is None
+    cache.put(key_1, records)
+
+    assert cache.get(key_1) == records
+    assert cache.get(key_2) is None
+
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_cache_expiration(tmp_path: Path):
+    """
+    Tests the expiration of entries by the MetadataCache class
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    cache = MetadataCache(tmp_path / "cache.db", ttl=1e-9)
+    key = cache.build_key("query", "0704.0001")
+
+    cache.put(key, [build_metadata("0704.0001")])
+
+    assert cache.get(key) is None
+    assert cache.total_bytes == 0
+
+
+def test_cache_lru_eviction(tmp_path: Path):
+    """
+    Tests the eviction of the least recently used entries by the MetadataCache class
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    cache = MetadataCache(tmp_path / "cache.db")
+    keys = [cache.build_key("query", f"0704.000{i}") for i in range(3)]
+
+    cache.put(keys[0], [build_metadata("0704.0000")])
+    cache.max_bytes = cache.total_bytes * 2
+
+    cache.put(keys[1], [build_metadata("0704.0001")])
+    cache.get(keys[0])
+    cache.put(keys[2], [build_metadata("0704.0002")])
+
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
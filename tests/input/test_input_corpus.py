@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from dialect_map_io import PDFFileHandler
+
+from src.job.handlers import StreamingPDFFileHandler
+from src.job.input import PDFCorpusSource
+
+from ..__paths import PDF_FOLDER
+
+
+def test_corpus_iter_pages():
+    """
+    Tests the page by page text extraction of the PDFCorpusSource class
+    """
+
+    source = PDFCorpusSource(StreamingPDFFileHandler())
+    pages = list(source.iter_txt(str(PDF_FOLDER.joinpath("sample.pdf"))))
+
+    assert len(pages) == 2
+    assert pages[0].strip() == "First page text"
+    assert pages[1].strip() == "Second page text"
+
+
+def test_corpus_iter_pages_custom_handler():
+    """
+    Tests the page by page text extraction of streaming handler subclasses,
+    and the complete file read of any other handler by the PDFCorpusSource class
+    """
+
+    class CustomPDFHandler(PDFFileHandler):
+        def read_file(self, file_path: str) -> str:
+            return f"Text of {file_path}"
+
+    class CustomStreamingPDFHandler(StreamingPDFFileHandler):
+        def read_file(self, file_path: str) -> str:
+            return f"Text of {file_path}"
+
+    source = PDFCorpusSource(CustomPDFHandler())
+    pages = list(source.iter_txt("sample.pdf"))
+
+    assert pages == [source.extract_txt("sample.pdf")]
+    assert pages == ["Text of sample.pdf"]
+
+    source = PDFCorpusSource(CustomStreamingPDFHandler())
+    pages = list(source.iter_txt(str(PDF_FOLDER.joinpath("sample.pdf"))))
+
+    assert len(pages) == 2
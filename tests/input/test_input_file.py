@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+import json
+from pathlib import Path
+
+import pytest
+
+from dialect_map_io import JSONFileHandler
+
+from src.job.input import JSONLinesIndex
+from src.job.input import JSONMetadataSource
+from src.job.parsers import JSONMetadataParser
+
+from ..__paths import JSON_FOLDER
+
+
+@pytest.fixture(scope="function")
+def snapshot_path(tmp_path: Path) -> Path:
+    """
+    Fixture to make a JSON-lines snapshot of the sample entries available during a test
+    :param tmp_path: Pytest provided fixture to use as base path
+    :return: snapshot file path
+    """
+
+    file_path = tmp_path / "snapshot.json"
+
+    with open(file_path, "w") as file:
+        for entry_path in sorted(JSON_FOLDER.glob("*.json")):
+            entry = json.loads(entry_path.read_text())
+            file.write(json.dumps(entry) + "\n")
+
+    return file_path
+
+
+def test_json_index_build(snapshot_path: Path):
+    """
+    Tests the correct offsets registered by the JSONLinesIndex class
+    :param snapshot_path: snapshot file path
+    """
+
+    index = JSONLinesIndex.build(str(snapshot_path))
+    lines = snapshot_path.read_bytes().splitlines(keepends=True)
+
+    assert len(index) == 3
+    assert list(index.hashes) == sorted(index.hashes)
+
+    for line in lines:
+        paper_id = json.loads(line)["id"]
+        offset, length = next(index.find(paper_id))
+        assert snapshot_path.read_bytes()[offset : offset + length] == line
+
+    assert list(index.find("0000.0000")) == []
+
+
+def test_json_index_build_sorting(tmp_path: Path):
+    """
+    Tests the bucketed hash sorting of the JSONLinesIndex class on a larger file
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    file_path = tmp_path / "snapshot.json"
+    paper_ids = [f"0704.{i:04}" for i in range(5000)]
+
+    with open(file_path, "w") as file:
+        for paper_id in paper_ids:
+            file.write(json.dumps({"id": paper_id}) + "\n")
+
+    index = JSONLinesIndex.build(str(file_path))
+    content = file_path.read_bytes()
+
+    assert len(index) == 5000
+    assert list(index.hashes) == sorted(index.hashes)
+
+    for paper_id in paper_ids:
+        offset, length = next(index.find(paper_id))
+        assert json.loads(content[offset : offset + length])["id"] == paper_id
+
+
+def test_json_source_get_metadata(snapshot_path: Path):
+    """
+    Tests the correct metadata retrieval of the JSONMetadataSource class
+    :param snapshot_path: snapshot file path
+    """
+
+    source = JSONMetadataSource(JSONFileHandler(), JSONMetadataParser(), str(snapshot_path))
+
+    entries_1 = source.get_metadata("0704.0002")
+    entries_2 = source.get_metadata("supr-con/9609003")
+
+    assert [(entry.paper_id, entry.paper_rev) for entry in entries_1] == [
+        ("0704.0002", 1),
+        ("0704.0002", 2),
+    ]
+    assert [(entry.paper_id, entry.paper_rev) for entry in entries_2] == [
+        ("supr-con/9609003", 1),
+    ]
+
+    assert source.get_metadata("0000.0000") == []
+
+    source.close()
+
+
+def test_json_index_persistence(snapshot_path: Path, tmp_path: Path):
+    """
+    Tests the persistence and memory-mapped loading of the JSONLinesIndex class
+    :param snapshot_path: snapshot file path
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    index_path = tmp_path / "snapshot.json.idx"
+    fingerprint = JSONLinesIndex.fingerprint(str(snapshot_path))
+
+    built_index = JSONLinesIndex.build(str(snapshot_path))
+    built_index.save(index_path, fingerprint)
+
+    loaded_index = JSONLinesIndex.load(index_path, fingerprint)
+
+    assert loaded_index is not None
+    assert list(loaded_index.hashes) == list(built_index.hashes)
+    assert list(loaded_index.offsets) == list(built_index.offsets)
+    assert list(loaded_index.lengths) == list(built_index.lengths)
+    assert list(loaded_index.find("0704.0001")) == list(built_index.find("0704.0001"))
+
+    loaded_index.close()
+
+    assert loaded_index.mapped is None
+
+
+def test_json_index_stale(snapshot_path: Path, tmp_path: Path):
+    """
+    Tests the rejection of persisted indexes not matching the source fingerprint
+    :param snapshot_path: snapshot file path
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    index_path = tmp_path / "snapshot.json.idx"
+    fingerprint = JSONLinesIndex.fingerprint(str(snapshot_path))
+
+    JSONLinesIndex.build(str(snapshot_path)).save(index_path, fingerprint)
+
+    with open(snapshot_path, "a") as file:
+        file.write("\n")
+
+    assert JSONLinesIndex.load(index_path, JSONLinesIndex.fingerprint(str(snapshot_path))) is None
+    assert JSONLinesIndex.load(tmp_path / "missing.idx", fingerprint) is None
+
+
+def test_json_source_get_metadata_many(snapshot_path: Path):
+    """
+    Tests the correct bulk metadata retrieval of the JSONMetadataSource class
+    :param snapshot_path: snapshot file path
+    """
+
+    source = JSONMetadataSource(JSONFileHandler(), JSONMetadataParser(), str(snapshot_path))
+    paper_ids = ["0704.0002", "0000.0000", "supr-con/9609003"]
+
+    metas = source.get_metadata_many(paper_ids)
+
+    assert metas == {paper_id: source.get_metadata(paper_id) for paper_id in paper_ids}
+    assert [meta.paper_rev for meta in metas["0704.0002"]] == [1, 2]
+
+    source.close()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+import json
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+
+import pytest
+
+from src.job.input import SnapshotFilter
+from src.job.input import iter_snapshot_ranges
+from src.job.input import parse_snapshot_range
+from src.job.input import snapshot_range_size
+
+from ..__paths import JSON_FOLDER
+
+
+@pytest.fixture(scope="function")
+def snapshot_path(tmp_path: Path) -> Path:
+    """
+    Fixture to make a JSON-lines snapshot of the sample entries available during a test
+    :param tmp_path: Pytest provided fixture to use as base path
+    :return: snapshot file path
+    """
+
+    file_path = tmp_path / "snapshot.json"
+
+    with open(file_path, "w") as file:
+        for entry_path in sorted(JSON_FOLDER.glob("*.json")):
+            entry = json.loads(entry_path.read_text())
+            file.write(json.dumps(entry) + "\n")
+
+    return file_path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 1 << 20])
+def test_snapshot_ranges_split(snapshot_path: Path, chunk_size: int):
+    """
+    Tests the line-aligned splitting of a snapshot into contiguous byte ranges
+    :param snapshot_path: snapshot file path
+    :param chunk_size: approximate bytes per range
+    """
+
+    content = snapshot_path.read_bytes()
+    ranges = list(iter_snapshot_ranges(str(snapshot_path), chunk_size))
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(content)
+    assert all(prev[1] == next[0] for prev, next in zip(ranges, ranges[1:]))
+    assert all(content[end - 1 : end] == b"\n" for _, end in ranges)
+    assert sum(snapshot_range_size(byte_range) for byte_range in ranges) == len(content)
+
+
+def test_snapshot_range_parse(snapshot_path: Path):
+    """
+    Tests the parsing of every paper revision within the snapshot ranges
+    :param snapshot_path: snapshot file path
+    """
+
+    papers = [
+        paper
+        for byte_range in iter_snapshot_ranges(str(snapshot_path), 100)
+        for paper in parse_snapshot_range(str(snapshot_path), SnapshotFilter(), byte_range)
+    ]
+
+    assert [(paper.paper_id, paper.paper_rev) for paper in papers] == [
+        ("0704.0001", 1),
+        ("0704.0001", 2),
+        ("0704.0002", 1),
+        ("0704.0002", 2),
+        ("supr-con/9609003", 1),
+    ]
+
+
+def test_snapshot_range_filters(snapshot_path: Path):
+    """
+    Tests the selection of papers by category, archive and revision date
+    :param snapshot_path: snapshot file path
+    """
+
+    file_size = snapshot_path.stat().st_size
+
+    def parse(filters: SnapshotFilter) -> list:
+        papers = parse_snapshot_range(str(snapshot_path), filters, (0, file_size))
+        return [(paper.paper_id, paper.paper_rev) for paper in papers]
+
+    assert parse(SnapshotFilter(categories=frozenset(["cs.CG"]))) == [
+        ("0704.0002", 1),
+        ("0704.0002", 2),
+    ]
+    assert parse(SnapshotFilter(categories=frozenset(["cond-mat"]))) == [
+        ("supr-con/9609003", 1),
+    ]
+    assert parse(
+        SnapshotFilter(
+            since=datetime(2007, 4, 1, tzinfo=timezone.utc),
+            until=datetime(2007, 5, 1, tzinfo=timezone.utc),
+        )
+    ) == [
+        ("0704.0001", 1),
+    ]
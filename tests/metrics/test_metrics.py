@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+
+from src.job.metrics import MetricsRecorder
+from src.job.metrics import NULL_METRICS
+from src.job.metrics import StageMetrics
+
+
+def test_stage_metrics_percentiles():
+    """
+    Tests the computation of the stage latency percentiles
+    """
+
+    stage = StageMetrics("extract")
+
+    for millis in range(1, 101):
+        stage.observe(millis / 1000, size=10)
+
+    stage.fail()
+    summary = stage.summary(elapsed=2.0)
+
+    assert summary["count"] == 100
+    assert summary["bytes"] == 1000
+    assert summary["errors"] == 1
+    assert summary["items_per_sec"] == 50.0
+    assert summary["bytes_per_sec"] == 500.0
+    assert summary["latency"]["p50"] == 0.05
+    assert summary["latency"]["p95"] == 0.095
+    assert summary["latency"]["p99"] == 0.099
+    assert summary["latency"]["max"] == 0.1
+
+
+def test_stage_metrics_reservoir():
+    """
+    Tests the bounding of the latency samples kept by a stage
+    """
+
+    stage = StageMetrics("walk", reservoir_size=10)
+
+    for millis in range(1000):
+        stage.observe(millis / 1000)
+
+    assert stage.count == 1000
+    assert len(stage.latencies) == 10
+    assert stage.summary(elapsed=1.0)["latency"]["max"] == 0.999
+
+
+def test_recorder_timed_iter():
+    """
+    Tests the recording of the time spent producing the items of an iterable
+    """
+
+    metrics = MetricsRecorder()
+    items = list(metrics.timed_iter("walk", ["a", "bb", "ccc"], size=len))
+
+    assert items == ["a", "bb", "ccc"]
+    assert metrics.stage("walk").count == 3
+    assert metrics.stage("walk").bytes == 6
+
+
+def test_recorder_reports(tmp_path, caplog):
+    """
+    Tests the logging and dumping of the recorded metrics
+    """
+
+    metrics = MetricsRecorder()
+    metrics.observe("api", 0.2)
+    metrics.fail("api")
+
+    with caplog.at_level(logging.INFO):
+        metrics.report()
+
+    line = caplog.records[-1].getMessage()
+    assert json.loads(line.removeprefix("Metrics: "))["stage"] == "api"
+
+    summary_path = tmp_path / "metrics.json"
+    metrics.dump(summary_path)
+
+    with open(summary_path) as file:
+        summary = json.load(file)
+
+    assert summary["stages"]["api"]["count"] == 1
+    assert summary["stages"]["api"]["errors"] == 1
+
+
+def test_null_recorder():
+    """
+    Tests the disabled recorder discards every measure
+    """
+
+    items = range(3)
+
+    NULL_METRICS.observe("api", 0.2)
+    NULL_METRICS.fail("api")
+
+    assert not NULL_METRICS.enabled
+    assert NULL_METRICS.timed_iter("walk", items) is items
+    assert NULL_METRICS.summary()["stages"] == {}
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+
+from typing import List
+
+from src.job.metrics import MetricsRecorder
+from src.job.metrics import PROBE_KIND_COUNTER
+from src.job.openmetrics import format_openmetrics
+from src.job.openmetrics import read_resident_memory
+from src.job.openmetrics import write_openmetrics
+
+
+def assert_typed_samples(lines: List[str]) -> None:
+    """
+    Asserts every sample belongs to a declared family, as grouped by the Prometheus text parser.
+    Only the summary families own samples with a different name ('_sum' and '_count' suffixes)
+    :param lines: text exposition lines
+    """
+
+    families = {}
+
+    for line in lines:
+        if line.startswith("# TYPE "):
+            _, _, family, kind = line.split(" ")
+            families[family] = kind
+            continue
+        if line.startswith("#"):
+            continue
+
+        name = re.match(r"[a-zA-Z_:][a-zA-Z0-9_:]*", line).group()  # type: ignore
+        summary_name = re.sub(r"_(sum|count)$", "", name)
+
+        assert name in families or families.get(summary_name) == "summary", line
+
+
+def test_openmetrics_stages():
+    """
+    Tests the formatting of the stage metrics with the Prometheus text syntax
+    """
+
+    metrics = MetricsRecorder()
+    metrics.observe("extract", 0.5, size=100)
+    metrics.observe("extract", 1.5, size=300)
+    metrics.fail("extract")
+
+    lines = format_openmetrics(metrics).splitlines()
+
+    assert "# TYPE dialect_map_stage_items_total counter" in lines
+    assert 'dialect_map_stage_items_total{stage="extract"} 2' in lines
+    assert 'dialect_map_stage_bytes_total{stage="extract"} 400' in lines
+    assert 'dialect_map_stage_errors_total{stage="extract"} 1' in lines
+    assert 'dialect_map_stage_latency_seconds{stage="extract",quantile="0.5"} 0.5' in lines
+    assert 'dialect_map_stage_latency_seconds_sum{stage="extract"} 2.0' in lines
+    assert 'dialect_map_stage_latency_seconds_count{stage="extract"} 2' in lines
+    assert_typed_samples(lines)
+
+
+def test_openmetrics_probes():
+    """
+    Tests the formatting of the probe values with the Prometheus text syntax
+    """
+
+    metrics = MetricsRecorder()
+    metrics.register("queue_depth", "Queued items", lambda: 3, labels={"queue": "fetch"})
+    metrics.register("queue_depth", "Queued items", lambda: 5, labels={"queue": "plan"})
+    metrics.register("cache_hits", "Cache hits", lambda: 7, kind=PROBE_KIND_COUNTER)
+
+    lines = format_openmetrics(metrics).splitlines()
+
+    assert "# TYPE dialect_map_queue_depth gauge" in lines
+    assert 'dialect_map_queue_depth{queue="fetch"} 3.0' in lines
+    assert 'dialect_map_queue_depth{queue="plan"} 5.0' in lines
+    assert "# TYPE dialect_map_cache_hits_total counter" in lines
+    assert "dialect_map_cache_hits_total 7.0" in lines
+    assert_typed_samples(lines)
+
+
+def test_openmetrics_file(tmp_path):
+    """
+    Tests the atomic replacement of the Prometheus text file
+    """
+
+    metrics = MetricsRecorder()
+    metrics.register("process_resident_memory_bytes", "RSS", read_resident_memory)
+
+    file_path = tmp_path / "job.prom"
+    write_openmetrics(metrics, file_path)
+    write_openmetrics(metrics, file_path)
+
+    assert os.listdir(tmp_path) == ["job.prom"]
+    assert file_path.read_text().startswith("# TYPE dialect_map_stage_items_total counter\n")
+    assert read_resident_memory() > 0
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from datetime import timezone
+
+from src.job.models import ArxivMetadata
+from src.job.models import ArxivMetadataAuthor
+from src.job.models import ArxivMetadataCategory
+from src.job.models import get_metadata_serializer
+
+
+def build_metadata() -> ArxivMetadata:
+    """
+    Builds a sample ArXiv metadata object
+    :return: ArXiv metadata object
+    """
+
+    return ArxivMetadata(
+        paper_id="0704.0001",
+        paper_rev=2,
+        paper_doi="10.1103/PhysRevD.76.013009",
+        paper_title="Sample title",
+        paper_description="Sample description",
+        paper_categories=(ArxivMetadataCategory("hep-ph"), ArxivMetadataCategory("hep-th")),
+        paper_authors=(ArxivMetadataAuthor("Author A"), ArxivMetadataAuthor("Author B")),
+        paper_links=(),
+        paper_created_at=datetime(2007, 4, 2, 19, 18, 42, tzinfo=timezone.utc),
+        paper_updated_at=datetime(2007, 7, 24, 20, 10, 27, tzinfo=timezone.utc),
+    )
+
+
+def test_serializer_paper_metadata():
+    """
+    Tests the correct building of PaperMetadata records
+    """
+
+    record = build_metadata().paper_metadata
+
+    assert record["paper"] == {
+        "arxiv_id": "0704.0001",
+        "arxiv_rev": 2,
+        "title": "Sample title",
+        "doi_id": "10.1103/PhysRevD.76.013009",
+        "revision_date": "2007-07-24",
+        "submission_date": "2007-04-02",
+        "created_at": "2007-04-02T19:18:42+00:00",
+        "updated_at": "2007-07-24T20:10:27+00:00",
+    }
+    assert record["authors"] == [
+        {
+            "arxiv_id": "0704.0001",
+            "arxiv_rev": 2,
+            "author_name": name,
+            "created_at": "2007-04-02T19:18:42+00:00",
+        }
+        for name in ("Author A", "Author B")
+    ]
+    assert record["memberships"] == [
+        {
+            "arxiv_id": "0704.0001",
+            "arxiv_rev": 2,
+            "category_id": name,
+            "created_at": "2007-04-02T19:18:42+00:00",
+        }
+        for name in ("hep-ph", "hep-th")
+    ]
+
+
+def test_serializer_process_instance():
+    """
+    Tests the reuse of a single serializer instance within the process
+    """
+
+    assert get_metadata_serializer() is get_metadata_serializer()
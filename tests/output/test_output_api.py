@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import logging
+
+import pytest
+
+from src.job.output import DialectMapOperator
+
+
+class StubSchema:
+    """Record schema stub performing identity validations"""
+
+    def load(self, data: dict) -> dict:
+        return data
+
+    def dump(self, data: dict) -> dict:
+        return data
+
+
+class StubRoute:
+    """API route stub pointing to a fixed path"""
+
+    api_path = "/paper/metadata"
+    schema = StubSchema
+
+
+async def send_records(operator: DialectMapOperator, count: int) -> None:
+    """
+    Sends a number of sample records through the provided operator
+    :param operator: Dialect map API operator
+    :param count: number of records to send
+    """
+
+    async with operator:
+        for i in range(count):
+            await operator.create_record(StubRoute, {"id": i})  # type: ignore
+
+
+def test_api_operator_single_requests(api_server):
+    """
+    Tests the one request per record behaviour of the DialectMapOperator class
+    """
+
+    server = api_server
+    operator = DialectMapOperator(server)  # type: ignore
+
+    asyncio.run(send_records(operator, 8))
+    operator.close()
+
+    assert len(server.requests) == 8
+    assert server.requests[0] == ("/paper/metadata", {"id": 0})
+
+
+def test_api_operator_bulk_requests(bulk_api_server):
+    """
+    Tests the request count reduction of the DialectMapOperator class bulk mode
+    """
+
+    server = bulk_api_server
+    operator = DialectMapOperator(server, bulk_size=3)  # type: ignore
+
+    asyncio.run(send_records(operator, 8))
+    operator.close()
+
+    assert len(server.requests) == 3
+    assert [len(records) for _, records in server.requests] == [3, 3, 2]
+    assert all(path == "/paper/metadata/bulk" for path, _ in server.requests)
+
+
+def test_api_operator_bulk_bytes_limit(bulk_api_server):
+    """
+    Tests the size-based flushing of the DialectMapOperator class bulk mode
+    """
+
+    server = bulk_api_server
+    operator = DialectMapOperator(server, bulk_size=100, bulk_bytes=15)  # type: ignore
+
+    asyncio.run(send_records(operator, 4))
+    operator.close()
+
+    assert [len(records) for _, records in server.requests] == [2, 2]
+
+
+def test_api_operator_bulk_latency_limit(bulk_api_server):
+    """
+    Tests the time-based flushing of the DialectMapOperator class bulk mode
+    """
+
+    server = bulk_api_server
+    operator = DialectMapOperator(server, bulk_size=100, bulk_latency=0.01)  # type: ignore
+
+    async def send_and_wait():
+        await operator.create_record(StubRoute, {"id": 0})  # type: ignore
+        await asyncio.sleep(0.1)
+
+    asyncio.run(send_and_wait())
+    operator.close()
+
+    assert server.requests == [("/paper/metadata/bulk", [{"id": 0}])]
+
+
+def test_api_operator_bulk_latency_error(bulk_api_server):
+    """
+    Tests the raising of the errors of the DialectMapOperator class time-based bulk flushes
+    """
+
+    server = bulk_api_server
+    server.failure = ConnectionError("Bulk request failed")
+    operator = DialectMapOperator(server, bulk_size=100, bulk_latency=0.01)  # type: ignore
+
+    async def send_wait_and_flush():
+        await operator.create_record(StubRoute, {"id": 0})  # type: ignore
+        await asyncio.sleep(0.1)
+
+        assert len(operator.bulk_flushes) == 0
+        await operator.flush()
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(send_wait_and_flush())
+
+    operator.close()
+
+    assert server.requests == [("/paper/metadata/bulk", [{"id": 0}])]
+    assert operator.bulk_errors == []
+
+
+def test_api_operator_bulk_handler_required(api_server):
+    """
+    Tests the rejection of the DialectMapOperator class bulk mode without a bulk API handler
+    """
+
+    assert pytest.raises(ValueError, DialectMapOperator, api_server, bulk_size=3)
+
+
+def test_api_operator_bulk_discard(caplog, bulk_api_server):
+    """
+    Tests the logged dropping of the DialectMapOperator class buffered records on failures
+    """
+
+    server = bulk_api_server
+    operator = DialectMapOperator(server, bulk_size=100)  # type: ignore
+
+    async def send_and_fail():
+        async with operator:
+            await operator.create_record(StubRoute, {"id": 0})  # type: ignore
+            raise RuntimeError("Metadata source unavailable")
+
+    with caplog.at_level(logging.ERROR), pytest.raises(RuntimeError):
+        asyncio.run(send_and_fail())
+
+    operator.close()
+
+    assert server.requests == []
+    assert operator.bulk_buffers == {}
+    assert "Dropped 1 buffered records of /paper/metadata" in caplog.text
+
+
+def test_api_operator_trusted_records(api_server):
+    """
+    Tests the validation skipping of trusted records, and the schema reuse otherwise
+    """
+
+    class CountingSchema(StubSchema):
+        loads = 0
+
+        def load(self, data: dict) -> dict:
+            CountingSchema.loads += 1
+            return data
+
+    class CountingRoute(StubRoute):
+        schema = CountingSchema
+
+    server = api_server
+    operator = DialectMapOperator(server)  # type: ignore
+
+    async def send_both():
+        await operator.create_record(CountingRoute, {"id": 0})  # type: ignore
+        await operator.create_record(CountingRoute, {"id": 1})  # type: ignore
+        await operator.create_record(CountingRoute, {"id": 2}, trusted=True)  # type: ignore
+
+    asyncio.run(send_both())
+    operator.close()
+
+    assert len(server.requests) == 3
+    assert CountingSchema.loads == 2
+    assert len(operator.schemas) == 1
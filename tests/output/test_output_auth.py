@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+
+from src.job.output import NoAuthenticator
+
+
+def test_no_authenticator_token():
+    """
+    Tests the static, never expiring token of the NoAuthenticator class
+    """
+
+    authenticator = NoAuthenticator("static")
+
+    assert authenticator.check_expired() is False
+    assert authenticator.get_token() == "static"
+    assert authenticator.refresh_token() == "static"
+    assert NoAuthenticator().get_token() == ""
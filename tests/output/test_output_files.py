@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from typing import Generator
+from typing import Iterable
+
+import pytest
+
+from dialect_map_io import TextFileHandler
+
+from src.job.handlers import StreamingTextFileHandler
+from src.job.output import LocalFileOperator
+
+
+def test_file_operator_write_chunks(tmp_path: Path):
+    """
+    Tests the incremental writing of text chunks by the LocalFileOperator class
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    operator = LocalFileOperator(str(tmp_path / "A"), StreamingTextFileHandler())
+    operator.write_chunks("file.txt", iter(["first ", "second ", "third"]))
+
+    assert (tmp_path / "A" / "file.txt").read_text() == "first second third"
+
+    operator.write_chunks("file.txt", iter(["other"]))
+    assert (tmp_path / "A" / "file.txt").read_text() == "first second third"
+
+    operator.write_chunks("file.txt", iter(["other"]), overwrite=True)
+    assert (tmp_path / "A" / "file.txt").read_text() == "other"
+
+
+def test_file_operator_write_chunks_custom_handler(tmp_path: Path):
+    """
+    Tests the chunk by chunk write through streaming handler subclasses,
+    and the single write through any other handler by the LocalFileOperator class
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    class UpperTextHandler(TextFileHandler):
+        def write_file(self, file_path: str, content: str) -> None:
+            Path(file_path).write_text(content.upper())
+
+    operator = LocalFileOperator(str(tmp_path), UpperTextHandler())
+    operator.write_chunks("file.txt", iter(["first ", "second"]))
+
+    assert (tmp_path / "file.txt").read_text() == "FIRST SECOND"
+    assert [path.name for path in tmp_path.iterdir()] == ["file.txt"]
+
+    class CountingTextHandler(StreamingTextFileHandler):
+        chunks = 0
+
+        def write_file(self, file_path: str, content: str) -> None:
+            raise AssertionError("Chunks must not be joined")
+
+        def write_chunks(self, file_path: str, chunks: Iterable[str]) -> None:
+            chunks = list(chunks)
+            self.chunks += len(chunks)
+            super().write_chunks(file_path, chunks)
+
+    handler = CountingTextHandler()
+    operator = LocalFileOperator(str(tmp_path), handler)
+    operator.write_chunks("file.txt", iter(["first ", "second"]), overwrite=True)
+
+    assert (tmp_path / "file.txt").read_text() == "first second"
+    assert handler.chunks == 2
+
+
+def test_file_operator_write_chunks_error(tmp_path: Path):
+    """
+    Tests the absence of partial files after a failed write by the LocalFileOperator class
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    def failing_chunks() -> Generator:
+        yield "first "
+        raise RuntimeError("Malformed page")
+
+    operator = LocalFileOperator(str(tmp_path), StreamingTextFileHandler())
+
+    assert pytest.raises(RuntimeError, operator.write_chunks, "file.txt", failing_chunks())
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+
+import pytest
+
+from src.job.output import FileManifest
+from src.job.output import ManifestRecord
+
+
+@pytest.fixture(scope="function")
+def manifest(tmp_path: Path) -> FileManifest:
+    """
+    Fixture to make a temporal file manifest available during the duration of a test
+    :param tmp_path: Pytest provided fixture to use as base path
+    :return: file manifest object
+    """
+
+    return FileManifest(tmp_path / "manifest.db")
+
+
+def test_manifest_add_record(manifest: FileManifest):
+    """
+    Tests the correct storage of records by the FileManifest class
+    :param manifest: file manifest object
+    """
+
+    record = ManifestRecord("A/file.pdf", 100, 123456789)
+    manifest.add(record)
+
+    assert len(manifest) == 1
+    assert manifest.get("A/file.pdf") == record
+    assert manifest.get("B/file.pdf") is None
+
+
+def test_manifest_is_converted(manifest: FileManifest):
+    """
+    Tests the correct detection of unchanged files by the FileManifest class
+    :param manifest: file manifest object
+    """
+
+    manifest.add(ManifestRecord("A/file.pdf", 100, 123456789))
+
+    assert manifest.is_converted("A/file.pdf", 100, 123456789) is True
+    assert manifest.is_converted("A/file.pdf", 101, 123456789) is False
+    assert manifest.is_converted("A/file.pdf", 100, 987654321) is False
+    assert manifest.is_converted("B/file.pdf", 100, 123456789) is False
+
+
+def test_manifest_quarantine(manifest: FileManifest):
+    """
+    Tests the detection of unchanged quarantined files by the FileManifest class
+    :param manifest: file manifest object
+    """
+
+    manifest.quarantine("A/file.pdf", 100, 123456789, reason="WorkerTimeoutError")
+
+    assert manifest.is_quarantined("A/file.pdf", 100, 123456789) is True
+    assert manifest.is_quarantined("A/file.pdf", 101, 123456789) is False
+    assert manifest.is_quarantined("A/file.pdf", 100, 987654321) is False
+    assert manifest.is_quarantined("B/file.pdf", 100, 123456789) is False
+    assert manifest.is_converted("A/file.pdf", 100, 123456789) is False
+    assert len(manifest) == 0
+
+
+def test_manifest_quarantine_replace(manifest: FileManifest):
+    """
+    Tests the replacement of the quarantine records of changed files by the FileManifest class
+    :param manifest: file manifest object
+    """
+
+    manifest.quarantine("A/file.pdf", 100, 123456789, reason="WorkerTimeoutError")
+    manifest.quarantine("A/file.pdf", 200, 987654321, reason="WorkerCrashedError")
+
+    assert manifest.is_quarantined("A/file.pdf", 100, 123456789) is False
+    assert manifest.is_quarantined("A/file.pdf", 200, 987654321) is True
+
+
+def test_manifest_quarantine_clear(manifest: FileManifest):
+    """
+    Tests the clearing of quarantine records once files are converted by the FileManifest class
+    :param manifest: file manifest object
+    """
+
+    manifest.quarantine("A/file.pdf", 100, 123456789, reason="WorkerTimeoutError")
+    manifest.quarantine("B/file.pdf", 100, 123456789, reason="WorkerTimeoutError")
+    manifest.add(ManifestRecord("A/file.pdf", 100, 123456789))
+
+    assert manifest.is_quarantined("A/file.pdf", 100, 123456789) is False
+    assert manifest.is_quarantined("B/file.pdf", 100, 123456789) is True
+    assert manifest.is_converted("A/file.pdf", 100, 123456789) is True
+
+
+def test_manifest_persistence(tmp_path: Path):
+    """
+    Tests the persistence of records across FileManifest instances
+    :param tmp_path: Pytest provided fixture to use as base path
+    """
+
+    db_path = tmp_path / "manifest.db"
+    record = ManifestRecord("A/file.pdf", 100, 123456789)
+
+    with FileManifest(db_path) as manifest:
+        manifest.add(record)
+
+    with FileManifest(db_path) as manifest:
+        assert manifest.get("A/file.pdf") == record
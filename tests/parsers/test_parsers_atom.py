@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from src.job.parsers import AtomMetadataParser
+from src.job.parsers import FeedMetadataParser
+
+from ..__paths import FEED_FOLDER
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["arxiv_feed.xml", "arxiv_feed_multi.xml", "arxiv_error.xml"],
+)
+def test_atom_feedparser_equivalence(file_name: str):
+    """
+    Tests the identical output of the Atom parser and the feedparser based parser
+    :param file_name: name of the sample feed file
+    """
+
+    feed_file = FEED_FOLDER.joinpath(file_name)
+    feed_text = open(feed_file, "r").read()
+
+    atom_objs = AtomMetadataParser().parse_body(feed_text)
+    feed_objs = FeedMetadataParser().parse_body(feed_text)
+
+    assert atom_objs == feed_objs
+
+
+def test_atom_bytes_parse():
+    """
+    Tests the parsing of raw feed bytes by the Atom parser
+    """
+
+    feed_file = FEED_FOLDER.joinpath("arxiv_feed_multi.xml")
+    feed_bytes = feed_file.read_bytes()
+
+    groups = AtomMetadataParser().parse_grouped(feed_bytes)
+
+    assert list(groups.keys()) == ["hep-ex/0307015", "0704.0002"]
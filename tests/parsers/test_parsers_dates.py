@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from src.job.parsers.dates import parse_iso_date
+from src.job.parsers.dates import parse_rfc2822_date
+
+
+def test_iso_date_parse():
+    """
+    Tests the correct UTC normalization of ISO-8601 dates
+    """
+
+    expected = datetime(2007, 4, 2, 19, 18, 42, tzinfo=timezone.utc)
+
+    assert parse_iso_date("2007-04-02T19:18:42Z") == expected
+    assert parse_iso_date("2007-04-02T21:18:42+02:00") == expected
+    assert parse_iso_date("2007-04-02T19:18:42Z").tzinfo == timezone.utc
+
+
+def test_rfc2822_date_parse():
+    """
+    Tests the correct UTC normalization of RFC-2822 dates
+    """
+
+    expected = datetime(2007, 4, 2, 19, 18, 42, tzinfo=timezone.utc)
+
+    assert parse_rfc2822_date("Mon, 2 Apr 2007 19:18:42 GMT") == expected
+    assert parse_rfc2822_date("Mon, 02 Apr 2007 19:18:42 GMT") == expected
+    assert parse_rfc2822_date("Mon, 2 Apr 2007 19:18:42 UTC") == expected
+    assert parse_rfc2822_date("Mon, 2 Apr 2007 19:18:42 GMT").tzinfo == timezone.utc
+
+
+def test_rfc2822_date_invalid():
+    """
+    Tests the rejection of malformed RFC-2822 dates
+    """
+
+    with pytest.raises(ValueError):
+        parse_rfc2822_date("Mon, 2 Foo 2007 19:18:42 GMT")
+
+
+def test_dates_memoized():
+    """
+    Tests the reuse of previously parsed dates
+    """
+
+    parse_rfc2822_date.cache_clear()
+    parse_rfc2822_date("Mon, 2 Apr 2007 19:18:42 GMT")
+    parse_rfc2822_date("Mon, 2 Apr 2007 19:18:42 GMT")
+
+    assert parse_rfc2822_date.cache_info().hits == 1
@@ -71,9 +71,7 @@ def test_feed_entries_authors_parse(feed_entry: ArxivMetadata):
     :param feed_entry: feed entry object
     """
 
-    assert feed_entry.paper_authors == [
-        ArxivMetadataAuthor("H1 Collaboration"),
-    ]
+    assert feed_entry.paper_authors == (ArxivMetadataAuthor("H1 Collaboration"),)
 
 
 def test_feed_entries_categories_parse(feed_entry: ArxivMetadata):
@@ -82,9 +80,7 @@ def test_feed_entries_categories_parse(feed_entry: ArxivMetadata):
     :param feed_entry: feed entry object
     """
 
-    assert feed_entry.paper_categories == [
-        ArxivMetadataCategory("hep-ex"),
-    ]
+    assert feed_entry.paper_categories == (ArxivMetadataCategory("hep-ex"),)
 
 
 def test_feed_entries_links_parse(feed_entry: ArxivMetadata):
@@ -93,8 +89,43 @@ def test_feed_entries_links_parse(feed_entry: ArxivMetadata):
     :param feed_entry: feed entry object
     """
 
-    assert feed_entry.paper_links == [
+    assert feed_entry.paper_links == (
         ArxivMetadataLink("http://dx.doi.org/10.1140/epjc/s2003-01326-x", "text/html"),
         ArxivMetadataLink("http://arxiv.org/abs/hep-ex/0307015v1", "text/html"),
         ArxivMetadataLink("http://arxiv.org/pdf/hep-ex/0307015v1", "application/pdf"),
-    ]
+    )
+
+
+def test_feed_entries_grouped_parse():
+    """
+    Tests the correct demultiplexing of a multi-entry Arxiv feed by paper ID
+    """
+
+    feed_parser = FeedMetadataParser()
+
+    feed_file = FEED_FOLDER.joinpath("arxiv_feed_multi.xml")
+    feed_text = open(feed_file, "r").read()
+    feed_objs = feed_parser.parse_grouped(feed_text)
+
+    assert list(feed_objs.keys()) == ["hep-ex/0307015", "0704.0002"]
+
+    assert [entry.paper_rev for entry in feed_objs["hep-ex/0307015"]] == [1]
+    assert [entry.paper_rev for entry in feed_objs["0704.0002"]] == [2]
+    assert feed_objs["0704.0002"][0].paper_doi == ""
+    assert feed_objs["0704.0002"][0].paper_categories == (
+        ArxivMetadataCategory("math.CO"),
+        ArxivMetadataCategory("cs.CG"),
+    )
+
+
+def test_feed_error_entries_skip():
+    """
+    Tests the skipping of error entries within an Arxiv feed
+    """
+
+    feed_parser = FeedMetadataParser()
+
+    feed_file = FEED_FOLDER.joinpath("arxiv_error.xml")
+    feed_text = open(feed_file, "r").read()
+
+    assert feed_parser.parse_body(feed_text) == []
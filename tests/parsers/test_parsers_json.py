@@ -168,21 +168,19 @@ def test_json_authors_parse(
     :param json_entry_3: metadata object
     """
 
-    assert json_entry_1.paper_authors == [
+    assert json_entry_1.paper_authors == (
         ArxivMetadataAuthor("Bal\u00e1zs C."),
         ArxivMetadataAuthor("Berger E. L."),
         ArxivMetadataAuthor("Nadolsky P. M."),
         ArxivMetadataAuthor("Yuan C. -P."),
-    ]
+    )
 
-    assert json_entry_2.paper_authors == [
+    assert json_entry_2.paper_authors == (
         ArxivMetadataAuthor("Streinu Ileana"),
         ArxivMetadataAuthor("Theran Louis"),
-    ]
+    )
 
-    assert json_entry_3.paper_authors == [
-        ArxivMetadataAuthor("Hasegawa Yasumasa"),
-    ]
+    assert json_entry_3.paper_authors == (ArxivMetadataAuthor("Hasegawa Yasumasa"),)
 
 
 def test_json_categories_parse(
@@ -197,16 +195,47 @@ def test_json_categories_parse(
     :param json_entry_3: metadata object
     """
 
-    assert json_entry_1.paper_categories == [
-        ArxivMetadataCategory("hep-ph"),
-    ]
+    assert json_entry_1.paper_categories == (ArxivMetadataCategory("hep-ph"),)
 
-    assert json_entry_2.paper_categories == [
+    assert json_entry_2.paper_categories == (
         ArxivMetadataCategory("math.CO"),
         ArxivMetadataCategory("cs.CG"),
-    ]
+    )
 
-    assert json_entry_3.paper_categories == [
+    assert json_entry_3.paper_categories == (
         ArxivMetadataCategory("supr-con"),
         ArxivMetadataCategory("cond-mat.supr-con"),
+    )
+
+
+def test_json_many_parse():
+    """
+    Tests the equivalence of the Arxiv json bulk and per-entry parsing
+    """
+
+    json_parser = JSONMetadataParser()
+    json_dicts = [
+        json.loads(JSON_FOLDER.joinpath(file_name).read_text())
+        for file_name in ("entry_1.json", "entry_2.json", "entry_3.json")
     ]
+
+    bulk_objs = json_parser.parse_many(json_dicts)
+    single_objs = [obj for json_dict in json_dicts for obj in json_parser.parse_body(json_dict)]
+
+    assert bulk_objs == single_objs
+    assert json_parser.parse_many([]) == []
+
+
+def test_json_revisions_shared_fields():
+    """
+    Tests the sharing of the immutable paper fields across the Arxiv json revisions
+    """
+
+    json_dict = json.loads(JSON_FOLDER.joinpath("entry_2.json").read_text())
+    revision_1, revision_2 = JSONMetadataParser().parse_body(json_dict)
+
+    assert revision_1.paper_authors is revision_2.paper_authors
+    assert revision_1.paper_categories is revision_2.paper_categories
+    assert isinstance(revision_1.paper_authors, tuple)
+    assert isinstance(revision_1.paper_categories, tuple)
+    assert isinstance(revision_1.paper_links, tuple)
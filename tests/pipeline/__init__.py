@@ -0,0 +1 @@
+# This file is necessary to be able to allow imports from src
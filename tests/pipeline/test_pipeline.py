@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pytest
+
+from src.job.metrics import MetricsRecorder
+from src.job.pipeline import Pipeline
+from src.job.pipeline import Stage
+from src.job.pipeline import STAGE_KIND_PROCESS
+
+
+def square(number: int) -> int:
+    return number * number
+
+
+def fail_on_three(number: int) -> int:
+    if number == 3:
+        raise ValueError("Malformed input")
+    return number
+
+
+def test_pipeline_thread_stages():
+    """
+    Tests the correct chaining of several multi-threaded stages
+    """
+
+    pipeline = Pipeline(
+        [
+            Stage(name="square", func=square, workers=3),
+            Stage(name="negate", func=lambda number: -number, workers=2),
+        ]
+    )
+
+    with pipeline.start(range(20)):
+        results = list(pipeline)
+
+    assert sorted(results) == sorted(-number * number for number in range(20))
+    assert pipeline.counts == {"square": 20, "negate": 20}
+
+
+def test_pipeline_process_stage():
+    """
+    Tests the correct outcome of a stage run by worker processes
+    """
+
+    pipeline = Pipeline([Stage(name="square", func=square, workers=2, kind=STAGE_KIND_PROCESS)])
+    results = []
+    pipeline.run(range(10), results.append)
+
+    assert sorted(results) == [number * number for number in range(10)]
+
+
+def test_pipeline_dropped_items():
+    """
+    Tests the dropping of items whose stage function returns None
+    """
+
+    pipeline = Pipeline([Stage(name="odd", func=lambda number: number if number % 2 else None)])
+
+    with pipeline.start(range(10)):
+        assert sorted(pipeline) == [1, 3, 5, 7, 9]
+
+
+def test_pipeline_error_handler():
+    """
+    Tests the handling of stage errors by the stage error function
+    """
+
+    failures = []
+    pipeline = Pipeline(
+        [
+            Stage(
+                name="check",
+                func=fail_on_three,
+                on_error=lambda number, error: failures.append((number, error)),
+            )
+        ]
+    )
+
+    with pipeline.start(range(5)):
+        assert sorted(pipeline) == [0, 1, 2, 4]
+
+    assert len(failures) == 1
+    assert failures[0][0] == 3
+    assert isinstance(failures[0][1], ValueError)
+
+
+def test_pipeline_error_propagation():
+    """
+    Tests the propagation of unhandled stage errors to the consumer
+    """
+
+    pipeline = Pipeline(
+        [
+            Stage(name="check", func=fail_on_three, workers=2),
+            Stage(name="square", func=square),
+        ],
+        buffer_size=1,
+    )
+
+    with pytest.raises(ValueError):
+        pipeline.run(range(100), lambda _: time.sleep(0.01))
+
+    assert not any(thread.is_alive() for thread in pipeline.threads)
+
+
+def test_pipeline_back_pressure():
+    """
+    Tests the bounding of the items read ahead of a slow consumer
+    """
+
+    produced = []
+
+    def source():
+        for number in range(100):
+            produced.append(number)
+            yield number
+
+    pipeline = Pipeline([Stage(name="identity", func=lambda number: number)], buffer_size=2)
+
+    with pipeline.start(source()):
+        next(pipeline)
+        time.sleep(0.5)
+
+        # Items held by: both queues, the stage worker and the source thread
+        assert len(produced) <= 2 * 2 + 3
+
+
+def test_pipeline_invalid_stages():
+    """
+    Tests the validation of the pipeline stages
+    """
+
+    with pytest.raises(ValueError):
+        Pipeline([])
+    with pytest.raises(ValueError):
+        Pipeline([Stage(name="square", func=square, workers=0)])
+    with pytest.raises(ValueError):
+        Pipeline([Stage(name="square", func=square, kind="fiber")])
+
+
+def test_pipeline_metrics():
+    """
+    Tests the recording of the stage latencies, sizes and errors
+    """
+
+    metrics = MetricsRecorder()
+    pipeline = Pipeline(
+        [
+            Stage(
+                name="check",
+                func=fail_on_three,
+                on_error=lambda number, error: None,
+                size=lambda number: number,
+            ),
+            Stage(name="square", func=square, workers=2, kind=STAGE_KIND_PROCESS),
+        ],
+        metrics=metrics,
+    )
+
+    with pipeline.start(range(5)):
+        assert sorted(pipeline) == [0, 1, 4, 16]
+
+    stages = metrics.summary()["stages"]
+
+    assert stages["check"]["count"] == 4
+    assert stages["check"]["bytes"] == 0 + 1 + 2 + 4
+    assert stages["check"]["errors"] == 1
+    assert stages["square"]["count"] == 4
+    assert stages["square"]["latency"]["max"] > 0
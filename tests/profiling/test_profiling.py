@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+from src.job.profiling import PROFILE_PATH_ENV
+from src.job.profiling import SamplingProfiler
+from src.job.profiling import init_process_profiler
+
+
+def spin(seconds: float) -> int:
+    deadline = time.perf_counter() + seconds
+    loops = 0
+
+    while time.perf_counter() < deadline:
+        loops += 1
+
+    return loops
+
+
+def test_profiler_thread_stacks(tmp_path):
+    """
+    Tests the sampling of the stacks of a non-main thread
+    """
+
+    file_path = tmp_path / "main.collapsed"
+    profiler = SamplingProfiler(file_path, interval=0.001)
+    profiler.start()
+
+    worker = threading.Thread(target=spin, args=(0.3,), name="spinner")
+    worker.start()
+    worker.join()
+
+    profiler.stop()
+
+    lines = file_path.read_text().splitlines()
+    spinner_lines = [line for line in lines if line.startswith("spinner;")]
+
+    assert profiler.samples > 0
+    assert len(spinner_lines) > 0
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("spin (test_profiling.py" in line for line in spinner_lines)
+
+
+def test_profiler_worker_processes(tmp_path, monkeypatch):
+    """
+    Tests the writing of a profile per worker process, once they exit
+    """
+
+    monkeypatch.setenv(PROFILE_PATH_ENV, str(tmp_path))
+
+    with ProcessPoolExecutor(max_workers=2, initializer=init_process_profiler) as executor:
+        loops = list(executor.map(spin, [0.1] * 4))
+
+    profiles = list(tmp_path.glob("worker-*.collapsed"))
+
+    assert all(count > 0 for count in loops)
+    assert 1 <= len(profiles) <= 2
+    assert all(profile.stat().st_size > 0 for profile in profiles)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+
+import pytest
+
+
+class StubRecord(NamedTuple):
+    """Paper metadata record stub"""
+
+    paper_id: str
+    revision: int
+
+    @property
+    def paper_metadata(self) -> dict:
+        return {"id": self.paper_id, "revision": self.revision}
+
+
+class StubMetadataSource:
+    """Metadata source stub returning two revisions per paper"""
+
+    def get_metadata_many(self, paper_ids: List[str]) -> Dict[str, List[StubRecord]]:
+        return {
+            paper_id: [StubRecord(paper_id, 1), StubRecord(paper_id, 2)] for paper_id in paper_ids
+        }
+
+
+@pytest.fixture
+def metadata_source() -> StubMetadataSource:
+    """
+    Metadata source stub returning two revisions per paper
+    :return: metadata source stub
+    """
+
+    return StubMetadataSource()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from pathlib import Path
+
+import pytest
+
+from src.job.output import DialectMapOperator
+from src.routines import BaseRoutine
+from src.routines import FileRoutine
+from src.routines import SnapshotBackfillRoutine
+
+from ..__paths import JSON_FOLDER
+
+
+def test_base_routine_abstract_methods():
+    """
+    Tests the instantiation failure of routines not implementing every base class method
+    """
+
+    class IncompleteFileRoutine(FileRoutine):
+        def run(self, destination_path: str) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        BaseRoutine()  # type: ignore
+    with pytest.raises(TypeError):
+        IncompleteFileRoutine()  # type: ignore
+
+    assert issubclass(SnapshotBackfillRoutine, BaseRoutine)
+    assert not issubclass(SnapshotBackfillRoutine, FileRoutine)
+
+
+def test_backfill_routine_run(tmp_path: Path, api_server):
+    """
+    Tests the sending of every paper revision within a snapshot by the SnapshotBackfillRoutine
+    """
+
+    snapshot_path = tmp_path / "snapshot.json"
+    revisions = 0
+
+    with open(snapshot_path, "w") as file:
+        for entry_path in sorted(JSON_FOLDER.glob("*.json")):
+            entry = json.loads(entry_path.read_text())
+            file.write(json.dumps(entry) + "\n")
+            revisions += len(entry["versions"])
+
+    server = api_server
+    operator = DialectMapOperator(server)  # type: ignore
+
+    routine = SnapshotBackfillRoutine(str(snapshot_path), operator, chunk_size=100)
+    routine.run()
+    operator.close()
+
+    assert routine.records == revisions
+    assert len(server.records) == revisions
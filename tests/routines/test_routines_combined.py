@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from typing import Generator
+from typing import List
+
+import pytest
+
+from dialect_map_io import PDFFileHandler
+
+from src.job.files import FileEntry
+from src.job.files import FileSystemIterator
+from src.job.input import PDFCorpusSource
+from src.job.output import DialectMapOperator
+from src.routines import CombinedRoutine
+from src.routines import LocalTextRoutine
+from src.routines import MetadataRoutine
+
+from ..__paths import PDF_FOLDER
+
+
+class CountingFileIterator(FileSystemIterator):
+    """File system iterator counting its tree walks"""
+
+    walks = 0
+
+    def iter_entries(self) -> Generator:
+        self.walks += 1
+        yield from super().iter_entries()
+
+
+class FailingMetadataSource:
+    """Metadata source stub failing on every batch"""
+
+    def get_metadata_many(self, paper_ids: List[str]) -> dict:
+        raise RuntimeError("Metadata source unavailable")
+
+
+def build_routine(
+    file_iter: FileSystemIterator,
+    server: object,
+    metadata_source: object,
+    buffer_size: int,
+) -> CombinedRoutine:
+    """
+    Builds a combined routine out of a text routine and a metadata routine
+    :param file_iter: file system iterator
+    :param server: Dialect map API handler stub
+    :param metadata_source: metadata source stub
+    :param buffer_size: maximum entries queued for each routine
+    :return: combined routine
+    """
+
+    metadata_routine = MetadataRoutine(
+        file_iter,
+        DialectMapOperator(server, max_workers=2),  # type: ignore
+        batch_size=4,
+    )
+    metadata_routine.sources.append(metadata_source)
+
+    return CombinedRoutine(
+        file_iter,
+        LocalTextRoutine(file_iter, PDFCorpusSource(PDFFileHandler())),
+        metadata_routine,
+        buffer_size=buffer_size,
+    )
+
+
+def test_combined_routine_single_walk(tmp_path: Path, api_server, build_corpus, metadata_source):
+    """
+    Tests the feeding of both the CombinedRoutine class routines out of a single tree walk
+    """
+
+    corpus_path = build_corpus(papers=6)
+    output_path = tmp_path.joinpath("output")
+
+    file_iter = CountingFileIterator(corpus_path, ".pdf")
+    server = api_server
+
+    routine = build_routine(file_iter, server, metadata_source, buffer_size=2)
+    routine.run(str(output_path))
+
+    assert file_iter.walks == 1
+    assert routine.walked == 6
+    assert routine.consumed == {"text": 6, "metadata": 6}
+    assert len([path for path in output_path.rglob("*") if path.is_file()]) == 6
+    assert len(server.records) == 12
+
+
+def test_combined_routine_failure(tmp_path: Path, api_server):
+    """
+    Tests the stop of the CombinedRoutine class walk and routines when one of them fails
+    """
+
+    pdf_path = PDF_FOLDER.joinpath("sample.pdf")
+    pdf_stat = pdf_path.stat()
+
+    def iter_entries() -> Generator:
+        for index in range(10000):
+            yield FileEntry(
+                path=str(pdf_path),
+                name=f"0704.{index:04}.pdf",
+                rel_dir="0704",
+                size=pdf_stat.st_size,
+                mtime_ns=pdf_stat.st_mtime_ns,
+            )
+
+    file_iter = FileSystemIterator(tmp_path, ".pdf")
+    server = api_server
+
+    routine = build_routine(file_iter, server, FailingMetadataSource(), buffer_size=2)
+
+    # The metadata routine dispatches its records within an asyncio task group
+    with pytest.raises(ExceptionGroup) as error_info:
+        routine.run_entries(iter_entries(), str(tmp_path.joinpath("output")))
+
+    assert [str(error) for error in error_info.value.exceptions] == ["Metadata source unavailable"]
+    assert routine.walked < 10000
+    assert routine.consumed["text"] <= routine.walked
+    assert server.records == []
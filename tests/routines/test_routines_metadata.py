@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+from src.job.files import FileSystemIterator
+from src.job.output import DialectMapOperator
+from src.routines import MetadataRoutine
+
+
+def test_metadata_routine_bounded_dispatch(api_server, build_corpus, metadata_source):
+    """
+    Tests the concurrent dispatch of the MetadataRoutine class records,
+    bounded by the maximum number of concurrent API requests
+    """
+
+    server = api_server
+    server.latency = 0.01
+    operator = DialectMapOperator(server, max_workers=3)  # type: ignore
+
+    routine = MetadataRoutine(
+        FileSystemIterator(build_corpus(papers=10), ".pdf"),
+        operator,
+        batch_size=4,
+    )
+    routine.sources.append(metadata_source)
+    server.routine = routine
+
+    routine.run()
+    operator.close()
+
+    assert len(server.records) == 20
+    assert {record["id"] for record in server.records} == {f"0704.{i:04}" for i in range(10)}
+    assert 1 < server.max_active <= 3
+    assert 1 < server.max_in_flight <= 3
+    assert routine.in_flight == 0
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import re
+import time
+
+from pathlib import Path
+
+from dialect_map_io import PDFFileHandler
+
+from src.job.files import FileSystemIterator
+from src.job.input import PDFCorpusSource
+from src.job.output import FileManifest
+from src.routines import LocalTextRoutine
+
+from ..__paths import PDF_FOLDER
+
+
+class HangingPDFHandler(PDFFileHandler):
+    """PDF file handler hanging on the files named after the 0704.0000 paper"""
+
+    def read_file(self, file_path: str) -> str:
+        if Path(file_path).name == "0704.0000.pdf":
+            time.sleep(30)
+
+        return super().read_file(file_path)
+
+
+def test_text_routine_process_pool(tmp_path, caplog, build_corpus):
+    """
+    Tests the text extraction of the LocalTextRoutine class with several worker processes
+    """
+
+    corpus_path = build_corpus(papers=6)
+    output_path = tmp_path.joinpath("output")
+
+    routine = LocalTextRoutine(
+        FileSystemIterator(corpus_path, ".pdf"),
+        PDFCorpusSource(PDFFileHandler()),
+        workers=2,
+    )
+
+    with caplog.at_level(logging.INFO):
+        routine.run(str(output_path))
+
+    expected_text = PDFCorpusSource(PDFFileHandler()).extract_txt(
+        str(PDF_FOLDER.joinpath("sample.pdf"))
+    )
+    output_files = sorted(path for path in output_path.rglob("*") if path.is_file())
+
+    worker_counts = [int(count) for count in re.findall(r"Worker \d+: (\d+) files", caplog.text)]
+
+    assert len(output_files) == 6
+    assert {path.parent.name for path in output_files} == {"0700", "0701"}
+    assert all(path.read_text() == expected_text for path in output_files)
+    assert 1 <= len(worker_counts) <= 2
+    assert sum(worker_counts) == 6
+    assert "Processed 6 files" in caplog.text
+
+
+def test_text_routine_quarantine(tmp_path: Path, build_corpus):
+    """
+    Tests the quarantine of the LocalTextRoutine class files exceeding the time limit,
+    and their skipping on later runs while unchanged
+    """
+
+    corpus_path = build_corpus(papers=3)
+    output_path = tmp_path.joinpath("output")
+    hanging_path = corpus_path.joinpath("0700", "0704.0000.pdf")
+    hanging_stat = hanging_path.stat()
+
+    with FileManifest(output_path.joinpath(".manifest.db")) as manifest:
+        routine = LocalTextRoutine(
+            FileSystemIterator(corpus_path, ".pdf"),
+            PDFCorpusSource(HangingPDFHandler()),
+            manifest=manifest,
+            timeout=0.5,
+        )
+        routine.run(str(output_path))
+
+        assert [path for path, _ in routine.quarantined] == [str(hanging_path)]
+        assert "WorkerTimeoutError" in routine.quarantined[0][1]
+        assert len(manifest) == 2
+        assert manifest.is_quarantined(
+            "0700/0704.0000.pdf",
+            hanging_stat.st_size,
+            hanging_stat.st_mtime_ns,
+        )
+
+        rerun_routine = LocalTextRoutine(
+            FileSystemIterator(corpus_path, ".pdf"),
+            PDFCorpusSource(HangingPDFHandler()),
+            manifest=manifest,
+            timeout=0.5,
+        )
+
+        start = time.perf_counter()
+        rerun_routine.run(str(output_path))
+
+        assert time.perf_counter() - start < 0.5
+        assert rerun_routine.quarantined == []
+        assert rerun_routine.skipped == 3
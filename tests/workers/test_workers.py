@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+
+import pytest
+
+from src.job.workers import IsolatedWorkerPool
+from src.job.workers import WorkerCrashedError
+from src.job.workers import WorkerTimeoutError
+
+
+def square(number: int) -> int:
+    return number * number
+
+
+def sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def crash() -> None:
+    os._exit(1)
+
+
+def fail() -> None:
+    raise ValueError("Malformed input")
+
+
+def get_pid() -> int:
+    return os.getpid()
+
+
+def test_isolated_pool_results():
+    """
+    Tests the correct outcome of tasks run by the IsolatedWorkerPool class
+    """
+
+    with IsolatedWorkerPool(max_workers=2) as pool:
+        results = list(pool.map(square, range(5)))
+        failure = pool.submit(fail)
+
+        assert results == [0, 1, 4, 9, 16]
+        assert pytest.raises(ValueError, failure.result)
+
+
+def test_isolated_pool_timeout():
+    """
+    Tests the replacement of workers running over the IsolatedWorkerPool time limit
+    """
+
+    with IsolatedWorkerPool(max_workers=1, timeout=0.5) as pool:
+        slow_task = pool.submit(sleep, 10)
+        next_task = pool.submit(square, 3)
+
+        assert pytest.raises(WorkerTimeoutError, slow_task.result)
+        assert next_task.result() == 9
+
+
+def test_isolated_pool_crash():
+    """
+    Tests the replacement of crashed workers by the IsolatedWorkerPool class
+    """
+
+    with IsolatedWorkerPool(max_workers=1) as pool:
+        crash_task = pool.submit(crash)
+        next_task = pool.submit(square, 3)
+
+        assert pytest.raises(WorkerCrashedError, crash_task.result)
+        assert next_task.result() == 9
+
+
+def test_isolated_pool_recycling():
+    """
+    Tests the recycling of workers after a number of tasks by the IsolatedWorkerPool class
+    """
+
+    with IsolatedWorkerPool(max_workers=1, max_tasks=2) as pool:
+        pids = [pool.submit(get_pid).result() for _ in range(4)]
+
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[0] != pids[2]
+
+
+def test_isolated_pool_spawn_error():
+    """
+    Tests the failure of the IsolatedWorkerPool class tasks when no worker can be started
+    """
+
+    # Local functions cannot be pickled to start the worker processes
+    pool = IsolatedWorkerPool(max_workers=2, initializer=lambda: None)
+    tasks = [pool.submit(square, number) for number in range(4)]
+
+    for task in tasks:
+        assert task.exception(timeout=10) is not None
+
+    pool.shutdown(wait=True)
+
+    assert not any(thread.is_alive() for thread in pool.threads)